@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+import sys
 from dataclasses import dataclass, field
-from typing import Any, AsyncIterator, Callable, Awaitable, Protocol
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Callable, Awaitable, Mapping, Protocol
+
+import structlog
 
 from hadron.config.defaults import DEFAULT_MODEL
 
+logger = structlog.stdlib.get_logger(__name__)
+
 
 # Callback type: (tool_name, tool_input, result_snippet) -> None
 OnToolCall = Callable[[str, dict[str, Any], str], Awaitable[None]]
@@ -14,6 +21,15 @@ OnToolCall = Callable[[str, dict[str, Any], str], Awaitable[None]]
 # Rich event callback: (event_type, data_dict) -> None
 OnAgentEvent = Callable[[str, dict[str, Any]], Awaitable[None]]
 
+# Batched event callback: [(event_type, data_dict), ...] -> None
+OnAgentEventBatch = Callable[[list[tuple[str, dict[str, Any]]]], Awaitable[None]]
+
+# Default tool sets, built once and copied into each task.
+DEFAULT_ALLOWED_TOOLS: tuple[str, ...] = (
+    "read_file", "write_file", "delete_file", "list_directory", "run_command",
+)
+DEFAULT_EXPLORE_TOOLS: tuple[str, ...] = ("read_file", "list_directory")
+
 
 @dataclass
 class PhaseConfig:
@@ -26,19 +42,110 @@ class PhaseConfig:
     explore_model: str = ""  # Empty = skip explore phase
     plan_model: str = ""  # Empty = skip plan phase
     explore_max_rounds: int = 20
-    explore_tools: list[str] = field(default_factory=lambda: ["read_file", "list_directory"])
+    explore_tools: list[str] = field(default_factory=lambda: list(DEFAULT_EXPLORE_TOOLS))
+
+
+def _run_in_thread(fn: Callable[..., None]) -> Callable[..., Awaitable[None]]:
+    """Adapt a blocking callback into an awaitable one that runs in a worker thread."""
+
+    async def _call(*args: Any) -> None:
+        await asyncio.to_thread(fn, *args)
+
+    return _call
+
+
+class _EventCoalescer:
+    """Per-event ``OnAgentEvent`` adapter over a batch callback. See ``coalesce_events``."""
+
+    def __init__(self, callback: OnAgentEventBatch, flush_size: int, flush_ms: float) -> None:
+        self._callback = callback
+        self._flush_size = flush_size
+        self._flush_ms = flush_ms
+        self._buffer: list[tuple[str, dict[str, Any]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._pending: set[asyncio.Task[None]] = set()
+        self._lock = asyncio.Lock()
+
+    async def __call__(self, event_type: str, data: dict[str, Any]) -> None:
+        self._buffer.append((event_type, data))
+        if len(self._buffer) >= self._flush_size:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self._flush_ms / 1000, self._on_timer)
+
+    async def flush(self) -> None:
+        """Deliver everything buffered so far. Await this before the run is reported done."""
+        async with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._buffer:
+                return
+            batch, self._buffer = self._buffer, []
+            await self._callback(batch)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        task = asyncio.ensure_future(self._timed_flush())
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _timed_flush(self) -> None:
+        # Nobody awaits this task, so a failing callback must not go unretrieved.
+        try:
+            await self.flush()
+        except Exception:
+            logger.warning("agent_event_batch_failed", exc_info=True)
+
+
+def coalesce_events(
+    callback: OnAgentEventBatch, *, flush_size: int = 64, flush_ms: float = 5,
+) -> _EventCoalescer:
+    """Adapt a batch callback into a per-event ``OnAgentEvent``.
+
+    Events are buffered and handed to ``callback`` in order once ``flush_size``
+    are pending, or ``flush_ms`` after the first buffered event, whichever
+    comes first. Await ``flush()`` at the end of a run to deliver the tail.
+    """
+    return _EventCoalescer(callback, flush_size, flush_ms)
 
 
 @dataclass
 class AgentCallbacks:
-    """Optional callbacks for observability during agent execution."""
+    """Optional callbacks for observability during agent execution.
+
+    Blocking callbacks (file loggers, printing under a lock, ...) go in the
+    ``*_sync`` fields; they are dispatched via ``asyncio.to_thread`` so they
+    cannot stall the event loop between LLM rounds. An async callback takes
+    precedence when both are given.
+
+    ``on_event_batch`` receives events in batches (see ``coalesce_events``)
+    instead of one await per event; it is used when ``on_event`` is unset.
+    """
 
     on_tool_call: OnToolCall | None = None
     on_event: OnAgentEvent | None = None
     nudge_poll: Callable[[], Awaitable[str | None]] | None = None
-
-
-@dataclass
+    on_tool_call_sync: Callable[[str, dict[str, Any], str], None] | None = None
+    on_event_sync: Callable[[str, dict[str, Any]], None] | None = None
+    on_event_batch: OnAgentEventBatch | None = None
+
+    def __post_init__(self) -> None:
+        if self.on_tool_call is None and self.on_tool_call_sync is not None:
+            self.on_tool_call = _run_in_thread(self.on_tool_call_sync)
+        if self.on_event is None and self.on_event_sync is not None:
+            self.on_event = _run_in_thread(self.on_event_sync)
+        if self.on_event is None and self.on_event_batch is not None:
+            self.on_event = coalesce_events(self.on_event_batch)
+
+    async def flush(self) -> None:
+        """Deliver any events still buffered by a batching ``on_event``."""
+        flush = getattr(self.on_event, "flush", None)
+        if flush is not None:
+            await flush()
+
+
+@dataclass(slots=True)
 class AgentTask:
     """Task definition for an agent invocation.
 
@@ -56,9 +163,7 @@ class AgentTask:
 
     # Execution
     working_directory: str | None = None
-    allowed_tools: list[str] = field(default_factory=lambda: [
-        "read_file", "write_file", "delete_file", "list_directory", "run_command"
-    ])
+    allowed_tools: list[str] = field(default_factory=lambda: list(DEFAULT_ALLOWED_TOOLS))
     model: str = DEFAULT_MODEL
     max_tokens: int = 16384
     max_tool_rounds: int = 50
@@ -155,7 +260,18 @@ def merge_model_breakdowns(
     return result
 
 
-@dataclass
+@dataclass(slots=True)
+class ToolCallRecord:
+    """A single tool invocation made by the agent."""
+
+    name: str
+    input: dict[str, Any]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"name": self.name, "input": self.input}
+
+
+@dataclass(slots=True)
 class AgentResult:
     """Result from an agent invocation."""
 
@@ -163,7 +279,7 @@ class AgentResult:
     input_tokens: int = 0
     output_tokens: int = 0
     cost_usd: float = 0.0
-    tool_calls: list[dict[str, Any]] = field(default_factory=list)
+    tool_calls: list[ToolCallRecord] = field(default_factory=list)
     conversation: list[dict[str, Any]] = field(default_factory=list)
     round_count: int = 0
     model: str = ""
@@ -173,6 +289,16 @@ class AgentResult:
     cache_read_tokens: int = 0
     model_breakdown: dict[str, dict[str, Any]] = field(default_factory=dict)
 
+    @property
+    def cache_hit_ratio(self) -> float:
+        """Fraction of prompt tokens served from the provider's prompt cache.
+
+        ``input_tokens`` excludes cached tokens, so the denominator is the
+        full prompt: uncached + cache writes + cache reads.
+        """
+        prompt_tokens = self.input_tokens + self.cache_creation_tokens + self.cache_read_tokens
+        return self.cache_read_tokens / max(1, prompt_tokens)
+
 
 @dataclass
 class CostAccumulator:
@@ -203,16 +329,39 @@ class CostAccumulator:
         }
 
 
-@dataclass
+# Streaming event types — compare against these rather than fresh literals.
+EVENT_TEXT_DELTA = sys.intern("text_delta")
+EVENT_TOOL_USE = sys.intern("tool_use")
+EVENT_TOOL_RESULT = sys.intern("tool_result")
+EVENT_DONE = sys.intern("done")
+
+
+@dataclass(slots=True, frozen=True)
 class AgentEvent:
-    """Streaming event from an agent."""
+    """Streaming event from an agent. Immutable once yielded."""
 
-    event_type: str  # text_delta | tool_use | tool_result | done
-    data: dict[str, Any] = field(default_factory=dict)
+    event_type: str  # EVENT_TEXT_DELTA | EVENT_TOOL_USE | EVENT_TOOL_RESULT | EVENT_DONE
+    data: Mapping[str, Any] = field(default_factory=dict)
+
+
+# Shared terminal event — carries no data, so one instance serves every stream.
+# Its data is read-only so no consumer can leak writes into later streams.
+DONE_EVENT = AgentEvent(EVENT_DONE, MappingProxyType({}))
+
+
+@dataclass(slots=True)
+class AgentEventBatch:
+    """A run of streaming events delivered to the consumer in one wakeup."""
+
+    events: list[AgentEvent]
 
 
 class AgentBackend(Protocol):
-    """Protocol for agent backend implementations."""
+    """Protocol for agent backend implementations.
+
+    Backends run on whichever loop the entry point installs (uvloop in the
+    worker, see ``hadron.utils.eventloop``) and must not assume a selector loop.
+    """
 
     async def execute(self, task: AgentTask) -> AgentResult: ...
 
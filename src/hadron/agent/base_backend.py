@@ -2,13 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
 from typing import Any, AsyncIterator
 
 import structlog
 
-from hadron.agent.base import AgentEvent, AgentResult, AgentTask, ModelStats, OnAgentEvent
+from hadron.agent.base import (
+    AgentEvent,
+    AgentEventBatch,
+    AgentResult,
+    AgentTask,
+    ModelStats,
+    OnAgentEvent,
+    ToolCallRecord,
+)
+from hadron.agent.cache import LLMCache, plan_cache_key
 from hadron.agent.phases import PhasePromptBuilder
+from hadron.agent.rate_limiter import RateGate
 from hadron.agent.tool_loop import ToolLoopConfig, _PhaseResult
 from hadron.agent.tools import make_tools
 from hadron.observability.tracing import set_span_attributes, span
@@ -29,7 +40,7 @@ class _ResultAccumulator:
         self.input_tokens = 0
         self.output_tokens = 0
         self.cost = 0.0
-        self.tool_calls: list[dict[str, Any]] = []
+        self.tool_calls: list[ToolCallRecord] = []
         self.conversations: list[dict[str, Any]] = []
         self.rounds = 0
         self.throttle_count = 0
@@ -75,21 +86,30 @@ class BaseAgentBackend:
 
     Implements three-phase orchestration: Explore → Plan → Act.
     Subclasses override _call_tool_loop, _call_plan, and optionally _compact.
+
+    Set ``plan_cache`` to reuse plan text for identical plan requests
+    (same model, prompts, and exploration summary) instead of re-calling the model.
     """
 
     def __init__(self) -> None:
         self._prompts = PhasePromptBuilder()
+        self.plan_cache: LLMCache | None = None
+        # Shared by every call this backend makes, so one 429 slows them all.
+        self._rate_gate = RateGate()
 
     async def execute(self, task: AgentTask) -> AgentResult:
         """Run the agent's three-phase pipeline to completion."""
         acc = _ResultAccumulator()
 
-        if task.on_event:
-            await task.on_event("prompt", {"text": task.user_prompt})
+        try:
+            if task.on_event:
+                await task.on_event("prompt", {"text": task.user_prompt})
 
-        exploration_summary = await self._run_explore_phase(task, acc) if task.explore_model else ""
-        plan_text = await self._run_plan_phase(task, acc, exploration_summary) if task.plan_model else ""
-        act_result = await self._run_act_phase(task, acc, exploration_summary, plan_text)
+            exploration_summary = await self._run_explore_phase(task, acc) if task.explore_model else ""
+            plan_text = await self._run_plan_phase(task, acc, exploration_summary) if task.plan_model else ""
+            act_result = await self._run_act_phase(task, acc, exploration_summary, plan_text)
+        finally:
+            await task.callbacks.flush()
 
         return acc.to_result(act_result.output, task.model)
 
@@ -98,6 +118,48 @@ class BaseAgentBackend:
         raise NotImplementedError(f"{type(self).__name__} does not support streaming")
         yield  # Make it a generator  # pragma: no cover
 
+    async def stream_batched(
+        self, task: AgentTask, *, max_batch: int = 32, max_delay_ms: float = 5,
+    ) -> AsyncIterator[AgentEventBatch]:
+        """Stream agent events grouped into batches.
+
+        A batch is flushed once it holds *max_batch* events or *max_delay_ms*
+        has passed since its first event, so bursts of small deltas reach the
+        consumer in a single wakeup instead of one per event.
+
+        Like ``stream``, this is a library entry point for streaming consumers;
+        the worker pipeline runs agents through ``execute`` and does not call it.
+        """
+        loop = asyncio.get_running_loop()
+        events = aiter(self.stream(task))
+        batch: list[AgentEvent] = []
+        deadline = 0.0
+        pending = asyncio.ensure_future(anext(events))
+        try:
+            while True:
+                timeout = max(0.0, deadline - loop.time()) if batch else None
+                done, _ = await asyncio.wait({pending}, timeout=timeout)
+                if not done:
+                    yield AgentEventBatch(batch)
+                    batch = []
+                    continue
+                try:
+                    event = pending.result()
+                except StopAsyncIteration:
+                    break
+                if not batch:
+                    deadline = loop.time() + max_delay_ms / 1000
+                batch.append(event)
+                if len(batch) >= max_batch:
+                    yield AgentEventBatch(batch)
+                    batch = []
+                pending = asyncio.ensure_future(anext(events))
+        finally:
+            if not pending.done():
+                pending.cancel()
+        if batch:
+            yield AgentEventBatch(batch)
+
     # ------------------------------------------------------------------
     # Phase orchestration (shared across all backends)
     # ------------------------------------------------------------------
@@ -112,12 +174,13 @@ class BaseAgentBackend:
             model=task.explore_model,
             system_prompt=self._prompts.build_explore_system(task),
             user_prompt=task.user_prompt,
-            tools=make_tools(task.explore_tools, task.working_directory),
+            tools=make_tools(task.explore_tools),
             working_dir=task.working_directory or ".",
             max_rounds=task.explore_max_rounds,
             max_tokens=task.max_tokens,
             on_event=task.on_event,
             phase="explore",
+            rate_gate=self._rate_gate,
             ))
             set_span_attributes(s, {
                 "rounds": result.round_count,
@@ -154,13 +217,10 @@ class BaseAgentBackend:
             await task.on_event("phase_started", {"phase": "plan", "model": task.plan_model})
 
         t0 = time.monotonic()
+        system_prompt = self._prompts.build_plan_system(task)
+        user_prompt = self._prompts.build_plan_user(task, exploration_summary)
         with span("backend.plan", {"model": task.plan_model}) as s:
-            result = await self._call_plan(
-                model=task.plan_model,
-                system_prompt=self._prompts.build_plan_system(task),
-                user_prompt=self._prompts.build_plan_user(task, exploration_summary),
-                max_tokens=task.max_tokens,
-            )
+            result = await self._cached_plan(task, system_prompt, user_prompt)
             set_span_attributes(s, {
                 "input_tokens": result.input_tokens,
                 "output_tokens": result.output_tokens,
@@ -190,6 +250,31 @@ class BaseAgentBackend:
         )
         return result.output
 
+    async def _cached_plan(self, task: AgentTask, system_prompt: str, user_prompt: str) -> _PhaseResult:
+        """Run the plan call, serving it from ``plan_cache`` when possible."""
+        if self.plan_cache is None:
+            return await self._call_plan(
+                model=task.plan_model, system_prompt=system_prompt,
+                user_prompt=user_prompt, max_tokens=task.max_tokens,
+            )
+
+        key = plan_cache_key(task.plan_model, system_prompt, user_prompt, task.max_tokens)
+        cached = await self.plan_cache.get_text(key)
+        if cached is not None:
+            logger.info("plan_cache_hit", model=task.plan_model, role=task.role)
+            return _PhaseResult(
+                output=cached, model=task.plan_model, input_tokens=0, output_tokens=0,
+                cost_usd=0.0, tool_calls=[], conversation=[], round_count=0,
+            )
+
+        result = await self._call_plan(
+            model=task.plan_model, system_prompt=system_prompt,
+            user_prompt=user_prompt, max_tokens=task.max_tokens,
+        )
+        if result.output:
+            await self.plan_cache.set_text(key, result.output)
+        return result
+
     async def _run_act_phase(
         self, task: AgentTask, acc: _ResultAccumulator, exploration_summary: str, plan_text: str,
     ) -> _PhaseResult:
@@ -208,7 +293,7 @@ class BaseAgentBackend:
                 model=task.model,
                 system_prompt=act_system_prompt,
                 user_prompt=act_user_prompt,
-                tools=make_tools(task.allowed_tools, task.working_directory),
+                tools=make_tools(task.allowed_tools),
                 working_dir=task.working_directory or ".",
                 max_rounds=task.max_tool_rounds,
                 max_tokens=task.max_tokens,
@@ -216,6 +301,7 @@ class BaseAgentBackend:
                 on_tool_call=task.on_tool_call,
                 nudge_poll=task.nudge_poll,
                 phase="act",
+                rate_gate=self._rate_gate,
             ))
             set_span_attributes(s, {
                 "rounds": result.round_count,
@@ -237,7 +323,7 @@ class BaseAgentBackend:
         # model actually produced changes or just read around.
         write_tools = sum(
             1 for tc in result.tool_calls
-            if tc.get("name") in {"write_file", "edit_file", "apply_patch", "str_replace"}
+            if tc.name in {"write_file", "edit_file", "apply_patch", "str_replace"}
         )
         logger.info(
             "phase_completed",
@@ -0,0 +1,54 @@
+"""Plan-phase response cache.
+
+The plan phase is a single tool-less call whose prompt already embeds the
+exploration summary, so ``BaseAgentBackend`` can reuse plan text by
+``plan_cache_key`` when given a ``plan_cache``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any
+
+_KEY_PREFIX = "hadron:llm_cache:"
+_DEFAULT_TTL_SECONDS = 24 * 3600
+
+
+def plan_cache_key(model: str, system_prompt: str, user_prompt: str, max_tokens: int) -> str:
+    """Return a SHA-256 hex digest identifying a plan-phase request."""
+    payload = {
+        "phase": "plan",
+        "model": model,
+        "system_prompt": system_prompt,
+        "user_prompt": user_prompt,
+        "max_tokens": max_tokens,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+class LLMCache:
+    """Key → response text store. In-memory by default, Redis-backed when given a client.
+
+    The in-memory store has no TTL or size bound and is meant for tests; the
+    worker always passes its Redis client.
+    """
+
+    def __init__(self, redis: Any = None, *, ttl_seconds: int = _DEFAULT_TTL_SECONDS) -> None:
+        self._redis = redis
+        self._ttl = ttl_seconds
+        self._texts: dict[str, str] = {}
+
+    async def get_text(self, key: str) -> str | None:
+        if self._redis is None:
+            return self._texts.get(key)
+        raw = await self._redis.get(_KEY_PREFIX + key)
+        if raw is None:
+            return None
+        return raw.decode() if isinstance(raw, bytes) else raw
+
+    async def set_text(self, key: str, text: str) -> None:
+        if self._redis is None:
+            self._texts[key] = text
+            return
+        await self._redis.set(_KEY_PREFIX + key, text, ex=self._ttl)
@@ -2,25 +2,41 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
-from typing import Any, AsyncIterator
+from collections.abc import Sequence
+from typing import Any, AsyncIterator, cast
 
 import anthropic
-
-from hadron.agent.base import AgentEvent, AgentResult, AgentTask, ModelStats, OnAgentEvent
+import structlog
+
+from hadron.agent.base import (
+    DONE_EVENT,
+    EVENT_TEXT_DELTA,
+    EVENT_TOOL_RESULT,
+    EVENT_TOOL_USE,
+    AgentEvent,
+    AgentResult,
+    AgentTask,
+    ModelStats,
+    OnAgentEvent,
+)
 from hadron.agent.base_backend import BaseAgentBackend, _ResultAccumulator
 from hadron.agent.compaction import compact_messages
-from hadron.agent.cost import _compute_model_cost
+from hadron.agent.cost import ANTHROPIC_BATCH_DISCOUNT, _compute_model_cost
+from hadron.agent.messages import _serialize_content
 from hadron.agent.rate_limiter import call_with_retry
 from hadron.agent.tool_loop import (
     ToolLoopConfig,
     _PhaseResult,
+    cacheable_messages,
     cacheable_system,
     cacheable_tools,
+    execute_tool_uses,
     parse_response_blocks,
     run_tool_loop,
 )
-from hadron.agent.tools import execute_tool, make_tools
+from hadron.agent.tools import make_tools
 from hadron.config.limits import (
     MAX_TOOL_RESULT_CALLBACK_CHARS,
 )
@@ -28,6 +44,17 @@ from hadron.config.limits import (
 # Re-export for backwards compatibility (tests import these directly from claude.py)
 from hadron.agent.cost import _MODEL_COSTS, _DEFAULT_COST, register_model_cost  # noqa: F401
 
+logger = structlog.stdlib.get_logger(__name__)
+
+# Message Batches poll interval: starts short, backs off to the cap.
+_BATCH_POLL_INITIAL_SECONDS = 10.0
+_BATCH_POLL_MAX_SECONDS = 300.0
+
+
+def _is_batchable(task: AgentTask) -> bool:
+    """Whether a task is a single tool-less call that the Message Batches API can serve."""
+    return not task.allowed_tools and not task.explore_model and not task.plan_model
+
 
 class ClaudeAgentBackend(BaseAgentBackend):
     """Agent backend using the Anthropic Messages API with a tool-use loop.
@@ -76,7 +103,7 @@ class ClaudeAgentBackend(BaseAgentBackend):
                     pass
                 return await stream.get_final_message()
 
-        retry_result = await call_with_retry(_plan_api_call, label="plan")
+        retry_result = await call_with_retry(_plan_api_call, label="plan", gate=self._rate_gate)
         response = retry_result.value
 
         text_parts, _ = parse_response_blocks(response)
@@ -118,6 +145,116 @@ class ClaudeAgentBackend(BaseAgentBackend):
         """Delegate to the extracted compaction module (Haiku-based)."""
         return await compact_messages(self._client, messages, phase=phase, on_event=on_event)
 
+    # ------------------------------------------------------------------
+    # Bulk execution via the Message Batches API
+    # ------------------------------------------------------------------
+
+    async def execute_many(self, tasks: Sequence[AgentTask]) -> list[AgentResult]:
+        """Run independent tasks, returning results in the same order.
+
+        Single tool-less tasks go through the Message Batches API at half
+        price, at the cost of latency (minutes, up to 24h), so this is for
+        non-interactive bulk work. Tasks that need tools or explore/plan
+        phases, and batch entries that error or expire, run via ``execute``.
+
+        Batched tasks get the same ``prompt`` and ``output`` events that
+        ``execute`` would emit for a tool-less task; ``prompt`` fires on
+        submission and ``output`` once the batch has ended.
+
+        The worker pipeline does not call this: its nodes need interactive
+        latency and run through ``execute``. It is for bulk callers only.
+        """
+        batched = [i for i, task in enumerate(tasks) if _is_batchable(task)]
+        results: list[AgentResult | None] = [None] * len(tasks)
+
+        async def _run_live(i: int) -> None:
+            results[i] = await self.execute(tasks[i])
+
+        async def _run_batch() -> None:
+            batch_results = await self._execute_batch([tasks[i] for i in batched])
+            await asyncio.gather(*(
+                _run_live(i) for i, r in zip(batched, batch_results) if r is None
+            ))
+            for i, r in zip(batched, batch_results):
+                if r is not None:
+                    results[i] = r
+
+        batched_set = set(batched)
+        await asyncio.gather(
+            *([_run_batch()] if batched else []),
+            *(_run_live(i) for i in range(len(tasks)) if i not in batched_set),
+        )
+        return cast(list[AgentResult], results)
+
+    async def _execute_batch(self, tasks: Sequence[AgentTask]) -> list[AgentResult | None]:
+        """Submit tool-less tasks as one message batch; ``None`` marks entries that did not succeed."""
+        for task in tasks:
+            if task.on_event:
+                await task.on_event("prompt", {"text": task.user_prompt})
+        batch = await self._client.messages.batches.create(requests=[
+            {
+                "custom_id": f"task-{i}",
+                "params": {
+                    "model": task.model,
+                    "max_tokens": task.max_tokens,
+                    "system": cacheable_system(task.system_prompt),
+                    "messages": [{"role": "user", "content": task.user_prompt}],
+                },
+            }
+            for i, task in enumerate(tasks)
+        ])
+        logger.info("message_batch_submitted", batch_id=batch.id, requests=len(tasks))
+
+        delay = _BATCH_POLL_INITIAL_SECONDS
+        while batch.processing_status != "ended":
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _BATCH_POLL_MAX_SECONDS)
+            batch = await self._client.messages.batches.retrieve(batch.id)
+
+        results: list[AgentResult | None] = [None] * len(tasks)
+        async for entry in await self._client.messages.batches.results(batch.id):
+            i = int(entry.custom_id.removeprefix("task-"))
+            if entry.result.type != "succeeded":
+                logger.warning(
+                    "message_batch_entry_failed", batch_id=batch.id,
+                    role=tasks[i].role, result=entry.result.type,
+                )
+                continue
+            results[i] = self._batch_result(tasks[i], entry.result.message)
+            if tasks[i].on_event:
+                await tasks[i].on_event("output", {"text": results[i].output, "round": 0})
+                await tasks[i].callbacks.flush()
+        return results
+
+    @staticmethod
+    def _batch_result(task: AgentTask, message: Any) -> AgentResult:
+        text_parts, _ = parse_response_blocks(message)
+        text = "".join(text_parts)
+        usage = message.usage
+        cache_creation = getattr(usage, "cache_creation_input_tokens", 0) or 0
+        cache_read = getattr(usage, "cache_read_input_tokens", 0) or 0
+        cost = ANTHROPIC_BATCH_DISCOUNT * _compute_model_cost(
+            task.model, usage.input_tokens, usage.output_tokens,
+            cache_creation_tokens=cache_creation, cache_read_tokens=cache_read,
+        )
+        acc = _ResultAccumulator()
+        acc.add(_PhaseResult(
+            output=text,
+            model=task.model,
+            input_tokens=usage.input_tokens,
+            output_tokens=usage.output_tokens,
+            cost_usd=cost,
+            tool_calls=[],
+            conversation=[
+                {"role": "user", "content": task.user_prompt},
+                {"role": "assistant", "content": text},
+            ],
+            round_count=1,
+            cache_creation_tokens=cache_creation,
+            cache_read_tokens=cache_read,
+        ), task.model)
+        return acc.to_result(text, task.model)
+
     # ------------------------------------------------------------------
     # Keep _compact_messages for backwards compatibility (tests use it)
     # ------------------------------------------------------------------
@@ -138,7 +275,7 @@ class ClaudeAgentBackend(BaseAgentBackend):
 
     async def stream(self, task: AgentTask) -> AsyncIterator[AgentEvent]:
         """Stream agent events. Yields events as they happen."""
-        tools = cacheable_tools(make_tools(task.allowed_tools, task.working_directory))
+        tools = cacheable_tools(make_tools(task.allowed_tools))
         system = cacheable_system(task.system_prompt)
         messages: list[dict[str, Any]] = [{"role": "user", "content": task.user_prompt}]
 
@@ -147,7 +284,7 @@ class ClaudeAgentBackend(BaseAgentBackend):
 
             async def _on_stream_retry(wait: int) -> None:
                 retry_events.append(AgentEvent(
-                    event_type="text_delta",
+                    event_type=EVENT_TEXT_DELTA,
                     data={"text": f"[Rate limited — waiting {wait}s before retrying...]"},
                 ))
 
@@ -157,10 +294,11 @@ class ClaudeAgentBackend(BaseAgentBackend):
                     max_tokens=task.max_tokens,
                     system=system,
                     tools=tools,
-                    messages=messages,
+                    messages=cacheable_messages(messages),
                 ),
                 label="stream",
                 on_retry=_on_stream_retry,
+                gate=self._rate_gate,
             )
             response = retry_result.value
             for ev in retry_events:
@@ -168,34 +306,29 @@ class ClaudeAgentBackend(BaseAgentBackend):
 
             text_parts, tool_uses = parse_response_blocks(response)
             for text in text_parts:
-                yield AgentEvent(event_type="text_delta", data={"text": text})
+                yield AgentEvent(event_type=EVENT_TEXT_DELTA, data={"text": text})
             for tu in tool_uses:
                 yield AgentEvent(
-                    event_type="tool_use",
+                    event_type=EVENT_TOOL_USE,
                     data={"name": tu.name, "input": tu.input},
                 )
 
             if not tool_uses or response.stop_reason == "end_turn":
                 break
 
-            messages.append({"role": "assistant", "content": response.content})
+            messages.append({"role": "assistant", "content": _serialize_content(response.content)})
+            results = await execute_tool_uses(tool_uses, task.working_directory or ".", phase="stream")
             tool_results = []
-            for tu in tool_uses:
-                result_text = await execute_tool(
-                    tu.name, tu.input, task.working_directory or "."
-                )
+            for tu, result_text in zip(tool_uses, results):
                 tool_results.append({
                     "type": "tool_result",
                     "tool_use_id": tu.id,
                     "content": result_text,
                 })
                 yield AgentEvent(
-                    event_type="tool_result",
+                    event_type=EVENT_TOOL_RESULT,
                     data={"name": tu.name, "result": result_text[:MAX_TOOL_RESULT_CALLBACK_CHARS]},
                 )
             messages.append({"role": "user", "content": tool_results})
 
-            if response.stop_reason == "end_turn":
-                break
-
-        yield AgentEvent(event_type="done", data={})
+        yield DONE_EVENT
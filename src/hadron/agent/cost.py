@@ -2,6 +2,15 @@
 
 from __future__ import annotations
 
+import functools
+import re
+
+import structlog
+
+from hadron.agent.factory import backend_for_model
+
+logger = structlog.stdlib.get_logger(__name__)
+
 # Per-model cost per million tokens: (input, output).
 # Use register_model_cost() to add entries at runtime without modifying source.
 _MODEL_COSTS: dict[str, tuple[float, float]] = {
@@ -27,6 +36,17 @@ _MODEL_COSTS: dict[str, tuple[float, float]] = {
 # Fallback for unknown models (use Sonnet pricing)
 _DEFAULT_COST = (3.00, 15.00)
 
+# Trailing snapshot date, e.g. the "-20250514" in "claude-sonnet-4-20250514".
+_SNAPSHOT_SUFFIX = re.compile(r"-\d{8}$")
+
+# Cached prompt-token (cache read) price as a fraction of the base input price.
+ANTHROPIC_CACHE_READ_RATE = 0.10
+OPENAI_CACHE_READ_RATE = 0.25
+GEMINI_CACHE_READ_RATE = 0.25
+
+# Message Batches API requests are billed at this fraction of the live price.
+ANTHROPIC_BATCH_DISCOUNT = 0.50
+
 
 def register_model_cost(model: str, input_cost: float, output_cost: float) -> None:
     """Register per-million-token costs for a model.
@@ -35,6 +55,36 @@ def register_model_cost(model: str, input_cost: float, output_cost: float) -> No
     without modifying source code.
     """
     _MODEL_COSTS[model] = (input_cost, output_cost)
+    _model_rates.cache_clear()
+    models_for_backend.cache_clear()
+
+
+@functools.lru_cache(maxsize=16)
+def models_for_backend(backend: str) -> tuple[str, ...]:
+    """Return the sorted model names in the cost table served by a built-in *backend*."""
+    return tuple(sorted(m for m in _MODEL_COSTS if backend_for_model(m) == backend))
+
+
+@functools.lru_cache(maxsize=256)
+def _model_rates(model: str) -> tuple[float, float]:
+    """Resolve a model id to its (input, output) rates.
+
+    Dated snapshots and their undated aliases resolve to each other, so
+    "claude-haiku-4-5" prices like "claude-haiku-4-5-20251001". Unknown
+    models fall back to ``_DEFAULT_COST`` with a one-time warning.
+    """
+    rates = _MODEL_COSTS.get(model)
+    if rates is not None:
+        return rates
+    base = _SNAPSHOT_SUFFIX.sub("", model)
+    rates = _MODEL_COSTS.get(base)
+    if rates is not None:
+        return rates
+    for known, known_rates in _MODEL_COSTS.items():
+        if _SNAPSHOT_SUFFIX.sub("", known) == base:
+            return known_rates
+    logger.warning("model_cost_unknown", model=model, fallback=_DEFAULT_COST)
+    return _DEFAULT_COST
 
 
 def _compute_model_cost(
@@ -43,14 +93,16 @@ def _compute_model_cost(
     output_tokens: int,
     cache_creation_tokens: int = 0,
     cache_read_tokens: int = 0,
+    cache_read_rate: float = ANTHROPIC_CACHE_READ_RATE,
 ) -> float:
     """Compute USD cost for a given model and token counts.
 
-    Cache pricing: writes cost 25% more than base input, reads cost 90% less.
+    Cache pricing: writes cost 25% more than base input, reads cost
+    *cache_read_rate* times base input (90% less for Anthropic).
     """
-    cost_in, cost_out = _MODEL_COSTS.get(model, _DEFAULT_COST)
+    cost_in, cost_out = _model_rates(model)
     cache_write_cost = cost_in * 1.25
-    cache_read_cost = cost_in * 0.10
+    cache_read_cost = cost_in * cache_read_rate
     return (
         input_tokens * cost_in
         + output_tokens * cost_out
@@ -2,9 +2,32 @@
 
 from __future__ import annotations
 
+import functools
 import os
 from typing import Any
 
+# Model family (first dash-separated token of the model name) -> built-in backend.
+_MODEL_FAMILY_BACKENDS: dict[str, str] = {
+    "claude": "claude",
+    "gemini": "gemini",
+    "gpt": "openai",
+    "o1": "openai",
+    "o3": "openai",
+    "o4": "openai",
+}
+
+
+@functools.lru_cache(maxsize=256)
+def backend_for_model(model: str) -> str | None:
+    """Return the built-in backend name that serves *model*, or None if unknown.
+
+    A single dict probe on the model family replaces a scan over prefixes.
+    An optional ``vendor/`` qualifier (e.g. ``openai/gpt-4o``) is ignored.
+    Memoized — the set of model strings in play is tiny and looked up repeatedly.
+    """
+    family = model.rsplit("/", 1)[-1].split("-", 1)[0]
+    return _MODEL_FAMILY_BACKENDS.get(family)
+
 
 def create_agent_backend(
     backend_name: str | None = None,
@@ -2,20 +2,24 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import functools
+import hashlib
 import os
 import time
 from typing import Any
 
 import structlog
 
-from hadron.agent.base import OnAgentEvent
+from hadron.agent.base import OnAgentEvent, ToolCallRecord
 from hadron.agent.base_backend import BaseAgentBackend
-from hadron.agent.cost import _compute_model_cost
+from hadron.agent.cost import GEMINI_CACHE_READ_RATE, _compute_model_cost
 from hadron.agent.rate_limiter import call_with_retry
-from hadron.agent.tool_loop import ToolLoopConfig, _PhaseResult
-from hadron.agent.tools import execute_tool, make_tools_gemini
+from hadron.agent.tool_loop import ToolLoopConfig, _EventEmitter, _PhaseResult, execute_tool_uses
+from hadron.agent.tools import make_tools_gemini
+from hadron.utils.text import json_preview
 from hadron.config.limits import (
+    COMPACT_INPUT_TOKEN_THRESHOLD,
     MAX_TOOL_RESULT_CALLBACK_CHARS,
     MAX_TOOL_RESULT_EVENT_CHARS,
 )
@@ -24,18 +28,97 @@ logger = structlog.stdlib.get_logger(__name__)
 
 _DEFAULT_GEMINI_MODEL = "gemini-2.5-flash"
 
+# Explicit context caches (system prompt + tool declarations). Gemini rejects
+# caches below ~1024 tokens, so short prompts skip the create round-trip.
+_CACHED_CONTENT_TTL_SECONDS = 3600
+_CACHED_CONTENT_MIN_CHARS = 4096
+# Stop using a cache this long before its TTL runs out — longer than one
+# rate-limited round, so a cache checked at the start of a round outlives it.
+_CACHED_CONTENT_EXPIRY_MARGIN_SECONDS = 300
+# Local index bound; evicted caches are deleted remotely.
+_CACHED_CONTENT_MAX_ENTRIES = 16
+# Errors from a request naming a cache that is gone or not ours: retry inline.
+_CACHED_CONTENT_FALLBACK_CODES = frozenset({400, 403, 404})
+
+# Latest tool-result turns kept verbatim when older ones are elided.
+_VERBATIM_TOOL_ROUNDS = 2
+
+
+def _usage_tokens(usage: Any) -> tuple[int, int, int]:
+    """Return (uncached_input, output, cached_input) token counts from Gemini usage metadata.
+
+    Gemini's ``prompt_token_count`` includes cached content tokens; split them
+    out so ``input_tokens`` means the same thing across backends.
+    """
+    if not usage:
+        return 0, 0, 0
+    prompt = getattr(usage, "prompt_token_count", 0) or 0
+    cached = getattr(usage, "cached_content_token_count", 0) or 0
+    output = getattr(usage, "candidates_token_count", 0) or 0
+    return prompt - cached, output, cached
+
+
+def _elide_old_tool_results(contents: list[Any], keep_rounds: int = _VERBATIM_TOOL_ROUNDS) -> int:
+    """Replace function responses older than the last *keep_rounds* tool turns with stubs.
+
+    The model has already acted on those results; re-sending them verbatim
+    every round is most of the input-token growth in long tool loops.
+    Returns the number of responses elided.
+    """
+    from google.genai import types
+
+    tool_turns = [
+        i for i, content in enumerate(contents)
+        if any(part.function_response for part in content.parts or [])
+    ]
+    elided = 0
+    for i in tool_turns[:-keep_rounds] if keep_rounds else tool_turns:
+        parts = []
+        for part in contents[i].parts:
+            fr = part.function_response
+            if fr and "elided" not in (fr.response or {}):
+                result = str((fr.response or {}).get("result", ""))
+                part = types.Part.from_function_response(
+                    name=fr.name,
+                    response={"elided": f"earlier {fr.name} result ({len(result)} chars) omitted"},
+                )
+                elided += 1
+            parts.append(part)
+        contents[i] = types.Content(role=contents[i].role, parts=parts)
+    return elided
+
+
+@functools.lru_cache(maxsize=32)
+def _gemini_tools(tool_names: tuple[str, ...]) -> tuple[Any, ...]:
+    """Build the SDK ``Tool`` objects for a tool set (memoized; the SDK does not mutate them)."""
+    from google.genai import types
+
+    fn_declarations = make_tools_gemini(list(tool_names))
+    return (types.Tool(function_declarations=fn_declarations),) if fn_declarations else ()
+
 
 def _get_gemini_transient_errors() -> tuple[type[Exception], ...]:
-    """Return Gemini transient error types (lazy import)."""
+    """Return Gemini transient error types (lazy import).
+
+    google-genai raises ``errors.APIError`` subclasses with the HTTP status as
+    ``.code``; call_with_retry re-raises the non-retryable 4xx ones at once.
+    """
+    errors: list[type[Exception]] = []
+    try:
+        from google.genai import errors as genai_errors
+        errors.append(genai_errors.APIError)
+    except ImportError:
+        pass
     try:
         from google.api_core import exceptions as google_exceptions
-        return (
+        errors += [
             google_exceptions.ResourceExhausted,
             google_exceptions.ServiceUnavailable,
             google_exceptions.InternalServerError,
-        )
+        ]
     except ImportError:
-        return ()
+        pass
+    return tuple(errors)
 
 
 class GeminiAgentBackend(BaseAgentBackend):
@@ -63,15 +146,101 @@ class GeminiAgentBackend(BaseAgentBackend):
             if saved_vertex_env is not None:
                 os.environ["GOOGLE_GENAI_USE_VERTEXAI"] = saved_vertex_env
         self._transient_errors = _get_gemini_transient_errors()
+        # key -> (cache name or None if creation failed, monotonic expiry), oldest first
+        self._cached_contents: dict[str, tuple[str | None, float]] = {}
+        self._cache_creates: dict[str, asyncio.Future[str | None]] = {}
+
+    async def _cached_content(
+        self, model: str, system_prompt: str, tools: list[Any],
+    ) -> str | None:
+        """Return a ``cached_content`` name holding the system prompt and tools.
+
+        Called before every round of the tool loop, where the prefix is
+        re-sent each time. Caches are created once per (model, system prompt,
+        tool set), with concurrent phases sharing one create, and reused until
+        shortly before their TTL. Returns None when the prompt is too short to
+        cache or creation fails, in which case the caller sends the system
+        instruction and tools inline.
+        """
+        if len(system_prompt) < _CACHED_CONTENT_MIN_CHARS:
+            return None
+        names = sorted(
+            fd.name for tool in tools for fd in (tool.function_declarations or [])
+        )
+        key = hashlib.sha256(
+            "\0".join([model, system_prompt, *names]).encode()
+        ).hexdigest()
+        cached = self._cached_contents.get(key)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+
+        create = self._cache_creates.get(key)
+        if create is None:
+            create = asyncio.ensure_future(self._create_cached_content(key, model, system_prompt, tools))
+            self._cache_creates[key] = create
+            create.add_done_callback(lambda _: self._cache_creates.pop(key, None))
+        return await asyncio.shield(create)
+
+    async def _create_cached_content(
+        self, key: str, model: str, system_prompt: str, tools: list[Any],
+    ) -> str | None:
+        from google.genai import types
+
+        expires = time.monotonic() + _CACHED_CONTENT_TTL_SECONDS - _CACHED_CONTENT_EXPIRY_MARGIN_SECONDS
+        try:
+            cache = await self._client.aio.caches.create(
+                model=model,
+                config=types.CreateCachedContentConfig(
+                    system_instruction=system_prompt,
+                    tools=tools or None,
+                    ttl=f"{_CACHED_CONTENT_TTL_SECONDS}s",
+                ),
+            )
+        except Exception as e:
+            # Don't retry a failing create on every round; fall back until expiry.
+            logger.warning("gemini_cache_create_failed", model=model, error=str(e))
+            await self._remember_cached_content(key, None, expires)
+            return None
+        logger.info("gemini_cache_created", model=model, name=cache.name)
+        await self._remember_cached_content(key, cache.name, expires)
+        return cache.name
+
+    async def _remember_cached_content(self, key: str, name: str | None, expires: float) -> None:
+        now = time.monotonic()
+        for stale in [k for k, (_, exp) in self._cached_contents.items() if exp <= now]:
+            del self._cached_contents[stale]
+        self._cached_contents.pop(key, None)
+        evicted = []
+        while len(self._cached_contents) >= _CACHED_CONTENT_MAX_ENTRIES:
+            evicted.append(self._cached_contents.pop(next(iter(self._cached_contents)))[0])
+        self._cached_contents[key] = (name, expires)
+        # A loop mid-round on an evicted cache falls back inline if it is already gone.
+        await self._delete_cached_contents([n for n in evicted if n])
+
+    def _forget_cached_content(self, name: str) -> None:
+        """Stop handing out a cache the API rejected; fall back inline until its expiry."""
+        for key, (cached_name, expires) in self._cached_contents.items():
+            if cached_name == name:
+                self._cached_contents[key] = (None, expires)
+
+    async def _delete_cached_contents(self, names: list[str]) -> None:
+        for name in names:
+            try:
+                await self._client.aio.caches.delete(name=name)
+            except Exception as e:
+                logger.warning("gemini_cache_delete_failed", name=name, error=str(e))
+
+    async def aclose(self) -> None:
+        """Delete the context caches this backend created, instead of paying storage until their TTL."""
+        names = [name for name, _ in self._cached_contents.values() if name]
+        self._cached_contents.clear()
+        await self._delete_cached_contents(names)
 
     async def _call_tool_loop(self, cfg: ToolLoopConfig) -> _PhaseResult:
         """Run the Gemini function-calling loop for a single phase."""
         from google.genai import types
 
-        tool_names = [t["name"] for t in cfg.tools] if cfg.tools else []
-        fn_declarations = make_tools_gemini(tool_names, cfg.working_dir)
-
-        tools = [types.Tool(function_declarations=fn_declarations)] if fn_declarations else []
+        tools = list(_gemini_tools(tuple(t["name"] for t in cfg.tools or [])))
 
         contents: list[Any] = [
             types.Content(role="user", parts=[types.Part.from_text(text=cfg.user_prompt)])
@@ -79,128 +248,160 @@ class GeminiAgentBackend(BaseAgentBackend):
 
         total_input = 0
         total_output = 0
-        all_tool_calls: list[dict[str, Any]] = []
+        total_cache_read = 0
+        all_tool_calls: list[ToolCallRecord] = []
         final_text = ""
         round_num = 0
         total_throttle_count = 0
         total_throttle_seconds = 0.0
 
-        config = types.GenerateContentConfig(
+        inline_config = types.GenerateContentConfig(
             system_instruction=cfg.system_prompt,
             max_output_tokens=cfg.max_tokens,
             tools=tools,
         )
 
-        for round_num in range(cfg.max_rounds):
-            async def _on_retry(wait: int) -> None:
-                if cfg.on_event:
-                    await cfg.on_event("output", {
+        events = _EventEmitter(cfg.on_event)
+        try:
+            for round_num in range(cfg.max_rounds):
+                async def _on_retry(wait: int) -> None:
+                    await events.emit("output", {
                         "text": f"[Rate limited ({cfg.phase}) — waiting {wait}s before retrying...]",
                         "round": round_num,
                     })
 
-            t0 = time.monotonic()
-            retry_result = await call_with_retry(
-                lambda: self._client.aio.models.generate_content(
-                    model=cfg.model,
-                    contents=contents,
-                    config=config,
-                ),
-                label=cfg.phase,
-                on_retry=_on_retry,
-                transient_errors=self._transient_errors,
-            )
-            response = retry_result.value
-            elapsed = time.monotonic() - t0
-            total_throttle_count += retry_result.throttle_count
-            total_throttle_seconds += retry_result.throttle_seconds
-
-            usage = getattr(response, "usage_metadata", None)
-            input_t = 0
-            output_t = 0
-            if usage:
-                input_t = getattr(usage, "prompt_token_count", 0) or 0
-                output_t = getattr(usage, "candidates_token_count", 0) or 0
+                async def _generate(config: Any) -> Any:
+                    return await call_with_retry(
+                        lambda: self._client.aio.models.generate_content(
+                            model=cfg.model,
+                            contents=contents,
+                            config=config,
+                        ),
+                        label=cfg.phase,
+                        on_retry=_on_retry,
+                        transient_errors=self._transient_errors,
+                        gate=cfg.rate_gate,
+                    )
+
+                # Re-checked every round: a long loop can outlive a cache's TTL.
+                cached_content = await self._cached_content(cfg.model, cfg.system_prompt, tools)
+                t0 = time.monotonic()
+                if not cached_content:
+                    retry_result = await _generate(inline_config)
+                else:
+                    try:
+                        retry_result = await _generate(types.GenerateContentConfig(
+                            cached_content=cached_content,
+                            max_output_tokens=cfg.max_tokens,
+                        ))
+                    except Exception as e:
+                        if getattr(e, "code", None) not in _CACHED_CONTENT_FALLBACK_CODES:
+                            raise
+                        logger.warning(
+                            "gemini_cache_rejected", phase=cfg.phase, name=cached_content, error=str(e),
+                        )
+                        self._forget_cached_content(cached_content)
+                        retry_result = await _generate(inline_config)
+                response = retry_result.value
+                elapsed = time.monotonic() - t0
+                total_throttle_count += retry_result.throttle_count
+                total_throttle_seconds += retry_result.throttle_seconds
+
+                input_t, output_t, cached_t = _usage_tokens(getattr(response, "usage_metadata", None))
                 total_input += input_t
                 total_output += output_t
-            logger.info(
-                "llm_response",
-                phase=cfg.phase,
-                model=cfg.model,
-                round=round_num,
-                input_tokens=input_t,
-                output_tokens=output_t,
-                elapsed_s=round(elapsed, 2),
-            )
+                total_cache_read += cached_t
+                logger.info(
+                    "llm_response",
+                    phase=cfg.phase,
+                    model=cfg.model,
+                    round=round_num,
+                    input_tokens=input_t,
+                    output_tokens=output_t,
+                    cache_read_tokens=cached_t,
+                    elapsed_s=round(elapsed, 2),
+                )
+
+                # Extract text and function calls from response
+                candidate = response.candidates[0] if response.candidates else None
+                if not candidate or not candidate.content or not candidate.content.parts:
+                    break
+
+                text_parts = []
+                fn_calls = []
+                for part in candidate.content.parts:
+                    if hasattr(part, "text") and part.text:
+                        text_parts.append(part.text)
+                    if hasattr(part, "function_call") and part.function_call:
+                        fn_calls.append(part.function_call)
+
+                if text_parts:
+                    final_text = "\n".join(text_parts)
+                    await events.emit("output", {"text": final_text, "round": round_num})
 
-            # Extract text and function calls from response
-            candidate = response.candidates[0] if response.candidates else None
-            if not candidate or not candidate.content or not candidate.content.parts:
-                break
-
-            text_parts = []
-            fn_calls = []
-            for part in candidate.content.parts:
-                if hasattr(part, "text") and part.text:
-                    text_parts.append(part.text)
-                if hasattr(part, "function_call") and part.function_call:
-                    fn_calls.append(part.function_call)
-
-            if text_parts:
-                final_text = "\n".join(text_parts)
-                if cfg.on_event:
-                    await cfg.on_event("output", {"text": final_text, "round": round_num})
-
-            if not fn_calls:
-                break
-
-            # Add model response to contents
-            contents.append(candidate.content)
-
-            # Execute each function call
-            fn_response_parts = []
-            for fc in fn_calls:
-                tool_name = fc.name
-                tool_input = dict(fc.args) if fc.args else {}
-
-                logger.info("tool_call", phase=cfg.phase, tool=tool_name, input_preview=json.dumps(tool_input)[:200])
-                all_tool_calls.append({"name": tool_name, "input": tool_input})
-
-                if cfg.on_event:
-                    await cfg.on_event("tool_call", {
+                if not fn_calls:
+                    break
+
+                # Add model response to contents
+                contents.append(candidate.content)
+
+                # Execute each function call
+                calls: list[ToolCallRecord] = []
+                for fc in fn_calls:
+                    tool_name = fc.name
+                    tool_input = dict(fc.args) if fc.args else {}
+
+                    logger.info("tool_call", phase=cfg.phase, tool=tool_name, input_preview=json_preview(tool_input))
+                    calls.append(ToolCallRecord(tool_name, tool_input))
+
+                    await events.emit("tool_call", {
                         "tool": tool_name, "input": tool_input, "round": round_num,
                     })
+                all_tool_calls.extend(calls)
 
-                result_text = await execute_tool(tool_name, tool_input, cfg.working_dir)
+                results = await execute_tool_uses(calls, cfg.working_dir, phase=cfg.phase)
 
-                if cfg.on_event:
-                    await cfg.on_event("tool_result", {
-                        "tool": tool_name, "result": result_text[:MAX_TOOL_RESULT_EVENT_CHARS], "round": round_num,
+                fn_response_parts = []
+                for call, result_text in zip(calls, results):
+                    await events.emit("tool_result", {
+                        "tool": call.name, "result": result_text[:MAX_TOOL_RESULT_EVENT_CHARS], "round": round_num,
                     })
 
-                if cfg.on_tool_call and not cfg.on_event:
-                    await cfg.on_tool_call(tool_name, tool_input, result_text[:MAX_TOOL_RESULT_CALLBACK_CHARS])
+                    if cfg.on_tool_call and not cfg.on_event:
+                        await cfg.on_tool_call(call.name, call.input, result_text[:MAX_TOOL_RESULT_CALLBACK_CHARS])
 
-                fn_response_parts.append(
-                    types.Part.from_function_response(
-                        name=tool_name,
-                        response={"result": result_text},
+                    fn_response_parts.append(
+                        types.Part.from_function_response(
+                            name=call.name,
+                            response={"result": result_text},
+                        )
                     )
-                )
 
-            contents.append(types.Content(role="user", parts=fn_response_parts))
-
-            # Check for nudge between rounds
-            if cfg.nudge_poll:
-                nudge = await cfg.nudge_poll()
-                if nudge:
-                    if cfg.on_event:
-                        await cfg.on_event("nudge", {"text": nudge})
-                    contents.append(
-                        types.Content(role="user", parts=[types.Part.from_text(text=nudge)])
-                    )
+                contents.append(types.Content(role="user", parts=fn_response_parts))
+
+                # Manage context growth: drop old tool-result bodies past the threshold
+                if input_t + cached_t >= COMPACT_INPUT_TOKEN_THRESHOLD:
+                    elided = _elide_old_tool_results(contents)
+                    if elided:
+                        logger.info(
+                            "tool_results_elided", phase=cfg.phase, round=round_num, elided=elided,
+                        )
+
+                # Check for nudge between rounds
+                if cfg.nudge_poll:
+                    nudge = await cfg.nudge_poll()
+                    if nudge:
+                        await events.emit("nudge", {"text": nudge})
+                        contents.append(
+                            types.Content(role="user", parts=[types.Part.from_text(text=nudge)])
+                        )
+        finally:
+            await events.aclose()
 
-        cost = _compute_model_cost(cfg.model, total_input, total_output)
+        cost = _compute_model_cost(
+            cfg.model, total_input, total_output,
+            cache_read_tokens=total_cache_read, cache_read_rate=GEMINI_CACHE_READ_RATE,
+        )
 
         return _PhaseResult(
             output=final_text,
@@ -216,6 +417,7 @@ class GeminiAgentBackend(BaseAgentBackend):
             round_count=round_num + 1 if contents else 0,
             throttle_count=total_throttle_count,
             throttle_seconds=total_throttle_seconds,
+            cache_read_tokens=total_cache_read,
         )
 
     async def _call_plan(
@@ -229,6 +431,7 @@ class GeminiAgentBackend(BaseAgentBackend):
         """Single Gemini API call for the plan phase — no tools."""
         from google.genai import types
 
+        # A single call: an explicit cache would cost a write and storage for no reuse.
         config = types.GenerateContentConfig(
             system_instruction=system_prompt,
             max_output_tokens=max_tokens,
@@ -246,6 +449,7 @@ class GeminiAgentBackend(BaseAgentBackend):
             ),
             label="plan",
             transient_errors=self._transient_errors,
+            gate=self._rate_gate,
         )
         response = retry_result.value
 
@@ -255,10 +459,11 @@ class GeminiAgentBackend(BaseAgentBackend):
             text_parts = [p.text for p in candidate.content.parts if hasattr(p, "text") and p.text]
             text = "\n".join(text_parts)
 
-        usage = getattr(response, "usage_metadata", None)
-        input_tokens = getattr(usage, "prompt_token_count", 0) or 0 if usage else 0
-        output_tokens = getattr(usage, "candidates_token_count", 0) or 0 if usage else 0
-        cost = _compute_model_cost(model, input_tokens, output_tokens)
+        input_tokens, output_tokens, cached_tokens = _usage_tokens(getattr(response, "usage_metadata", None))
+        cost = _compute_model_cost(
+            model, input_tokens, output_tokens,
+            cache_read_tokens=cached_tokens, cache_read_rate=GEMINI_CACHE_READ_RATE,
+        )
 
         return _PhaseResult(
             output=text,
@@ -274,4 +479,5 @@ class GeminiAgentBackend(BaseAgentBackend):
             round_count=1,
             throttle_count=retry_result.throttle_count,
             throttle_seconds=retry_result.throttle_seconds,
+            cache_read_tokens=cached_tokens,
         )
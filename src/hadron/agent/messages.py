@@ -2,34 +2,36 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable
+
+# SDK content block type -> JSON form. Unknown block types are dropped.
+_BLOCK_SERIALIZERS: dict[str, Callable[[Any], dict[str, Any]]] = {
+    "text": lambda b: {"type": "text", "text": b.text},
+    "tool_use": lambda b: {"type": "tool_use", "id": b.id, "name": b.name, "input": b.input},
+}
+
+
+def _serialize_content(content: Any) -> Any:
+    if isinstance(content, str):
+        return content
+    if not isinstance(content, list):
+        return str(content) if content else ""
+    serialized: list[Any] = []
+    for item in content:
+        if isinstance(item, dict):
+            serialized.append(item)
+        elif hasattr(item, "type"):
+            serializer = _BLOCK_SERIALIZERS.get(item.type)
+            if serializer is not None:
+                serialized.append(serializer(item))
+        else:
+            serialized.append(str(item))
+    return serialized
 
 
 def _serialize_messages(msgs: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Convert messages to JSON-serializable format."""
-    result = []
-    for msg in msgs:
-        entry: dict[str, Any] = {"role": msg["role"]}
-        content = msg.get("content")
-        if isinstance(content, str):
-            entry["content"] = content
-        elif isinstance(content, list):
-            serialized = []
-            for item in content:
-                if isinstance(item, dict):
-                    serialized.append(item)
-                elif hasattr(item, "type"):
-                    if item.type == "text":
-                        serialized.append({"type": "text", "text": item.text})
-                    elif item.type == "tool_use":
-                        serialized.append({
-                            "type": "tool_use", "id": item.id,
-                            "name": item.name, "input": item.input,
-                        })
-                else:
-                    serialized.append(str(item))
-            entry["content"] = serialized
-        else:
-            entry["content"] = str(content) if content else ""
-        result.append(entry)
-    return result
+    return [
+        {"role": msg["role"], "content": _serialize_content(msg.get("content"))}
+        for msg in msgs
+    ]
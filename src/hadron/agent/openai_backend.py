@@ -9,13 +9,14 @@ from typing import Any
 
 import structlog
 
-from hadron.agent.base import OnAgentEvent
+from hadron.agent.base import OnAgentEvent, ToolCallRecord
 from hadron.agent.base_backend import BaseAgentBackend
-from hadron.agent.cost import _compute_model_cost
+from hadron.agent.cost import OPENAI_CACHE_READ_RATE, _compute_model_cost
 from hadron.agent.messages import _serialize_messages
 from hadron.agent.rate_limiter import call_with_retry
-from hadron.agent.tool_loop import ToolLoopConfig, _PhaseResult
-from hadron.agent.tools import execute_tool, make_tools_openai
+from hadron.agent.tool_loop import ToolLoopConfig, _EventEmitter, _PhaseResult, execute_tool_uses
+from hadron.agent.tools import make_tools_openai
+from hadron.utils.text import json_preview
 from hadron.config.limits import (
     COMPACT_INPUT_TOKEN_THRESHOLD,
     MAX_TOOL_RESULT_CALLBACK_CHARS,
@@ -27,6 +28,19 @@ logger = structlog.stdlib.get_logger(__name__)
 _DEFAULT_OPENAI_MODEL = "gpt-4.1"
 
 
+def _usage_tokens(usage: Any) -> tuple[int, int, int]:
+    """Return (uncached_input, output, cached_input) token counts from an OpenAI usage block.
+
+    OpenAI's ``prompt_tokens`` includes cached tokens; split them out so
+    ``input_tokens`` means the same thing across backends.
+    """
+    if not usage:
+        return 0, 0, 0
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached = (getattr(details, "cached_tokens", 0) or 0) if details else 0
+    return usage.prompt_tokens - cached, usage.completion_tokens, cached
+
+
 def _get_openai_transient_errors() -> tuple[type[Exception], ...]:
     """Return OpenAI transient error types (lazy import)."""
     try:
@@ -59,14 +73,9 @@ class OpenAIAgentBackend(BaseAgentBackend):
 
     async def _call_tool_loop(self, cfg: ToolLoopConfig) -> _PhaseResult:
         """Run the OpenAI tool-use loop for a single phase."""
-        tools = make_tools_openai(
-            cfg.tools and [t["name"] for t in cfg.tools] or [],
-            cfg.working_dir,
-        )
-        # Build tools list from the names in the Anthropic-format tools passed in cfg
         # cfg.tools is already in Anthropic format — extract names
         tool_names = [t["name"] for t in cfg.tools] if cfg.tools else []
-        tools = make_tools_openai(tool_names, cfg.working_dir)
+        tools = make_tools_openai(tool_names)
 
         messages: list[dict[str, Any]] = [
             {"role": "system", "content": cfg.system_prompt},
@@ -75,111 +84,117 @@ class OpenAIAgentBackend(BaseAgentBackend):
 
         total_input = 0
         total_output = 0
-        all_tool_calls: list[dict[str, Any]] = []
+        total_cache_read = 0
+        all_tool_calls: list[ToolCallRecord] = []
         final_text = ""
         round_num = 0
         total_throttle_count = 0
         total_throttle_seconds = 0.0
 
-        for round_num in range(cfg.max_rounds):
-            async def _on_retry(wait: int) -> None:
-                if cfg.on_event:
-                    await cfg.on_event("output", {
+        events = _EventEmitter(cfg.on_event)
+        try:
+            for round_num in range(cfg.max_rounds):
+                async def _on_retry(wait: int) -> None:
+                    await events.emit("output", {
                         "text": f"[Rate limited ({cfg.phase}) — waiting {wait}s before retrying...]",
                         "round": round_num,
                     })
 
-            t0 = time.monotonic()
-            retry_result = await call_with_retry(
-                lambda: self._client.chat.completions.create(
-                    model=cfg.model,
-                    max_tokens=cfg.max_tokens,
-                    messages=messages,
-                    tools=tools or None,
-                ),
-                label=cfg.phase,
-                on_retry=_on_retry,
-                transient_errors=self._transient_errors,
-            )
-            response = retry_result.value
-            elapsed = time.monotonic() - t0
-            total_throttle_count += retry_result.throttle_count
-            total_throttle_seconds += retry_result.throttle_seconds
-
-            usage = response.usage
-            input_t = usage.prompt_tokens if usage else 0
-            output_t = usage.completion_tokens if usage else 0
-            if usage:
+                t0 = time.monotonic()
+                retry_result = await call_with_retry(
+                    lambda: self._client.chat.completions.create(
+                        model=cfg.model,
+                        max_tokens=cfg.max_tokens,
+                        messages=messages,
+                        tools=tools or None,
+                    ),
+                    label=cfg.phase,
+                    on_retry=_on_retry,
+                    transient_errors=self._transient_errors,
+                    gate=cfg.rate_gate,
+                )
+                response = retry_result.value
+                elapsed = time.monotonic() - t0
+                total_throttle_count += retry_result.throttle_count
+                total_throttle_seconds += retry_result.throttle_seconds
+
+                input_t, output_t, cached_t = _usage_tokens(response.usage)
                 total_input += input_t
                 total_output += output_t
-            logger.info(
-                "llm_response",
-                phase=cfg.phase,
-                model=cfg.model,
-                round=round_num,
-                input_tokens=input_t,
-                output_tokens=output_t,
-                elapsed_s=round(elapsed, 2),
-            )
-
-            choice = response.choices[0]
-            msg = choice.message
-
-            if msg.content:
-                final_text = msg.content
-                if cfg.on_event:
-                    await cfg.on_event("output", {"text": final_text, "round": round_num})
-
-            # If no tool calls, we're done
-            if not msg.tool_calls or choice.finish_reason == "stop":
-                break
-
-            # Append assistant message with tool calls
-            messages.append(msg.model_dump())
-
-            for tc in msg.tool_calls:
-                tool_name = tc.function.name
-                try:
-                    tool_input = json.loads(tc.function.arguments)
-                except json.JSONDecodeError:
-                    tool_input = {"raw": tc.function.arguments}
-
-                logger.info("tool_call", phase=cfg.phase, tool=tool_name, input_preview=json.dumps(tool_input)[:200])
-                all_tool_calls.append({"name": tool_name, "input": tool_input})
-
-                if cfg.on_event:
-                    await cfg.on_event("tool_call", {
+                total_cache_read += cached_t
+                logger.info(
+                    "llm_response",
+                    phase=cfg.phase,
+                    model=cfg.model,
+                    round=round_num,
+                    input_tokens=input_t,
+                    output_tokens=output_t,
+                    cache_read_tokens=cached_t,
+                    elapsed_s=round(elapsed, 2),
+                )
+
+                choice = response.choices[0]
+                msg = choice.message
+
+                if msg.content:
+                    final_text = msg.content
+                    await events.emit("output", {"text": final_text, "round": round_num})
+
+                # If no tool calls, we're done
+                if not msg.tool_calls or choice.finish_reason == "stop":
+                    break
+
+                # Append assistant message with tool calls
+                messages.append(msg.model_dump())
+
+                calls: list[ToolCallRecord] = []
+                for tc in msg.tool_calls:
+                    tool_name = tc.function.name
+                    try:
+                        tool_input = json.loads(tc.function.arguments)
+                    except json.JSONDecodeError:
+                        tool_input = {"raw": tc.function.arguments}
+
+                    logger.info("tool_call", phase=cfg.phase, tool=tool_name, input_preview=json_preview(tool_input))
+                    calls.append(ToolCallRecord(tool_name, tool_input))
+
+                    await events.emit("tool_call", {
                         "tool": tool_name, "input": tool_input, "round": round_num,
                     })
+                all_tool_calls.extend(calls)
 
-                result_text = await execute_tool(tool_name, tool_input, cfg.working_dir)
+                results = await execute_tool_uses(calls, cfg.working_dir, phase=cfg.phase)
 
-                if cfg.on_event:
-                    await cfg.on_event("tool_result", {
-                        "tool": tool_name, "result": result_text[:MAX_TOOL_RESULT_EVENT_CHARS], "round": round_num,
+                for tc, call, result_text in zip(msg.tool_calls, calls, results):
+                    await events.emit("tool_result", {
+                        "tool": call.name, "result": result_text[:MAX_TOOL_RESULT_EVENT_CHARS], "round": round_num,
                     })
 
-                if cfg.on_tool_call and not cfg.on_event:
-                    await cfg.on_tool_call(tool_name, tool_input, result_text[:MAX_TOOL_RESULT_CALLBACK_CHARS])
-
-                messages.append({
-                    "role": "tool",
-                    "tool_call_id": tc.id,
-                    "content": result_text,
-                })
-
-            if choice.finish_reason == "stop":
-                break
+                    if cfg.on_tool_call and not cfg.on_event:
+                        await cfg.on_tool_call(call.name, call.input, result_text[:MAX_TOOL_RESULT_CALLBACK_CHARS])
 
-            # Check for nudge between rounds
-            if cfg.nudge_poll:
-                nudge = await cfg.nudge_poll()
-                if nudge:
-                    if cfg.on_event:
-                        await cfg.on_event("nudge", {"text": nudge})
-                    messages.append({"role": "user", "content": nudge})
+                    messages.append({
+                        "role": "tool",
+                        "tool_call_id": tc.id,
+                        "content": result_text,
+                    })
 
-        cost = _compute_model_cost(cfg.model, total_input, total_output)
+                if choice.finish_reason == "stop":
+                    break
+
+                # Check for nudge between rounds
+                if cfg.nudge_poll:
+                    nudge = await cfg.nudge_poll()
+                    if nudge:
+                        await events.emit("nudge", {"text": nudge})
+                        messages.append({"role": "user", "content": nudge})
+        finally:
+            await events.aclose()
+
+        cost = _compute_model_cost(
+            cfg.model, total_input, total_output,
+            cache_read_tokens=total_cache_read, cache_read_rate=OPENAI_CACHE_READ_RATE,
+        )
 
         return _PhaseResult(
             output=final_text,
@@ -192,6 +207,7 @@ class OpenAIAgentBackend(BaseAgentBackend):
             round_count=round_num + 1 if messages else 0,
             throttle_count=total_throttle_count,
             throttle_seconds=total_throttle_seconds,
+            cache_read_tokens=total_cache_read,
         )
 
     async def _call_plan(
@@ -216,14 +232,16 @@ class OpenAIAgentBackend(BaseAgentBackend):
             ),
             label="plan",
             transient_errors=self._transient_errors,
+            gate=self._rate_gate,
         )
         response = retry_result.value
         text = response.choices[0].message.content or ""
 
-        usage = response.usage
-        input_tokens = usage.prompt_tokens if usage else 0
-        output_tokens = usage.completion_tokens if usage else 0
-        cost = _compute_model_cost(model, input_tokens, output_tokens)
+        input_tokens, output_tokens, cached_tokens = _usage_tokens(response.usage)
+        cost = _compute_model_cost(
+            model, input_tokens, output_tokens,
+            cache_read_tokens=cached_tokens, cache_read_rate=OPENAI_CACHE_READ_RATE,
+        )
 
         return _PhaseResult(
             output=text,
@@ -239,6 +257,7 @@ class OpenAIAgentBackend(BaseAgentBackend):
             round_count=1,
             throttle_count=retry_result.throttle_count,
             throttle_seconds=retry_result.throttle_seconds,
+            cache_read_tokens=cached_tokens,
         )
 
 
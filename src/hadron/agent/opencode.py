@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Sequence
 from typing import Any
 
 import structlog
 
-from hadron.agent.base import OnAgentEvent
+from hadron.agent.base import OnAgentEvent, ToolCallRecord
 from hadron.agent.base_backend import BaseAgentBackend
 from hadron.agent.tool_loop import ToolLoopConfig, _PhaseResult
 from hadron.config.limits import MAX_TOOL_RESULT_CALLBACK_CHARS
@@ -27,7 +28,7 @@ _HADRON_TO_OPENCODE_TOOLS: dict[str, str] = {
 }
 
 
-def _map_tools(hadron_tools: list[dict]) -> dict[str, bool]:
+def _map_tools(hadron_tools: Sequence[dict]) -> dict[str, bool]:
     """Convert Hadron tool defs to OpenCode tool enable/disable dict."""
     enabled: set[str] = set()
     for tool in hadron_tools:
@@ -177,11 +178,11 @@ class OpenCodeAgentBackend(BaseAgentBackend):
         self,
         session_id: str,
         on_event: OnAgentEvent | None,
-    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]], str, int]:
+    ) -> tuple[list[ToolCallRecord], list[dict[str, Any]], str, int]:
         """Extract tool calls, conversation, output text, and round count."""
         messages = await self._client.session.messages(session_id)
 
-        tool_calls: list[dict[str, Any]] = []
+        tool_calls: list[ToolCallRecord] = []
         conversation: list[dict[str, Any]] = []
         output = ""
         round_count = 0
@@ -210,7 +211,7 @@ class OpenCodeAgentBackend(BaseAgentBackend):
                     if state and hasattr(state, "output"):
                         tool_output = str(state.output) if state.output else ""
 
-                    tool_calls.append({"name": tool_name, "input": tool_input})
+                    tool_calls.append(ToolCallRecord(tool_name, tool_input))
 
                     if on_event:
                         await on_event("tool_use", {
@@ -2,7 +2,29 @@
 
 from __future__ import annotations
 
+import functools
+
 from hadron.agent.base import AgentTask
+from hadron.agent.prompt import _load_template_from_disk
+
+_EXPLORER_FALLBACK = (
+    "You are a codebase explorer. Use list_directory and read_file "
+    "to understand the project structure. Produce a structured summary. "
+    "Do NOT write files or run commands."
+)
+_PLANNER_FALLBACK = (
+    "You are an implementation planner. Analyse the exploration results "
+    "and produce a concrete implementation plan."
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _phase_template(role: str, fallback: str) -> str:
+    """Load a phase template once, caching the fallback when it is missing too."""
+    try:
+        return _load_template_from_disk(role)
+    except FileNotFoundError:
+        return fallback
 
 
 class PhasePromptBuilder:
@@ -10,28 +32,11 @@ class PhasePromptBuilder:
 
     def build_explore_system(self, task: AgentTask) -> str:
         """Build the system prompt for the explore phase."""
-        from hadron.agent.prompt import _load_template_from_disk as _load_template
-
-        try:
-            return _load_template("explorer")
-        except FileNotFoundError:
-            return (
-                "You are a codebase explorer. Use list_directory and read_file "
-                "to understand the project structure. Produce a structured summary. "
-                "Do NOT write files or run commands."
-            )
+        return _phase_template("explorer", _EXPLORER_FALLBACK)
 
     def build_plan_system(self, task: AgentTask) -> str:
         """Build the system prompt for the plan phase."""
-        from hadron.agent.prompt import _load_template_from_disk as _load_template
-
-        try:
-            planner_template = _load_template("planner")
-        except FileNotFoundError:
-            planner_template = (
-                "You are an implementation planner. Analyse the exploration results "
-                "and produce a concrete implementation plan."
-            )
+        planner_template = _phase_template("planner", _PLANNER_FALLBACK)
         # Include the original role system prompt as context for the planner
         return f"{planner_template}\n\n## Original Role Instructions\n\n{task.system_prompt}"
 
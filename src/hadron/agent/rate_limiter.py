@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import random
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from typing import Generic, TypeVar
@@ -10,8 +11,11 @@ from typing import Generic, TypeVar
 import anthropic
 import structlog
 
-# InternalServerError covers 500, 503 (ServiceUnavailableError), and 529 (OverloadedError)
-_ANTHROPIC_TRANSIENT = (anthropic.RateLimitError, anthropic.InternalServerError)
+# InternalServerError covers 500, 503 (ServiceUnavailableError), and 529 (OverloadedError);
+# APIConnectionError covers dropped connections and timeouts (APITimeoutError).
+_ANTHROPIC_TRANSIENT = (
+    anthropic.RateLimitError, anthropic.InternalServerError, anthropic.APIConnectionError,
+)
 
 logger = structlog.stdlib.get_logger(__name__)
 
@@ -44,6 +48,49 @@ def _extract_retry_after(error: Exception) -> float | None:
         return None
 
 
+# 4xx statuses worth retrying. Broad SDK error types (e.g. google-genai's
+# APIError) also cover bad requests, which fail fast instead.
+_RETRYABLE_CLIENT_CODES = frozenset({408, 429})
+
+
+def _is_retryable(error: Exception) -> bool:
+    """False for errors carrying a non-retryable 4xx status as ``.code``."""
+    code = getattr(error, "code", None)
+    return not (isinstance(code, int) and 400 <= code < 500 and code not in _RETRYABLE_CLIENT_CODES)
+
+
+# Status codes meaning the provider wants *every* caller on this key to slow down.
+_GATED_STATUS_CODES = frozenset({429, 529})
+
+
+class RateGate:
+    """Shared back-off window for calls made with the same API client.
+
+    When one call is rate limited, the gate closes until its retry time, so
+    other calls sharing the client hold off too instead of each discovering
+    the limit with a request of its own and then retrying in a herd.
+    """
+
+    def __init__(self) -> None:
+        self._reopen_at = 0.0
+
+    def close_for(self, seconds: float) -> None:
+        """Keep the gate closed for at least *seconds* from now."""
+        self._reopen_at = max(self._reopen_at, asyncio.get_running_loop().time() + seconds)
+
+    async def wait(self) -> float:
+        """Sleep until the gate is open; return the seconds waited."""
+        waited = 0.0
+        loop = asyncio.get_running_loop()
+        while (delay := self._reopen_at - loop.time()) > 0:
+            reopen_at = self._reopen_at
+            await asyncio.sleep(delay)
+            waited += delay
+            if self._reopen_at == reopen_at:  # not extended by another 429 meanwhile
+                break
+        return waited
+
+
 @dataclass
 class RetryResult(Generic[_T]):
     """Result from call_with_retry, including throttle statistics."""
@@ -61,11 +108,14 @@ async def call_with_retry(
     max_retries: int = MAX_RETRIES,
     base_wait: int = BASE_WAIT_SECONDS,
     transient_errors: tuple[type[Exception], ...] | None = None,
+    gate: RateGate | None = None,
 ) -> RetryResult[_T]:
     """Call *api_call* with back-off on transient errors.
 
     Uses the server's ``Retry-After`` header when available, falling back to
-    exponential back-off based on *base_wait*.
+    exponential back-off based on *base_wait* with equal jitter (a random wait
+    in the upper half of the back-off window), so callers throttled together
+    do not retry in lockstep.
 
     Args:
         api_call: Async callable (no args) that makes the API call.
@@ -76,6 +126,8 @@ async def call_with_retry(
         base_wait: Base wait time in seconds for fallback exponential back-off.
         transient_errors: Tuple of exception types to retry on. Defaults to
             Anthropic's RateLimitError and InternalServerError.
+        gate: Optional RateGate shared by calls on the same client. Each
+            attempt waits for it, and a 429/529 closes it for the retry wait.
 
     Returns:
         A RetryResult containing the value returned by *api_call* and throttle stats.
@@ -85,6 +137,8 @@ async def call_with_retry(
     throttle_seconds = 0.0
 
     for attempt in range(max_retries):
+        if gate is not None:
+            throttle_seconds += await gate.wait()
         try:
             value = await api_call()
             return RetryResult(
@@ -93,17 +147,22 @@ async def call_with_retry(
                 throttle_seconds=throttle_seconds,
             )
         except errors_to_catch as e:
-            if attempt == max_retries - 1:
+            if attempt == max_retries - 1 or not _is_retryable(e):
                 raise
-            # Prefer server-provided Retry-After, fall back to linear backoff
+            # Prefer server-provided Retry-After, fall back to jittered exponential backoff
             retry_after = _extract_retry_after(e)
             if retry_after is not None:
                 wait = max(MIN_WAIT_SECONDS, min(retry_after, MAX_WAIT_SECONDS))
             else:
-                wait = min(base_wait * (attempt + 1), MAX_WAIT_SECONDS)
+                backoff = min(base_wait * 2**attempt, MAX_WAIT_SECONDS)
+                wait = max(MIN_WAIT_SECONDS, random.uniform(backoff / 2, backoff))
             throttle_count += 1
             throttle_seconds += wait
             status = getattr(e, "status_code", None) or type(e).__name__
+            # google-genai errors carry the HTTP status as .code
+            http_status = getattr(e, "status_code", None) or getattr(e, "code", None)
+            if gate is not None and http_status in _GATED_STATUS_CODES:
+                gate.close_for(wait)
             logger.warning(
                 "api_retry",
                 status=status,
@@ -2,20 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
 import time
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any, Callable
 
 import structlog
 
-from hadron.agent.base import ModelStats, OnAgentEvent, OnToolCall
+from hadron.agent.base import ModelStats, OnAgentEvent, OnToolCall, ToolCallRecord
 from hadron.agent.compaction import compact_messages, context_reset
 from hadron.agent.cost import _compute_model_cost
-from hadron.agent.messages import _serialize_messages
-from hadron.agent.rate_limiter import call_with_retry
-from hadron.agent.tools import execute_tool
+from hadron.agent.messages import _serialize_content
+from hadron.agent.rate_limiter import RateGate, call_with_retry
+from hadron.agent.tools import _ALL_TOOL_DEFS, READ_ONLY_TOOLS, execute_tool
 from hadron.observability.tracing import set_span_attributes, span
+from hadron.utils.text import json_preview
 from hadron.config.limits import (
     COMPACT_INPUT_TOKEN_THRESHOLD,
     CONTEXT_RESET_TOKEN_THRESHOLD,
@@ -33,7 +37,7 @@ class ToolLoopConfig:
     model: str
     system_prompt: str
     user_prompt: str
-    tools: list[dict]
+    tools: Sequence[dict]
     working_dir: str
     max_rounds: int
     max_tokens: int
@@ -41,6 +45,7 @@ class ToolLoopConfig:
     on_tool_call: OnToolCall | None = None
     nudge_poll: Callable[[], Any] | None = None
     phase: str = ""
+    rate_gate: RateGate | None = None
 
 
 @dataclass
@@ -52,7 +57,7 @@ class _PhaseResult:
     input_tokens: int
     output_tokens: int
     cost_usd: float
-    tool_calls: list[dict[str, Any]]
+    tool_calls: list[ToolCallRecord]
     conversation: list[dict[str, Any]]
     round_count: int
     throttle_count: int = 0
@@ -73,6 +78,51 @@ class _PhaseResult:
         )
 
 
+class _EventEmitter:
+    """Deliver loop events from a background task so handlers overlap the loop's own work.
+
+    Events are delivered in order by a single drain task and none are dropped:
+    once ``max_pending`` are queued, ``emit`` waits for the handler to catch
+    up. A failing handler is logged rather than failing the loop. Instances
+    are themselves an ``OnAgentEvent`` so they can be handed to helpers.
+    """
+
+    def __init__(self, on_event: OnAgentEvent | None, max_pending: int = 32) -> None:
+        self._on_event = on_event
+        self._queue: asyncio.Queue[tuple[str, dict[str, Any]] | None] = asyncio.Queue(max_pending)
+        self._task: asyncio.Task[None] | None = None
+
+    def __bool__(self) -> bool:
+        return self._on_event is not None
+
+    async def __call__(self, event_type: str, data: dict[str, Any]) -> None:
+        await self.emit(event_type, data)
+
+    async def emit(self, event_type: str, data: dict[str, Any]) -> None:
+        if self._on_event is None:
+            return
+        if self._task is None:
+            self._task = asyncio.create_task(self._drain())
+        await self._queue.put((event_type, data))
+
+    async def _drain(self) -> None:
+        assert self._on_event is not None
+        while (item := await self._queue.get()) is not None:
+            event_type, data = item
+            try:
+                await self._on_event(event_type, data)
+            except Exception:
+                logger.warning("agent_event_handler_failed", event_type=event_type, exc_info=True)
+
+    async def aclose(self) -> None:
+        """Wait until every queued event has been delivered, then stop the drain task."""
+        if self._task is None:
+            return
+        task, self._task = self._task, None
+        await self._queue.put(None)
+        await task
+
+
 def parse_response_blocks(response: Any) -> tuple[list[str], list[Any]]:
     """Extract text parts and tool_use blocks from an API response."""
     text_parts = []
@@ -90,15 +140,137 @@ def cacheable_system(system_prompt: str) -> list[dict[str, Any]]:
     return [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
 
 
-def cacheable_tools(tools: list[dict]) -> list[dict]:
-    """Return tools with cache_control on the last entry."""
+def cacheable_tools(tools: Sequence[dict]) -> list[dict]:
+    """Return tools with cache_control on the last entry.
+
+    Tool sets built from the built-in definitions are a small closed set, so
+    their request-ready lists are built once per tool set and shared. Treat
+    the returned list as read-only.
+    """
     if not tools:
-        return tools
+        return []
+    names = tuple(t.get("name") for t in tools)
+    if all(_ALL_TOOL_DEFS.get(n) is t for n, t in zip(names, tools)):
+        return _cacheable_builtin_tools(names)
+    return _with_cache_control(tools)
+
+
+def _with_cache_control(tools: Sequence[dict]) -> list[dict]:
     result = [dict(t) for t in tools]
     result[-1] = {**result[-1], "cache_control": {"type": "ephemeral"}}
     return result
 
 
+@functools.lru_cache(maxsize=32)
+def _cacheable_builtin_tools(names: tuple[str, ...]) -> list[dict]:
+    return _with_cache_control([_ALL_TOOL_DEFS[n] for n in names])
+
+
+def cacheable_messages(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Return a request view of *messages* with a rolling cache breakpoint.
+
+    Marks the last content block of the final turn so the next round reads the
+    whole conversation so far from cache. The stored history is left untouched,
+    so the breakpoint moves forward each round instead of accumulating
+    (system + tools + this one stays within the API's 4-breakpoint limit).
+    """
+    if not messages:
+        return messages
+    last = messages[-1]
+    content = last["content"]
+    if isinstance(content, str):
+        blocks: list[Any] = [{"type": "text", "text": content}]
+    else:
+        blocks = list(content)
+    if not blocks or not isinstance(blocks[-1], dict):
+        return messages
+    blocks[-1] = {**blocks[-1], "cache_control": {"type": "ephemeral"}}
+    return [*messages[:-1], {**last, "content": blocks}]
+
+
+class ToolResultCache:
+    """Per-phase memo of read-only tool results.
+
+    Models often re-read the same file or re-list the same directory within
+    a phase. Results are keyed by tool name and canonical input; any other
+    tool call may change the worktree, so it clears the whole cache.
+    """
+
+    def __init__(self) -> None:
+        self._results: dict[tuple[str, str], str] = {}
+        self.stats = {"hits": 0, "misses": 0}
+
+    @staticmethod
+    def _key(name: str, tool_input: dict[str, Any]) -> tuple[str, str]:
+        return name, json.dumps(tool_input, sort_keys=True)
+
+    def get(self, name: str, tool_input: dict[str, Any]) -> str | None:
+        result = self._results.get(self._key(name, tool_input))
+        self.stats["hits" if result is not None else "misses"] += 1
+        return result
+
+    def put(self, name: str, tool_input: dict[str, Any], result: str) -> None:
+        self._results[self._key(name, tool_input)] = result
+
+    def clear(self) -> None:
+        self._results.clear()
+
+
+async def _execute_timed(tu: Any, working_dir: str, phase: str) -> str:
+    with span(f"tool.{tu.name}", {"tool": tu.name}):
+        t0 = time.monotonic()
+        result_text = await execute_tool(tu.name, tu.input, working_dir)
+        logger.info(
+            "tool_result",
+            phase=phase,
+            tool=tu.name,
+            result_len=len(result_text),
+            elapsed_s=round(time.monotonic() - t0, 2),
+        )
+    return result_text
+
+
+async def execute_tool_uses(
+    tool_uses: Sequence[Any], working_dir: str, phase: str = "",
+    cache: ToolResultCache | None = None,
+) -> list[str]:
+    """Execute one response's tool_use blocks, returning results in the same order.
+
+    Consecutive read-only calls run concurrently; any other call waits for
+    everything before it, so e.g. a write followed by a test command keeps
+    its order. With a *cache*, repeated read-only calls are served from it.
+    """
+    results: list[str] = []
+    batch: list[Any] = []
+
+    async def _read(tu: Any) -> str:
+        if cache is not None and (cached := cache.get(tu.name, tu.input)) is not None:
+            logger.info("tool_result_cached", phase=phase, tool=tu.name)
+            return cached
+        result_text = await _execute_timed(tu, working_dir, phase)
+        if cache is not None:
+            cache.put(tu.name, tu.input, result_text)
+        return result_text
+
+    async def _flush() -> None:
+        if len(batch) == 1:
+            results.append(await _read(batch[0]))
+        elif batch:
+            results.extend(await asyncio.gather(*(_read(tu) for tu in batch)))
+        batch.clear()
+
+    for tu in tool_uses:
+        if tu.name in READ_ONLY_TOOLS:
+            batch.append(tu)
+            continue
+        await _flush()
+        if cache is not None:
+            cache.clear()
+        results.append(await _execute_timed(tu, working_dir, phase))
+    await _flush()
+    return results
+
+
 async def run_tool_loop(
     client: Any,
     cfg: ToolLoopConfig,
@@ -117,7 +289,7 @@ async def run_tool_loop(
     total_output = 0
     total_cache_creation = 0
     total_cache_read = 0
-    all_tool_calls: list[dict[str, Any]] = []
+    all_tool_calls: list[ToolCallRecord] = []
     final_text = ""
     round_num = 0
     total_throttle_count = 0
@@ -126,125 +298,120 @@ async def run_tool_loop(
     system = cacheable_system(cfg.system_prompt)
     tools = cacheable_tools(cfg.tools)
 
-    for round_num in range(cfg.max_rounds):
-        # API call with rate-limit retry
-        async def _on_retry(wait: int) -> None:
-            if cfg.on_event:
-                await cfg.on_event("output", {
+    # Handlers run off the loop's critical path; everything is delivered before returning.
+    events = _EventEmitter(cfg.on_event)
+    # The legacy per-tool callback only fires when there is no event handler
+    on_tool_call = cfg.on_tool_call if not cfg.on_event else None
+    tool_cache = ToolResultCache()
+    try:
+        for round_num in range(cfg.max_rounds):
+            # API call with rate-limit retry
+            async def _on_retry(wait: int) -> None:
+                await events.emit("output", {
                     "text": f"[Rate limited ({cfg.phase}) — waiting {wait}s before retrying...]",
                     "round": round_num,
                 })
 
-        with span(f"llm.{cfg.phase}", {"model": cfg.model, "round": round_num}) as llm_span:
-            t0 = time.monotonic()
-            retry_result = await call_with_retry(
-                lambda: client.messages.create(
-                    model=cfg.model,
-                    max_tokens=cfg.max_tokens,
-                    system=system,
-                    tools=tools,
-                    messages=messages,
-                ),
-                label=cfg.phase,
-                on_retry=_on_retry,
-            )
-            response = retry_result.value
-            elapsed = time.monotonic() - t0
-            set_span_attributes(llm_span, {
-                "input_tokens": response.usage.input_tokens,
-                "output_tokens": response.usage.output_tokens,
-            })
-            logger.info(
-                "llm_response",
-                phase=cfg.phase,
-                model=cfg.model,
-                round=round_num,
-                input_tokens=response.usage.input_tokens,
-                output_tokens=response.usage.output_tokens,
-                elapsed_s=round(elapsed, 2),
-            )
-        total_throttle_count += retry_result.throttle_count
-        total_throttle_seconds += retry_result.throttle_seconds
-
-        total_input += response.usage.input_tokens
-        total_output += response.usage.output_tokens
-        total_cache_creation += getattr(response.usage, "cache_creation_input_tokens", 0) or 0
-        total_cache_read += getattr(response.usage, "cache_read_input_tokens", 0) or 0
-
-        text_parts, tool_uses = parse_response_blocks(response)
-
-        if text_parts:
-            final_text = "\n".join(text_parts)
-            if cfg.on_event:
-                await cfg.on_event("output", {"text": final_text, "round": round_num})
-
-        # If no tool calls, we're done
-        if not tool_uses or response.stop_reason == "end_turn":
-            break
-
-        # Execute tools and build the response
-        messages.append({"role": "assistant", "content": response.content})
-
-        tool_results = []
-        for tu in tool_uses:
-            logger.info("tool_call", phase=cfg.phase, tool=tu.name, input_preview=json.dumps(tu.input)[:200])
-            all_tool_calls.append({"name": tu.name, "input": tu.input})
-
-            if cfg.on_event:
-                await cfg.on_event("tool_call", {
-                    "tool": tu.name, "input": tu.input, "round": round_num,
+            request_messages = cacheable_messages(messages)
+            with span(f"llm.{cfg.phase}", {"model": cfg.model, "round": round_num}) as llm_span:
+                t0 = time.monotonic()
+                retry_result = await call_with_retry(
+                    lambda: client.messages.create(
+                        model=cfg.model,
+                        max_tokens=cfg.max_tokens,
+                        system=system,
+                        tools=tools,
+                        messages=request_messages,
+                    ),
+                    label=cfg.phase,
+                    on_retry=_on_retry,
+                    gate=cfg.rate_gate,
+                )
+                response = retry_result.value
+                elapsed = time.monotonic() - t0
+                set_span_attributes(llm_span, {
+                    "input_tokens": response.usage.input_tokens,
+                    "output_tokens": response.usage.output_tokens,
                 })
-
-            with span(f"tool.{tu.name}", {"tool": tu.name}):
-                t0_tool = time.monotonic()
-                result_text = await execute_tool(tu.name, tu.input, cfg.working_dir)
                 logger.info(
-                    "tool_result",
+                    "llm_response",
                     phase=cfg.phase,
-                    tool=tu.name,
-                    result_len=len(result_text),
-                    elapsed_s=round(time.monotonic() - t0_tool, 2),
+                    model=cfg.model,
+                    round=round_num,
+                    input_tokens=response.usage.input_tokens,
+                    output_tokens=response.usage.output_tokens,
+                    cache_read_tokens=getattr(response.usage, "cache_read_input_tokens", 0) or 0,
+                    elapsed_s=round(elapsed, 2),
                 )
+            total_throttle_count += retry_result.throttle_count
+            total_throttle_seconds += retry_result.throttle_seconds
 
-            if cfg.on_event:
-                await cfg.on_event("tool_result", {
-                    "tool": tu.name, "result": result_text[:MAX_TOOL_RESULT_EVENT_CHARS], "round": round_num,
-                })
+            total_input += response.usage.input_tokens
+            total_output += response.usage.output_tokens
+            total_cache_creation += getattr(response.usage, "cache_creation_input_tokens", 0) or 0
+            total_cache_read += getattr(response.usage, "cache_read_input_tokens", 0) or 0
 
-            if cfg.on_tool_call and not cfg.on_event:
-                await cfg.on_tool_call(tu.name, tu.input, result_text[:MAX_TOOL_RESULT_CALLBACK_CHARS])
+            text_parts, tool_uses = parse_response_blocks(response)
 
-            tool_results.append({
-                "type": "tool_result",
-                "tool_use_id": tu.id,
-                "content": result_text,
-            })
+            if text_parts:
+                final_text = "\n".join(text_parts)
+                await events.emit("output", {"text": final_text, "round": round_num})
 
-        messages.append({"role": "user", "content": tool_results})
+            # No tool calls, or the model ended its turn: done, no extra round needed
+            if not tool_uses or response.stop_reason == "end_turn":
+                break
 
-        if response.stop_reason == "end_turn":
-            break
+            # Execute tools and build the response
+            # Stored in JSON form once, rather than re-walking SDK objects on every later request
+            messages.append({"role": "assistant", "content": _serialize_content(response.content)})
 
-        # Manage context growth: reset at high threshold, compact at lower
-        if response.usage.input_tokens >= CONTEXT_RESET_TOKEN_THRESHOLD and len(messages) >= 3:
-            messages = await context_reset(
-                client, messages,
-                original_task=cfg.user_prompt,
-                phase=cfg.phase,
-                on_event=cfg.on_event,
-            )
-        elif response.usage.input_tokens >= COMPACT_INPUT_TOKEN_THRESHOLD and len(messages) >= 5:
-            messages = await compact_messages(
-                client, messages, phase=cfg.phase, on_event=cfg.on_event,
+            for tu in tool_uses:
+                logger.info("tool_call", phase=cfg.phase, tool=tu.name, input_preview=json_preview(tu.input))
+                all_tool_calls.append(ToolCallRecord(tu.name, tu.input))
+                if events:
+                    await events.emit("tool_call", {"tool": tu.name, "input": tu.input, "round": round_num})
+
+            results = await execute_tool_uses(
+                tool_uses, cfg.working_dir, phase=cfg.phase, cache=tool_cache,
             )
 
-        # Check for nudge between rounds
-        if cfg.nudge_poll:
-            nudge = await cfg.nudge_poll()
-            if nudge:
-                if cfg.on_event:
-                    await cfg.on_event("nudge", {"text": nudge})
-                messages.append({"role": "user", "content": nudge})
+            if events:
+                for tu, result_text in zip(tool_uses, results):
+                    await events.emit("tool_result", {
+                        "tool": tu.name, "result": result_text[:MAX_TOOL_RESULT_EVENT_CHARS], "round": round_num,
+                    })
+            elif on_tool_call:
+                for tu, result_text in zip(tool_uses, results):
+                    await on_tool_call(tu.name, tu.input, result_text[:MAX_TOOL_RESULT_CALLBACK_CHARS])
+
+            messages.append({"role": "user", "content": [
+                {"type": "tool_result", "tool_use_id": tu.id, "content": result_text}
+                for tu, result_text in zip(tool_uses, results)
+            ]})
+
+            # Manage context growth: reset at high threshold, compact at lower
+            if response.usage.input_tokens >= CONTEXT_RESET_TOKEN_THRESHOLD and len(messages) >= 3:
+                messages = await context_reset(
+                    client, messages,
+                    original_task=cfg.user_prompt,
+                    phase=cfg.phase,
+                    on_event=events or None,
+                )
+            elif response.usage.input_tokens >= COMPACT_INPUT_TOKEN_THRESHOLD and len(messages) >= 5:
+                messages = await compact_messages(
+                    client, messages, phase=cfg.phase, on_event=events or None,
+                )
+
+            # Check for nudge between rounds
+            if cfg.nudge_poll:
+                nudge = await cfg.nudge_poll()
+                if nudge:
+                    await events.emit("nudge", {"text": nudge})
+                    messages.append({"role": "user", "content": nudge})
+    finally:
+        await events.aclose()
+    if tool_cache.stats["hits"]:
+        logger.info("tool_cache_stats", phase=cfg.phase, **tool_cache.stats)
 
     cost = _compute_model_cost(
         cfg.model, total_input, total_output,
@@ -259,7 +426,9 @@ async def run_tool_loop(
         output_tokens=total_output,
         cost_usd=cost,
         tool_calls=all_tool_calls,
-        conversation=_serialize_messages(messages),
+        # Every stored turn is already in JSON form (assistant turns are
+        # serialized on append), so the history is returned without a copy.
+        conversation=messages,
         round_count=round_num + 1 if messages else 0,
         throttle_count=total_throttle_count,
         throttle_seconds=total_throttle_seconds,
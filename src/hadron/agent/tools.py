@@ -7,7 +7,12 @@ environment scrubbing, and tool dispatch.
 from __future__ import annotations
 
 import asyncio
+import functools
+import heapq
+import operator
 import os
+import shutil
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
@@ -15,7 +20,7 @@ import structlog
 
 from hadron.config.limits import MAX_COMMAND_OUTPUT_CHARS, MAX_READ_FILE_CHARS
 from hadron.security.validators import sanitize_agent_command, validate_agent_command
-from hadron.utils.text import truncate
+from hadron.utils.text import squeeze_output, truncate
 from hadron.utils.venv import find_worktree_venv
 
 logger = structlog.stdlib.get_logger(__name__)
@@ -98,48 +103,63 @@ _ALL_TOOL_DEFS: dict[str, dict[str, Any]] = {
 }
 
 
-def make_tools(allowed: list[str], working_dir: str | None) -> list[dict]:
-    """Build Anthropic tool definitions for the allowed tool set."""
-    return [_ALL_TOOL_DEFS[name] for name in allowed if name in _ALL_TOOL_DEFS]
+def make_tools(allowed: Iterable[str]) -> tuple[dict, ...]:
+    """Build Anthropic tool definitions for the allowed tool set.
+
+    Memoized per tool set — the returned definitions are shared, treat them
+    as read-only.
+    """
+    return _make_tools(tuple(allowed))
+
+
+@functools.lru_cache(maxsize=32)
+def _make_tools(allowed: tuple[str, ...]) -> tuple[dict, ...]:
+    return tuple(_ALL_TOOL_DEFS[name] for name in allowed if name in _ALL_TOOL_DEFS)
 
 
-def make_tools_openai(allowed: list[str], working_dir: str | None) -> list[dict]:
+def make_tools_openai(allowed: Iterable[str]) -> list[dict]:
     """Build OpenAI-format tool definitions for the allowed tool set.
 
-    Returns a list of ``{"type": "function", "function": {...}}`` dicts.
+    Returns a list of ``{"type": "function", "function": {...}}`` dicts. The
+    definitions are memoized per tool set and shared; only the list is fresh.
     """
-    result = []
-    for name in allowed:
-        defn = _ALL_TOOL_DEFS.get(name)
-        if defn is None:
-            continue
-        result.append({
+    return list(_make_tools_openai(tuple(allowed)))
+
+
+@functools.lru_cache(maxsize=32)
+def _make_tools_openai(allowed: tuple[str, ...]) -> tuple[dict, ...]:
+    return tuple(
+        {
             "type": "function",
             "function": {
                 "name": defn["name"],
                 "description": defn["description"],
                 "parameters": defn["input_schema"],
             },
-        })
-    return result
+        }
+        for defn in _make_tools(allowed)
+    )
 
 
-def make_tools_gemini(allowed: list[str], working_dir: str | None) -> list[dict]:
+def make_tools_gemini(allowed: Iterable[str]) -> list[dict]:
     """Build Gemini-format function declarations for the allowed tool set.
 
     Returns a list of dicts suitable for ``Tool(function_declarations=[...])``.
+    The declarations are memoized per tool set and shared; only the list is fresh.
     """
-    result = []
-    for name in allowed:
-        defn = _ALL_TOOL_DEFS.get(name)
-        if defn is None:
-            continue
-        result.append({
+    return list(_make_tools_gemini(tuple(allowed)))
+
+
+@functools.lru_cache(maxsize=32)
+def _make_tools_gemini(allowed: tuple[str, ...]) -> tuple[dict, ...]:
+    return tuple(
+        {
             "name": defn["name"],
             "description": defn["description"],
             "parameters": defn["input_schema"],
-        })
-    return result
+        }
+        for defn in _make_tools(allowed)
+    )
 
 
 # ------------------------------------------------------------------
@@ -147,13 +167,28 @@ def make_tools_gemini(allowed: list[str], working_dir: str | None) -> list[dict]
 # ------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=32)
+def _resolved_abs_root(working_dir: str) -> Path:
+    return Path(working_dir).resolve()
+
+
+def _resolved_root(working_dir: str) -> Path:
+    """Resolve a working directory, memoizing absolute ones for an agent's whole run.
+
+    A relative path depends on the current directory, so it is resolved afresh.
+    """
+    if os.path.isabs(working_dir):
+        return _resolved_abs_root(working_dir)
+    return Path(working_dir).resolve()
+
+
 def safe_resolve(working_dir: str, user_path: str) -> Path:
     """Resolve a user-provided path and ensure it stays within working_dir.
 
     Raises ValueError if the resolved path escapes the working directory,
     or if any component of the path is a symlink pointing outside the root.
     """
-    root = Path(working_dir).resolve()
+    root = _resolved_root(working_dir)
     resolved = (root / user_path).resolve()
     if not resolved.is_relative_to(root):
         raise ValueError(
@@ -201,7 +236,9 @@ def _execute_read_file(working_dir: str, input_data: dict[str, Any]) -> str:
     path = safe_resolve(working_dir, input_data["path"])
     if not path.is_file():
         return f"Error: File not found: {input_data['path']}"
-    content = path.read_text()
+    # Read at most one char past the cap so huge files are never loaded whole.
+    with path.open() as f:
+        content = f.read(MAX_READ_FILE_CHARS + 1)
     return truncate(content, MAX_READ_FILE_CHARS)
 
 
@@ -212,14 +249,18 @@ _INSTALL_TRIGGERS: dict[str, list[str]] = {
 }
 
 
+def _write_text(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
 async def _execute_write_file(working_dir: str, input_data: dict[str, Any]) -> str:
     """Write content to a file, creating parent directories as needed.
 
     Auto-runs dependency install when a manifest file is written.
     """
     path = safe_resolve(working_dir, input_data["path"])
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(input_data["content"])
+    await asyncio.to_thread(_write_text, path, input_data["content"])
     msg = f"File written: {input_data['path']}"
 
     filename = path.name
@@ -243,7 +284,8 @@ async def _execute_write_file(working_dir: str, input_data: dict[str, Any]) -> s
             if proc.returncode == 0:
                 msg += f"\n(auto-installed {filename} dependencies)"
             else:
-                output = stdout.decode(errors="replace")[-300:]
+                # Decode only the tail (4 bytes/char covers any UTF-8) instead of the whole log
+                output = stdout[-1200:].decode(errors="replace")[-300:]
                 msg += f"\n(dependency install failed, exit {proc.returncode}: {output})"
         except asyncio.TimeoutError:
             proc.kill()
@@ -258,14 +300,56 @@ def _execute_list_directory(working_dir: str, input_data: dict[str, Any]) -> str
     dir_path = safe_resolve(working_dir, input_data.get("path", "."))
     if not dir_path.is_dir():
         return f"Error: Not a directory: {input_data.get('path', '.')}"
-    entries = sorted(dir_path.iterdir())
-    lines = []
-    for e in entries[:200]:
-        prefix = "d " if e.is_dir() else "f "
-        lines.append(f"{prefix}{e.name}")
+    # First 200 names in sorted order without sorting (or wrapping) every entry
+    with os.scandir(dir_path) as it:
+        entries = heapq.nsmallest(200, it, key=operator.attrgetter("name"))
+    lines = [f"{'d ' if e.is_dir() else 'f '}{e.name}" for e in entries]
     return "\n".join(lines) if lines else "(empty directory)"
 
 
+# Bytes of command output kept in memory: enough for MAX_COMMAND_OUTPUT_CHARS
+# of 4-byte UTF-8 plus one more char, so a cut stream always decodes past the cap.
+_COMMAND_OUTPUT_BYTES = MAX_COMMAND_OUTPUT_CHARS * 4 + 4
+
+
+async def _collect_output(proc: asyncio.subprocess.Process) -> bytes:
+    """Drain *proc*'s stdout to EOF and wait for exit, keeping only the head.
+
+    The rest is read and discarded rather than killing the process, so the
+    command still runs to completion and reports its real exit code.
+    """
+    buf = bytearray()
+    while chunk := await proc.stdout.read(65536):
+        if len(buf) < _COMMAND_OUTPUT_BYTES:
+            buf += chunk[:_COMMAND_OUTPUT_BYTES - len(buf)]
+    await proc.wait()
+    return bytes(buf)
+
+
+# Characters with shell meaning; commands free of them are exec'd without /bin/sh.
+_SHELL_METACHARS = frozenset("|&;<>()$`\\\"'*?[]{}~#\n")
+
+
+async def _spawn_command(cmd: str, working_dir: str, env: dict[str, str]) -> asyncio.subprocess.Process:
+    """Start *cmd* with stdout+stderr piped, skipping the shell when it adds nothing."""
+    argv = cmd.split() if _SHELL_METACHARS.isdisjoint(cmd) else []
+    if argv and "/" not in argv[0] and shutil.which(argv[0], path=env.get("PATH")):
+        return await asyncio.create_subprocess_exec(
+            *argv,
+            cwd=working_dir,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            env=env,
+        )
+    return await asyncio.create_subprocess_shell(
+        cmd,
+        cwd=working_dir,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        env=env,
+    )
+
+
 async def _execute_run_command(working_dir: str, input_data: dict[str, Any]) -> str:
     """Run a shell command with safety validation and output truncation."""
     cmd = input_data["command"]
@@ -288,20 +372,14 @@ async def _execute_run_command(working_dir: str, input_data: dict[str, Any]) ->
         child_bin = os.path.join(working_dir, child, "node_modules", ".bin")
         if os.path.isdir(child_bin):
             env["PATH"] = child_bin + os.pathsep + env.get("PATH", "")
-    proc = await asyncio.create_subprocess_shell(
-        cmd,
-        cwd=working_dir,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.STDOUT,
-        env=env,
-    )
+    proc = await _spawn_command(cmd, working_dir, env)
     try:
-        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=120)
+        stdout = await asyncio.wait_for(_collect_output(proc), timeout=120)
     except asyncio.TimeoutError:
         proc.kill()
         await proc.wait()
         return "Error: Command timed out after 120s (process killed)"
-    output = stdout.decode(errors="replace")
+    output = squeeze_output(stdout.decode(errors="replace"))
     output = truncate(output, MAX_COMMAND_OUTPUT_CHARS)
     return f"Exit code: {proc.returncode}\n{output}"
 
@@ -324,18 +402,23 @@ _TOOL_DISPATCH: dict[str, Any] = {
 }
 
 
-async def execute_tool(
-    name: str, input_data: dict[str, Any], working_dir: str
-) -> str:
-    """Execute a tool call and return the result string."""
+# Tools with no side effects — safe to run concurrently with each other.
+READ_ONLY_TOOLS = frozenset({"read_file", "list_directory"})
+
+
+async def execute_tool(name: str, input_data: dict[str, Any], working_dir: str) -> str:
+    """Execute a tool call and return the result string.
+
+    Synchronous (filesystem) handlers run in a worker thread, so slow disk
+    I/O never blocks the event loop and concurrent calls overlap.
+    """
     handler = _TOOL_DISPATCH.get(name)
     if handler is None:
         return f"Error: Unknown tool: {name}"
     try:
-        result = handler(working_dir, input_data)
-        if asyncio.iscoroutine(result):
-            return await result
-        return result
+        if asyncio.iscoroutinefunction(handler):
+            return await handler(working_dir, input_data)
+        return await asyncio.to_thread(handler, working_dir, input_data)
     except ValueError as e:
         return f"Error: {e}"
     except OSError as e:
@@ -12,6 +12,8 @@ _FIELD_MAP = {
     "postgres_url": "POSTGRES_URL",
     "postgres_url_sync": "POSTGRES_URL_SYNC",
     "redis_url": "REDIS_URL",
+    "db_pool_size": "DB_POOL_SIZE",
+    "db_max_overflow": "DB_MAX_OVERFLOW",
     "anthropic_api_key": "ANTHROPIC_API_KEY",
     "agent_backend": "AGENT_BACKEND",
     "gemini_api_key": "GEMINI_API_KEY",
@@ -25,17 +27,17 @@ _FIELD_MAP = {
     "log_format": "LOG_FORMAT",
     "otel_enabled": "OTEL_ENABLED",
     "otlp_endpoint": "OTLP_ENDPOINT",
+    "llm_cache_enabled": "LLM_CACHE",
     "embed_sse": "EMBED_SSE",
     "embed_orchestrator": "EMBED_ORCHESTRATOR",
 }
 
 
+# (field name, full env var name), resolved once at import.
+_ENV_KEYS = tuple((field, f"{_ENV_PREFIX}{suffix}") for field, suffix in _FIELD_MAP.items())
+
+
 def load_bootstrap_config() -> BootstrapConfig:
     """Build BootstrapConfig from env vars (prefixed HADRON_) with defaults."""
-    overrides: dict[str, str] = {}
-    for field_name, env_suffix in _FIELD_MAP.items():
-        env_key = f"{_ENV_PREFIX}{env_suffix}"
-        val = os.environ.get(env_key)
-        if val is not None:
-            overrides[field_name] = val
-    return BootstrapConfig(**overrides)
+    env = os.environ
+    return BootstrapConfig(**{field: env[key] for field, key in _ENV_KEYS if key in env})
@@ -26,11 +26,18 @@ class JobSpawner(Protocol):
 
 
 class SubprocessJobSpawner:
-    """Spawns workers as local subprocesses. For local dev and testing."""
+    """Spawns workers as local subprocesses. For local dev and testing.
 
-    def __init__(self, redis: Any = None) -> None:
+    At most ``max_workers`` run at once; further spawns are queued and start
+    as running workers exit, so a burst of intake requests cannot fork an
+    unbounded number of interpreters.
+    """
+
+    def __init__(self, redis: Any = None, max_workers: int | None = None) -> None:
         self._processes: dict[str, asyncio.subprocess.Process] = {}
         self._redis = redis
+        self._max_workers = max_workers or int(os.environ.get("HADRON_MAX_WORKERS", "8"))
+        self._slots = asyncio.Semaphore(self._max_workers)
 
     async def spawn(
         self, cr_id: str, repo_url: str, repo_name: str = "",
@@ -41,25 +48,46 @@ class SubprocessJobSpawner:
             repo_name = extract_repo_name(repo_url)
         worker_key = f"{cr_id}:{repo_name}"
         logger.info("Spawning subprocess worker for CR %s, repo %s", cr_id, repo_name)
-        env = dict(os.environ)
-        env.update(inject_trace_context())
-        if extra_env:
-            env.update(extra_env)
-        proc = await asyncio.create_subprocess_exec(
+        # Inherit the parent environment as-is unless there is something to add.
+        overrides = {**inject_trace_context(), **(extra_env or {})}
+        env = {**os.environ, **overrides} if overrides else None
+        argv = [
             sys.executable, "-m", "hadron.worker.main",
             f"--cr-id={cr_id}",
             f"--repo-url={repo_url}",
             f"--repo-name={repo_name}",
             f"--default-branch={default_branch}",
-            env=env,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.STDOUT,
-        )
+        ]
+        if self._slots.locked():
+            logger.info("worker_queued", worker=worker_key, max_workers=self._max_workers)
+            asyncio.create_task(self._launch_queued(worker_key, argv, env))
+            return
+        await self._launch(worker_key, argv, env)
+
+    async def _launch(self, worker_key: str, argv: list[str], env: dict[str, str] | None) -> None:
+        """Wait for a free slot, then start the worker. The slot is released when it exits."""
+        await self._slots.acquire()
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *argv,
+                env=env,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+            )
+        except BaseException:
+            self._slots.release()
+            raise
         self._processes[worker_key] = proc
 
         # Fire and forget — log output in background
         asyncio.create_task(self._log_output(worker_key, proc))
 
+    async def _launch_queued(self, worker_key: str, argv: list[str], env: dict[str, str] | None) -> None:
+        try:
+            await self._launch(worker_key, argv, env)
+        except Exception as e:
+            logger.error("Error spawning queued worker %s: %s", worker_key, e)
+
     async def _log_output(self, worker_key: str, proc: asyncio.subprocess.Process) -> None:
         """Drain worker stdout to the controller log.
 
@@ -78,7 +106,11 @@ class SubprocessJobSpawner:
         except Exception as e:
             logger.error("Error logging worker output for %s: %s", worker_key, e)
         finally:
-            self._processes.pop(worker_key, None)
+            # Runs once per launched process, so this frees exactly its slot. A
+            # later spawn for the same key may have replaced the dict entry.
+            self._slots.release()
+            if self._processes.get(worker_key) is proc:
+                del self._processes[worker_key]
 
 
 class K8sJobSpawner:
@@ -93,24 +125,33 @@ class K8sJobSpawner:
         self._namespace = namespace
         self._worker_image = worker_image or os.environ.get("HADRON_WORKER_IMAGE", "hadron-worker:latest")
         self._redis = redis
+        self._batch_v1: Any = None
+        self._core_v1: Any = None
+
+    def _apis(self) -> tuple[Any, Any]:
+        """Load cluster config and build the API clients once, on first use."""
+        if self._batch_v1 is None:
+            from kubernetes import client, config as k8s_config
+
+            try:
+                k8s_config.load_incluster_config()
+            except k8s_config.ConfigException:
+                k8s_config.load_kube_config()
+            self._core_v1 = client.CoreV1Api()
+            self._batch_v1 = client.BatchV1Api()
+        return self._batch_v1, self._core_v1
 
     async def spawn(
         self, cr_id: str, repo_url: str, repo_name: str = "",
         default_branch: str = "main", extra_env: dict[str, str] | None = None,
     ) -> None:
         """Create a K8s Job for a single repo within a CR."""
-        from kubernetes import client, config as k8s_config
+        from kubernetes import client
 
         if not repo_name:
             repo_name = extract_repo_name(repo_url)
 
-        try:
-            k8s_config.load_incluster_config()
-        except k8s_config.ConfigException:
-            k8s_config.load_kube_config()
-
-        batch_v1 = client.BatchV1Api()
-        core_v1 = client.CoreV1Api()
+        batch_v1, core_v1 = self._apis()
 
         safe_name = f"{cr_id}-{repo_name}".lower().replace("_", "-")
         job_name = f"hadron-worker-{safe_name}"
@@ -279,16 +320,11 @@ class K8sJobSpawner:
 
     async def _stream_pod_logs(self, worker_key: str, job_name: str) -> None:
         """Tail K8s pod logs and write them to Redis, mirroring SubprocessJobSpawner."""
-        from kubernetes import client, config as k8s_config, watch
+        from kubernetes import watch
 
         redis_key = f"hadron:cr:{worker_key}:worker_log"
         try:
-            try:
-                k8s_config.load_incluster_config()
-            except k8s_config.ConfigException:
-                k8s_config.load_kube_config()
-
-            v1 = client.CoreV1Api()
+            _, v1 = self._apis()
 
             # Wait for the pod to be created (up to 60s)
             pod_name = None
@@ -6,6 +6,7 @@ import uuid
 
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from hadron.config.api_keys import resolve_api_keys, resolved_keys_as_env
@@ -26,18 +27,6 @@ async def trigger_pipeline(
     spawner: JobSpawner = Depends(get_job_spawner),
 ) -> dict:
     """Accept a change request and spawn one worker per repo."""
-    # Check for duplicate external_id
-    if cr.external_id:
-        async with session_factory() as session:
-            existing = await session.execute(
-                select(CRRun).where(CRRun.external_id == cr.external_id)
-            )
-            if existing.scalar_one_or_none():
-                raise HTTPException(
-                    status_code=409,
-                    detail=f"CR with external_id '{cr.external_id}' already exists",
-                )
-
     cr_id = f"CR-{uuid.uuid4().hex[:8]}"
     config_snapshot = get_config_snapshot()
 
@@ -135,11 +124,21 @@ async def trigger_pipeline(
             branch_name=f"{BRANCH_PREFIX}{cr_id}",
         ))
 
+    # Duplicate external_ids are rejected by the unique constraint on insert,
+    # which (unlike a SELECT beforehand) also holds for concurrent intakes.
     async with session_factory() as session:
         session.add(cr_run)
         for rr in repo_runs:
             session.add(rr)
-        await session.commit()
+        try:
+            await session.commit()
+        except IntegrityError as e:
+            if cr.external_id and "external_id" in str(e.orig):
+                raise HTTPException(
+                    status_code=409,
+                    detail=f"CR with external_id '{cr.external_id}' already exists",
+                ) from None
+            raise
 
     # Resolve API keys (DB first, env var fallback) for worker injection
     resolved = await resolve_api_keys(session_factory)
@@ -61,6 +61,7 @@ async def resume_pipeline(
     event_bus: EventBus = Depends(get_event_bus),
 ) -> dict:
     """Resume a paused or failed pipeline, optionally overriding state."""
+    # One session for the checks and the status flip: a single pool checkout.
     async with session_factory() as session:
         result = await session.execute(select(CRRun).where(CRRun.cr_id == cr_id))
         cr_run = result.scalar_one_or_none()
@@ -72,13 +73,13 @@ async def resume_pipeline(
                 detail=f"CR is '{cr_run.status}', can only resume paused or failed runs",
             )
 
-    # Store overrides in Redis with 1h TTL so the worker can pick them up
-    if body.state_overrides:
-        override_key = f"hadron:cr:{cr_id}:resume_overrides"
-        await redis.set(override_key, json.dumps(body.state_overrides), ex=3600)
+        # Store overrides in Redis with 1h TTL so the worker can pick them up.
+        # Written before the status flip so a failure leaves the run resumable.
+        if body.state_overrides:
+            override_key = f"hadron:cr:{cr_id}:resume_overrides"
+            await redis.set(override_key, json.dumps(body.state_overrides), ex=3600)
 
-    # Find repos to resume BEFORE updating status
-    async with session_factory() as session:
+        # Find repos to resume BEFORE updating status
         repo_result = await session.execute(
             select(RepoRun).where(
                 RepoRun.cr_id == cr_id,
@@ -87,8 +88,7 @@ async def resume_pipeline(
         )
         repos_to_resume = repo_result.scalars().all()
 
-    # Now update DB status to running
-    async with session_factory() as session:
+        # Now update DB status to running
         await session.execute(
             update(CRRun).where(CRRun.cr_id == cr_id).values(status="running", error=None)
         )
@@ -138,14 +138,13 @@ async def receive_ci_result(
     the pipeline resumes to implementation with CI failure context so
     the agent can fix the issues.
     """
-    # Validate CR exists and the repo is waiting for CI
     async with session_factory() as session:
+        # Validate CR exists and the repo is waiting for CI
         result = await session.execute(select(CRRun).where(CRRun.cr_id == cr_id))
         cr_run = result.scalar_one_or_none()
         if not cr_run:
             raise HTTPException(status_code=404, detail="CR not found")
 
-    async with session_factory() as session:
         result = await session.execute(
             select(RepoRun).where(
                 RepoRun.cr_id == cr_id,
@@ -156,33 +155,32 @@ async def receive_ci_result(
         if not repo_run:
             raise HTTPException(status_code=404, detail=f"Repo '{body.repo_name}' not found for CR")
 
-    # Emit CI result event
-    await event_bus.emit(PipelineEvent(
-        cr_id=cr_id,
-        event_type=EventType.STAGE_COMPLETED,
-        stage="ci",
-        data={
-            "repo": body.repo_name,
-            "passed": body.passed,
-            "build_url": body.build_url,
-        },
-    ))
-
-    if body.passed:
-        # CI passed — resume with clean state, will proceed through review → rebase → delivery
-        overrides: dict[str, object] = {}
-    else:
-        # CI failed — resume from implementation with CI failure context
-        overrides = {
-            "ci_failure_log": body.log_tail[-4000:] if body.log_tail else "",
-            "ci_build_url": body.build_url,
-        }
-
-    # Store overrides and respawn worker
-    override_key = f"hadron:cr:{cr_id}:resume_overrides"
-    await redis.set(override_key, json.dumps(overrides), ex=3600)
+        # Emit CI result event
+        await event_bus.emit(PipelineEvent(
+            cr_id=cr_id,
+            event_type=EventType.STAGE_COMPLETED,
+            stage="ci",
+            data={
+                "repo": body.repo_name,
+                "passed": body.passed,
+                "build_url": body.build_url,
+            },
+        ))
+
+        if body.passed:
+            # CI passed — resume with clean state, will proceed through review → rebase → delivery
+            overrides: dict[str, object] = {}
+        else:
+            # CI failed — resume from implementation with CI failure context
+            overrides = {
+                "ci_failure_log": body.log_tail[-4000:] if body.log_tail else "",
+                "ci_build_url": body.build_url,
+            }
+
+        # Store overrides before the status flip so a failure leaves the run resumable
+        override_key = f"hadron:cr:{cr_id}:resume_overrides"
+        await redis.set(override_key, json.dumps(overrides), ex=3600)
 
-    async with session_factory() as session:
         await session.execute(
             update(CRRun).where(CRRun.cr_id == cr_id).values(status="running", error=None)
         )
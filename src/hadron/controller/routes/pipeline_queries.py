@@ -24,6 +24,20 @@ def _extract_title(cr_run: CRRun) -> str:
     return ""
 
 
+# Columns shown in the run list; the JSON blobs stay in the database.
+_LIST_COLUMNS = (
+    CRRun.cr_id,
+    CRRun.status,
+    CRRun.source,
+    CRRun.external_id,
+    CRRun.cost_usd,
+    CRRun.error,
+    CRRun.created_at,
+    CRRun.updated_at,
+)
+_TITLE = CRRun.raw_cr_json["title"].as_string()
+
+
 @router.get("/pipeline/list")
 async def list_pipelines(
     search: str | None = None,
@@ -32,7 +46,7 @@ async def list_pipelines(
     session_factory: Any = Depends(get_session_factory),
 ) -> list[dict]:
     """List pipeline runs with optional search, status filter, and sort."""
-    query = select(CRRun)
+    query = select(*_LIST_COLUMNS, _TITLE.label("title"))
 
     if status:
         statuses = [s.strip() for s in status.split(",") if s.strip()]
@@ -44,7 +58,7 @@ async def list_pipelines(
         query = query.where(
             or_(
                 CRRun.cr_id.ilike(pattern),
-                CRRun.raw_cr_json["title"].astext.ilike(pattern),
+                _TITLE.ilike(pattern),
             )
         )
 
@@ -59,11 +73,10 @@ async def list_pipelines(
 
     async with session_factory() as session:
         result = await session.execute(query)
-        runs = result.scalars().all()
         return [
             {
                 "cr_id": r.cr_id,
-                "title": _extract_title(r),
+                "title": r.title or "",
                 "status": r.status,
                 "source": r.source,
                 "external_id": r.external_id,
@@ -72,7 +85,7 @@ async def list_pipelines(
                 "created_at": r.created_at.isoformat() if r.created_at else None,
                 "updated_at": r.updated_at.isoformat() if r.updated_at else None,
             }
-            for r in runs
+            for r in result.all()
         ]
 
 
@@ -11,7 +11,7 @@ from pydantic import BaseModel
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from hadron.agent.cost import _MODEL_COSTS
+from hadron.agent.cost import models_for_backend
 from hadron.config.api_keys import API_KEY_REGISTRY, DB_SETTING_KEY, _load_encrypted_keys
 from hadron.config.defaults import PIPELINE_DEFAULTS
 from hadron.controller.dependencies import get_session_factory
@@ -138,19 +138,6 @@ _BUILTIN_SLUGS = {t["slug"] for t in _BUILTIN_TEMPLATES}
 # ---------------------------------------------------------------------------
 
 
-def _models_for_backend(backend: str) -> list[str]:
-    """Return known model names for a built-in backend from the cost table."""
-    prefix_map = {
-        "claude": ("claude-",),
-        "openai": ("gpt-", "o3", "o4-"),
-        "gemini": ("gemini-",),
-    }
-    prefixes = prefix_map.get(backend)
-    if not prefixes:
-        return []
-    return sorted(m for m in _MODEL_COSTS if m.startswith(prefixes))
-
-
 def _parse_stages(raw: dict | str) -> dict[str, StageConfig]:
     """Parse raw JSON stage data into StageConfig dict."""
     import json
@@ -190,7 +177,7 @@ async def _load_templates(
             display_name=data.get("display_name", builtin["display_name"]),
             backend=data.get("backend", builtin["backend"]),
             stages=_parse_stages(data.get("stages", builtin["stages"])),
-            available_models=_models_for_backend(builtin["backend"]),
+            available_models=list(models_for_backend(builtin["backend"])),
             is_default=False,  # set below
         ))
 
@@ -6,17 +6,20 @@ from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engin
 from sqlalchemy.orm import sessionmaker
 
 
-def create_engine(postgres_url: str) -> AsyncEngine:
+def create_engine(postgres_url: str, pool_size: int = 5, max_overflow: int = 10) -> AsyncEngine:
     """Create an async SQLAlchemy engine.
 
     Args:
         postgres_url: Async postgres URL (postgresql+asyncpg://...).
+        pool_size: Connections kept open in the pool.
+        max_overflow: Extra connections allowed beyond ``pool_size`` under load.
     """
     return create_async_engine(
         postgres_url,
-        pool_size=5,
-        max_overflow=10,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
         pool_pre_ping=True,
+        pool_recycle=1800,
     )
 
 
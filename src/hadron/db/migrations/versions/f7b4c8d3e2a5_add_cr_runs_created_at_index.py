@@ -0,0 +1,24 @@
+"""add index on cr_runs.created_at
+
+Revision ID: f7b4c8d3e2a5
+Revises: e6a3b7c9d2f1
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "f7b4c8d3e2a5"
+down_revision: Union[str, None] = "e6a3b7c9d2f1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_cr_runs_created_at", "cr_runs", ["created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_cr_runs_created_at", table_name="cr_runs")
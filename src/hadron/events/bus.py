@@ -57,8 +57,11 @@ class RedisEventBus:
         """Append event to the CR's stream and notify subscribers via pub/sub."""
         key = _stream_key(event.cr_id)
         payload = event.model_dump_json()
-        await self._redis.xadd(key, {"data": payload})
-        await self._redis.publish(f"{key}:notify", "1")
+        # One round-trip for both; pipelined commands still run in order.
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.xadd(key, {"data": payload})
+        pipe.publish(f"{key}:notify", "1")
+        await pipe.execute()
 
     async def subscribe(
         self, cr_id: str, last_id: str = "0"
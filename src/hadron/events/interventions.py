@@ -11,6 +11,12 @@ def _intervention_key(cr_id: str) -> str:
     return f"{REDIS_STREAM_PREFIX}:{cr_id}:intervention"
 
 
+def _nudge_key(cr_id: str, role: str) -> str:
+    # A list of queued nudges. Distinct from the older ``:nudge:{role}`` string
+    # key so values left over from before an upgrade can't cause WRONGTYPE.
+    return f"{REDIS_STREAM_PREFIX}:{cr_id}:nudges:{role}"
+
+
 class InterventionManager:
     """Manages human interventions for pipeline runs.
 
@@ -38,18 +44,21 @@ class InterventionManager:
         return value.decode() if isinstance(value, bytes) else value
 
     async def set_nudge(self, cr_id: str, role: str, message: str) -> None:
-        """Set an agent-level nudge (picked up between tool-use rounds)."""
-        key = f"{REDIS_STREAM_PREFIX}:{cr_id}:nudge:{role}"
-        await self._redis.set(key, message)
+        """Queue an agent-level nudge (picked up between tool-use rounds)."""
+        await self._redis.rpush(_nudge_key(cr_id, role), message)
 
     async def poll_nudge(self, cr_id: str, role: str) -> str | None:
-        """Atomically get+delete a nudge for a specific agent role."""
-        key = f"{REDIS_STREAM_PREFIX}:{cr_id}:nudge:{role}"
+        """Atomically drain all queued nudges for an agent role.
+
+        Nudges sent since the last poll are joined into one message, so a burst
+        costs the agent a single extra turn instead of one round per nudge.
+        """
+        key = _nudge_key(cr_id, role)
         pipe = self._redis.pipeline()
-        pipe.get(key)
+        pipe.lrange(key, 0, -1)
         pipe.delete(key)
         results = await pipe.execute()
-        value = results[0]
-        if value is None:
+        values = results[0]
+        if not values:
             return None
-        return value.decode() if isinstance(value, bytes) else value
+        return "\n\n".join(v.decode() if isinstance(v, bytes) else v for v in values)
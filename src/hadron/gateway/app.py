@@ -44,7 +44,9 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     cfg = load_bootstrap_config()
     configure_logging(level=cfg.log_level, log_format=cfg.log_format)
 
-    engine = create_engine(cfg.postgres_url)
+    engine = create_engine(
+        cfg.postgres_url, pool_size=cfg.db_pool_size, max_overflow=cfg.db_max_overflow,
+    )
     session_factory = create_session_factory(engine)
     redis_client = aioredis.from_url(cfg.redis_url)
 
@@ -25,6 +25,14 @@ class BootstrapConfig(BaseModel):
     redis_url: str = Field(
         default="redis://localhost:6379/0",
     )
+    db_pool_size: int = Field(
+        default=5,
+        description="Connections kept open in each process's database pool.",
+    )
+    db_max_overflow: int = Field(
+        default=10,
+        description="Extra connections the pool may open beyond db_pool_size under load.",
+    )
     anthropic_api_key: str = Field(
         default="",
         description="Anthropic API key for Claude agent backend.",
@@ -68,6 +76,10 @@ class BootstrapConfig(BaseModel):
         default="http://localhost:4317",
         description="OTLP gRPC endpoint for trace export.",
     )
+    llm_cache_enabled: bool = Field(
+        default=False,
+        description="Reuse plan-phase responses for identical plan requests (stored in Redis).",
+    )
     embed_sse: bool = Field(
         default=True,
         description="Embed SSE event routes in the controller. Set to false when running a separate SSE gateway.",
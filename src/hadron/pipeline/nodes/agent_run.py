@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import re
 from dataclasses import dataclass
 from typing import Any
 
@@ -28,6 +29,11 @@ logger = structlog.stdlib.get_logger(__name__)
 _NODE_LEVEL_MAX_RETRIES = 3
 _NODE_LEVEL_COOLDOWN_SECONDS = 120  # 2 minutes between node-level retries
 
+# Fallback for errors without a recognised type or HTTP status.
+_TRANSIENT_MESSAGE_RE = re.compile(
+    r"503|unavailable|overloaded|rate limit|resource exhausted", re.IGNORECASE,
+)
+
 
 def _is_transient_llm_error(exc: Exception) -> bool:
     """Check if an exception is a transient LLM API error worth retrying at node level."""
@@ -55,9 +61,13 @@ def _is_transient_llm_error(exc: Exception) -> bool:
     except ImportError:
         pass
 
+    # HTTP status on the error itself (google-genai uses .code)
+    status = getattr(exc, "status_code", None) or getattr(exc, "code", None)
+    if isinstance(status, int) and (status == 429 or 500 <= status < 600):
+        return True
+
     # Catch-all: check error message for common transient patterns
-    msg = str(exc).lower()
-    return any(kw in msg for kw in ("503", "unavailable", "overloaded", "rate limit", "resource exhausted"))
+    return _TRANSIENT_MESSAGE_RE.search(str(exc)) is not None
 
 
 @dataclass
@@ -10,6 +10,7 @@ import redis.asyncio as aioredis
 
 from hadron.agent.base import AgentResult, OnAgentEvent, OnToolCall
 from hadron.events.bus import REDIS_STREAM_PREFIX, EventBus
+from hadron.events.interventions import InterventionManager
 from hadron.models.events import EventType, PipelineEvent
 
 
@@ -107,18 +108,11 @@ def make_agent_event_emitter(
 def make_nudge_poller(
     redis_client: aioredis.Redis, cr_id: str, role: str,
 ) -> Callable[[], Awaitable[str | None]]:
-    """Create an async callable that atomically gets+deletes a nudge for a specific agent role."""
+    """Create an async callable that atomically drains pending nudges for a specific agent role."""
+    interventions = InterventionManager(redis_client)
 
     async def _poll() -> str | None:
-        key = f"{REDIS_STREAM_PREFIX}:{cr_id}:nudge:{role}"
-        pipe = redis_client.pipeline()
-        pipe.get(key)
-        pipe.delete(key)
-        results = await pipe.execute()
-        value = results[0]
-        if value is None:
-            return None
-        return value.decode() if isinstance(value, bytes) else value
+        return await interventions.poll_nudge(cr_id, role)
 
     return _poll
 
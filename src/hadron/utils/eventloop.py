@@ -0,0 +1,31 @@
+"""Event loop selection for long-running async entry points."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from collections.abc import Callable, Coroutine
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
+
+
+def loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return the uvloop loop factory when available, else None (stdlib loop).
+
+    ``HADRON_EVENT_LOOP=asyncio`` forces the stdlib loop. uvloop ships with
+    ``uvicorn[standard]``, so it is normally present on Linux images.
+    """
+    if os.environ.get("HADRON_EVENT_LOOP", "uvloop").lower() == "asyncio":
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+def run(coro: Coroutine[Any, Any, _T]) -> _T:
+    """Like ``asyncio.run``, but on uvloop when available."""
+    with asyncio.Runner(loop_factory=loop_factory()) as runner:
+        return runner.run(coro)
@@ -6,9 +6,45 @@ is consistent and changes propagate from a single place.
 
 from __future__ import annotations
 
+import itertools
+import json
+import re
+from typing import Any
+
+_ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]")
+_BLANK_LINE_RUN = re.compile(r"\n(?:[ \t]*\n){2,}")
+
 
 def truncate(text: str, max_chars: int, *, suffix: str = "\n... (truncated)") -> str:
     """Truncate *text* to *max_chars*, appending *suffix* if truncated."""
     if len(text) <= max_chars:
         return text
     return text[:max_chars] + suffix
+
+
+def json_preview(data: dict[str, Any], max_chars: int = 200) -> str:
+    """JSON-encode *data* for logging, cut to *max_chars*.
+
+    String values are clipped before encoding, so a large value (e.g. file
+    content in a write_file call) is never serialized in full. The result
+    matches ``json.dumps(data)[:max_chars]``.
+    """
+    clipped = {k: v[:max_chars] if isinstance(v, str) else v for k, v in data.items()}
+    return json.dumps(clipped)[:max_chars]
+
+
+def squeeze_output(text: str) -> str:
+    """Strip terminal noise from command output before it goes back to a model.
+
+    Removes ANSI escape sequences, collapses runs of blank lines to one, and
+    replaces 3+ identical consecutive lines with the line and a repeat count.
+    """
+    text = _BLANK_LINE_RUN.sub("\n\n", _ANSI_ESCAPE.sub("", text))
+    lines: list[str] = []
+    for line, group in itertools.groupby(text.split("\n")):
+        count = sum(1 for _ in group)
+        if count >= 3:
+            lines += [line, f"... (previous line repeated {count - 1} more times)"]
+        else:
+            lines += [line] * count
+    return "\n".join(lines)
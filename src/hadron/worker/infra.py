@@ -14,6 +14,7 @@ import httpx
 import redis.asyncio as aioredis
 import structlog
 
+from hadron.agent.cache import LLMCache
 from hadron.agent.factory import create_agent_backend
 from hadron.db.engine import create_engine, create_session_factory
 from hadron.events.bus import RedisEventBus
@@ -140,9 +141,15 @@ class OpencodeServeManager:
 class BackendPool:
     """Lazily creates and caches agent backends by name."""
 
-    def __init__(self, cfg: Any, opencode_endpoints: list[dict] | None = None) -> None:
+    def __init__(
+        self,
+        cfg: Any,
+        opencode_endpoints: list[dict] | None = None,
+        plan_cache: LLMCache | None = None,
+    ) -> None:
         self._cfg = cfg
         self._cache: dict[str, Any] = {}
+        self._plan_cache = plan_cache
         self._opencode_endpoints: dict[str, dict] = {
             f"opencode:{ep['slug']}": ep for ep in (opencode_endpoints or [])
         }
@@ -167,8 +174,17 @@ class BackendPool:
                 openai_api_key=getattr(self._cfg, "openai_api_key", ""),
                 opencode_base_url=opencode_url,
             )
+            if self._plan_cache is not None:
+                self._cache[name].plan_cache = self._plan_cache
         return self._cache[name]
 
+    async def aclose(self) -> None:
+        """Let backends release remote resources they hold (e.g. Gemini context caches)."""
+        for backend in self._cache.values():
+            close = getattr(backend, "aclose", None)
+            if close is not None:
+                await close()
+
 
 @dataclass
 class WorkerInfra:
@@ -189,6 +205,7 @@ class WorkerInfra:
         return self.backend_pool.get(self.default_backend_name)
 
     async def close(self) -> None:
+        await self.backend_pool.aclose()
         if self.opencode_serve:
             await self.opencode_serve.stop()
         await self.redis_client.aclose()
@@ -197,11 +214,14 @@ class WorkerInfra:
 
 def connect(cfg: Any) -> WorkerInfra:
     """Create all infrastructure connections from bootstrap config."""
-    engine = create_engine(cfg.postgres_url)
+    engine = create_engine(
+        cfg.postgres_url, pool_size=cfg.db_pool_size, max_overflow=cfg.db_max_overflow,
+    )
     session_factory = create_session_factory(engine)
     redis_client = aioredis.from_url(cfg.redis_url)
     default_backend_name = getattr(cfg, "agent_backend", "claude")
-    pool = BackendPool(cfg)
+    plan_cache = LLMCache(redis_client) if getattr(cfg, "llm_cache_enabled", False) else None
+    pool = BackendPool(cfg, plan_cache=plan_cache)
     return WorkerInfra(
         engine=engine,
         session_factory=session_factory,
@@ -31,6 +31,7 @@ from hadron.models.resume import pick_resume_node
 from hadron.observability.logging import bind_contextvars, configure_logging
 from hadron.observability.tracing import configure_tracing
 from hadron.pipeline.graph import build_pipeline_graph
+from hadron.utils.eventloop import run
 from hadron.worker.infra import WorkerInfra, connect
 from hadron.worker.state import (
     build_initial_state,
@@ -232,8 +233,10 @@ class _RedisLogHandler(logging.Handler):
 
     async def _write(self, msg: str) -> None:
         try:
-            await self._redis.append(self._key, msg)
-            await self._redis.expire(self._key, 86400)
+            pipe = self._redis.pipeline(transaction=False)
+            pipe.append(self._key, msg)
+            pipe.expire(self._key, 86400)
+            await pipe.execute()
         except Exception:
             pass
 
@@ -348,7 +351,7 @@ def main() -> None:
     parser.add_argument("--repo-name", default="", help="Repository name (derived from URL if omitted)")
     parser.add_argument("--default-branch", default="main", help="Default branch name")
     args = parser.parse_args()
-    asyncio.run(run_worker(args.cr_id, args.repo_url, args.repo_name, args.default_branch))
+    run(run_worker(args.cr_id, args.repo_url, args.repo_name, args.default_branch))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,141 @@
+"""Tests for the shared agent data types in hadron.agent.base."""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import sys
+import threading
+
+import pytest
+
+from hadron.agent.base import (
+    DONE_EVENT,
+    EVENT_DONE,
+    EVENT_TEXT_DELTA,
+    AgentCallbacks,
+    AgentEvent,
+    coalesce_events,
+)
+
+
+class TestAgentEvent:
+    def test_event_is_frozen(self) -> None:
+        event = AgentEvent("text_delta", {"text": "hi"})
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            event.event_type = "done"  # type: ignore[misc]
+
+    def test_event_type_constants_are_interned(self) -> None:
+        parsed = "".join(["text_", "delta"])
+        assert sys.intern(parsed) is EVENT_TEXT_DELTA
+
+    def test_done_sentinel(self) -> None:
+        assert DONE_EVENT.event_type is EVENT_DONE
+        assert DONE_EVENT.data == {}
+
+    def test_done_sentinel_data_is_read_only(self) -> None:
+        with pytest.raises(TypeError):
+            DONE_EVENT.data["leak"] = True  # type: ignore[index]
+
+
+class TestAgentCallbacks:
+    async def test_sync_event_callback_runs_off_loop(self) -> None:
+        calls: list[tuple[str, dict, str]] = []
+
+        def log_event(event_type: str, data: dict) -> None:
+            calls.append((event_type, data, threading.current_thread().name))
+
+        callbacks = AgentCallbacks(on_event_sync=log_event)
+        await callbacks.on_event("output", {"text": "hi"})
+
+        assert calls[0][:2] == ("output", {"text": "hi"})
+        assert calls[0][2] != threading.main_thread().name
+
+    async def test_sync_tool_call_callback_wrapped(self) -> None:
+        calls: list[tuple] = []
+        callbacks = AgentCallbacks(on_tool_call_sync=lambda *args: calls.append(args))
+
+        await callbacks.on_tool_call("read_file", {"path": "a"}, "ok")
+
+        assert calls == [("read_file", {"path": "a"}, "ok")]
+
+    async def test_async_callback_takes_precedence(self) -> None:
+        async def on_event(event_type: str, data: dict) -> None:
+            pass
+
+        callbacks = AgentCallbacks(on_event=on_event, on_event_sync=lambda *a: None)
+        assert callbacks.on_event is on_event
+
+    def test_no_callbacks_by_default(self) -> None:
+        callbacks = AgentCallbacks()
+        assert callbacks.on_event is None
+        assert callbacks.on_tool_call is None
+
+    async def test_batch_callback_installed_as_on_event(self) -> None:
+        batches: list[list] = []
+
+        async def on_batch(batch: list) -> None:
+            batches.append(batch)
+
+        callbacks = AgentCallbacks(on_event_batch=on_batch)
+        await callbacks.on_event("output", {"text": "hi"})
+        await asyncio.sleep(0.02)
+
+        assert batches == [[("output", {"text": "hi"})]]
+
+
+class TestCoalesceEvents:
+    async def test_flushes_when_batch_is_full(self) -> None:
+        batches: list[list] = []
+
+        async def on_batch(batch: list) -> None:
+            batches.append(batch)
+
+        on_event = coalesce_events(on_batch, flush_size=3, flush_ms=10_000)
+        for i in range(7):
+            await on_event("output", {"i": i})
+
+        assert [[d["i"] for _, d in b] for b in batches] == [[0, 1, 2], [3, 4, 5]]
+
+    async def test_flushes_remainder_after_interval(self) -> None:
+        batches: list[list] = []
+
+        async def on_batch(batch: list) -> None:
+            batches.append(batch)
+
+        on_event = coalesce_events(on_batch, flush_size=64, flush_ms=1)
+        await on_event("output", {"i": 0})
+        await on_event("output", {"i": 1})
+        assert batches == []
+
+        await asyncio.sleep(0.02)
+        assert batches == [[("output", {"i": 0}), ("output", {"i": 1})]]
+
+    async def test_flush_delivers_tail_immediately(self) -> None:
+        batches: list[list] = []
+
+        async def on_batch(batch: list) -> None:
+            batches.append(batch)
+
+        on_event = coalesce_events(on_batch, flush_size=64, flush_ms=10_000)
+        await on_event("output", {"i": 0})
+        await on_event("phase_completed", {"i": 1})
+        await on_event.flush()
+
+        assert [[t for t, _ in b] for b in batches] == [["output", "phase_completed"]]
+        await on_event.flush()
+        assert len(batches) == 1
+
+    async def test_timer_flush_consumes_callback_errors(self) -> None:
+        async def on_batch(batch: list) -> None:
+            raise RuntimeError("sink down")
+
+        on_event = coalesce_events(on_batch, flush_size=64, flush_ms=1)
+        await on_event("output", {"i": 0})
+        await asyncio.sleep(0.02)
+
+        assert not on_event._pending
+
+    async def test_callbacks_flush_without_batching_is_noop(self) -> None:
+        await AgentCallbacks().flush()
+
@@ -0,0 +1,40 @@
+"""Tests for the plan-phase response cache."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+from hadron.agent.cache import LLMCache, plan_cache_key
+
+
+class TestPlanCacheKey:
+    def test_same_inputs_same_key(self) -> None:
+        assert plan_cache_key("m", "sys", "user", 100) == plan_cache_key("m", "sys", "user", 100)
+
+    def test_prompt_changes_key(self) -> None:
+        assert plan_cache_key("m", "sys", "user", 100) != plan_cache_key("m", "sys", "other", 100)
+
+
+class TestLLMCache:
+    async def test_in_memory_round_trip(self) -> None:
+        cache = LLMCache()
+        await cache.set_text("abc", "plan")
+        assert await cache.get_text("abc") == "plan"
+        assert await cache.get_text("missing") is None
+
+    async def test_round_trips_through_redis(self) -> None:
+        store: dict[str, bytes] = {}
+        redis = AsyncMock()
+        redis.set = AsyncMock(side_effect=lambda k, v, ex=None: store.__setitem__(k, v.encode()))
+        redis.get = AsyncMock(side_effect=lambda k: store.get(k))
+        cache = LLMCache(redis, ttl_seconds=60)
+
+        await cache.set_text("abc", "plan")
+
+        assert await cache.get_text("abc") == "plan"
+        assert redis.set.await_args.kwargs["ex"] == 60
+
+    async def test_miss_returns_none(self) -> None:
+        redis = AsyncMock()
+        redis.get = AsyncMock(return_value=None)
+        assert await LLMCache(redis).get_text("missing") is None
@@ -18,6 +18,7 @@ from hadron.agent.claude import (
     _compute_model_cost,
     _PhaseResult,
 )
+from hadron.agent.cost import _model_rates, models_for_backend, register_model_cost
 
 
 # ---------------------------------------------------------------------------
@@ -25,6 +26,12 @@ from hadron.agent.claude import (
 # ---------------------------------------------------------------------------
 
 
+def _first_user_text(call_kwargs: dict[str, Any]) -> str:
+    """Text of the first user message sent to messages.create (str or block list)."""
+    content = call_kwargs["messages"][0]["content"]
+    return content if isinstance(content, str) else content[0]["text"]
+
+
 def _make_api_response(text: str, input_tokens: int = 100, output_tokens: int = 50):
     """Build a mock Anthropic API response with a text block and end_turn."""
     text_block = MagicMock()
@@ -113,6 +120,35 @@ class TestModelCosts:
         cost = _compute_model_cost("claude-sonnet-4-20250514", 0, 0)
         assert cost == 0.0
 
+    def test_undated_alias_uses_snapshot_pricing(self) -> None:
+        cost = _compute_model_cost("claude-haiku-4-5", 1_000_000, 1_000_000)
+        assert cost == pytest.approx(0.80 + 4.00)
+
+    def test_dated_snapshot_uses_alias_pricing(self) -> None:
+        cost = _compute_model_cost("claude-opus-4-6-20260101", 1_000_000, 1_000_000)
+        assert cost == pytest.approx(15.00 + 75.00)
+
+    def test_registered_cost_replaces_resolved_rate(self) -> None:
+        _compute_model_cost("custom-model-x", 1, 1)
+        register_model_cost("custom-model-x", 1.00, 2.00)
+        try:
+            cost = _compute_model_cost("custom-model-x", 1_000_000, 1_000_000)
+            assert cost == pytest.approx(3.00)
+        finally:
+            _MODEL_COSTS.pop("custom-model-x")
+            _model_rates.cache_clear()
+
+    def test_models_for_backend_sees_registered_models(self) -> None:
+        assert "gemini-9-test" not in models_for_backend("gemini")
+        register_model_cost("gemini-9-test", 1.00, 2.00)
+        try:
+            assert "gemini-9-test" in models_for_backend("gemini")
+            assert "gemini-9-test" not in models_for_backend("claude")
+        finally:
+            _MODEL_COSTS.pop("gemini-9-test")
+            _model_rates.cache_clear()
+            models_for_backend.cache_clear()
+
 
 # ---------------------------------------------------------------------------
 # Phase skipping (backwards compatibility)
@@ -148,7 +184,7 @@ class TestPhaseSkipping:
         assert mock_create.call_count == 1
         call_kwargs = mock_create.call_args
         # User prompt should be passed through unchanged
-        assert call_kwargs.kwargs["messages"][0]["content"] == "Do the thing."
+        assert _first_user_text(call_kwargs.kwargs) == "Do the thing."
 
     @pytest.mark.asyncio
     async def test_no_phases_cost_uses_act_model(self, tmp_workdir: Path) -> None:
@@ -242,7 +278,7 @@ class TestExplorePhase:
 
         # Act phase should receive exploration summary in user prompt
         act_call = mock_create.call_args_list[1]
-        act_user_prompt = act_call.kwargs["messages"][0]["content"]
+        act_user_prompt = _first_user_text(act_call.kwargs)
         assert "Exploration: found src/ and tests/" in act_user_prompt
         assert "Implement feature X." in act_user_prompt
 
@@ -392,11 +428,33 @@ class TestActPhase:
 
         # Act is the second messages.create call (after explore)
         act_call = mock_create.call_args_list[1]
-        act_user = act_call.kwargs["messages"][0]["content"]
+        act_user = _first_user_text(act_call.kwargs)
         assert "Step 1: do X. Step 2: do Y." in act_user
         assert "Exploration context." in act_user
         assert "Implement feature X." in act_user
 
+    @pytest.mark.asyncio
+    async def test_conversation_is_json_after_tool_rounds(self, tmp_workdir: Path) -> None:
+        import json
+
+        backend = ClaudeAgentBackend(api_key="test-key")
+        with patch.object(backend._client.messages, "create", new_callable=AsyncMock) as mock_create:
+            mock_create.side_effect = [
+                _make_tool_response("read_file", {"path": "hello.txt"}),
+                _make_api_response("Done."),
+            ]
+            task = AgentTask(
+                role="code_writer", system_prompt="Write code.", user_prompt="Go.",
+                working_directory=str(tmp_workdir),
+            )
+            result = await backend.execute(task)
+
+        roundtrip = json.loads(json.dumps(result.conversation))
+        assert roundtrip[1]["content"][0] == {
+            "type": "tool_use", "id": "tu_1", "name": "read_file", "input": {"path": "hello.txt"},
+        }
+        assert roundtrip[2]["content"][0]["content"] == "hello world"
+
     @pytest.mark.asyncio
     async def test_act_uses_default_model(self, tmp_workdir: Path) -> None:
         backend = ClaudeAgentBackend(api_key="test-key")
@@ -536,6 +594,54 @@ class TestPhaseEvents:
         assert started_events[2]["phase"] == "act"
         assert started_events[2]["model"] == "claude-sonnet-4-20250514"
 
+    @pytest.mark.asyncio
+    async def test_batched_events_flushed_before_execute_returns(self, tmp_workdir: Path) -> None:
+        backend = ClaudeAgentBackend(api_key="test-key")
+        batches: list[list[tuple[str, dict]]] = []
+
+        async def on_batch(batch: list[tuple[str, dict]]) -> None:
+            batches.append(batch)
+
+        with patch.object(backend._client.messages, "create", new_callable=AsyncMock) as mock_create:
+            mock_create.return_value = _make_api_response("Done.")
+            task = AgentTask(
+                role="code_writer", system_prompt="Write code.", user_prompt="Task.",
+                working_directory=str(tmp_workdir),
+                callbacks=AgentCallbacks(on_event_batch=on_batch),
+            )
+            await backend.execute(task)
+
+        delivered = [t for b in batches for t, _ in b]
+        assert delivered[0] == "prompt"
+        assert delivered[-1] == "output"
+
+    @pytest.mark.asyncio
+    async def test_queued_events_delivered_when_round_fails(self, tmp_workdir: Path) -> None:
+        backend = ClaudeAgentBackend(api_key="test-key")
+        events: list[str] = []
+
+        async def capture_event(event_type: str, data: dict) -> None:
+            await asyncio.sleep(0)
+            events.append(event_type)
+
+        with (
+            patch.object(backend._client.messages, "create", new_callable=AsyncMock) as mock_create,
+            patch("hadron.agent.tool_loop.execute_tool", new_callable=AsyncMock, return_value="ok"),
+        ):
+            mock_create.return_value = _make_tool_response("read_file", {"path": "a.py"})
+            task = AgentTask(
+                role="code_writer", system_prompt="Write code.", user_prompt="Task.",
+                working_directory=str(tmp_workdir),
+                callbacks=AgentCallbacks(
+                    on_event=capture_event,
+                    nudge_poll=AsyncMock(side_effect=RuntimeError("redis down")),
+                ),
+            )
+            with pytest.raises(RuntimeError):
+                await backend.execute(task)
+
+        assert events[-2:] == ["tool_call", "tool_result"]
+
     @pytest.mark.asyncio
     async def test_no_phase_events_when_no_phases(self, tmp_workdir: Path) -> None:
         backend = ClaudeAgentBackend(api_key="test-key")
@@ -843,3 +949,101 @@ class TestContextReset:
 
         reset_events = [e for e in events if e[0] == "context_reset"]
         assert len(reset_events) > 0, "Expected context_reset event to be emitted"
+
+
+# ---------------------------------------------------------------------------
+# Message Batches (execute_many)
+# ---------------------------------------------------------------------------
+
+
+def _batch_entry(custom_id: str, response: Any = None, result_type: str = "succeeded"):
+    entry = MagicMock()
+    entry.custom_id = custom_id
+    entry.result.type = result_type
+    entry.result.message = response
+    return entry
+
+
+class _AsyncEntries:
+    def __init__(self, entries: list) -> None:
+        self._it = iter(entries)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._it)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class TestExecuteMany:
+    @staticmethod
+    def _batches(backend: ClaudeAgentBackend, entries: list) -> MagicMock:
+        batches = MagicMock()
+        batches.create = AsyncMock(return_value=MagicMock(id="b1", processing_status="in_progress"))
+        batches.retrieve = AsyncMock(return_value=MagicMock(id="b1", processing_status="ended"))
+        batches.results = AsyncMock(return_value=_AsyncEntries(entries))
+        backend._client.messages.batches = batches
+        return batches
+
+    @pytest.mark.asyncio
+    async def test_toolless_tasks_batched_at_discount(self) -> None:
+        backend = ClaudeAgentBackend(api_key="test-key")
+        batches = self._batches(backend, [
+            _batch_entry("task-1", _make_api_response("second", 1_000_000, 0)),
+            _batch_entry("task-0", _make_api_response("first", 1_000_000, 0)),
+        ])
+        tasks = [
+            AgentTask(role="intake", system_prompt="s", user_prompt=p, allowed_tools=[],
+                      model="claude-sonnet-4-20250514")
+            for p in ("a", "b")
+        ]
+
+        with patch("hadron.agent.claude.asyncio.sleep", new_callable=AsyncMock):
+            results = await backend.execute_many(tasks)
+
+        assert [r.output for r in results] == ["first", "second"]
+        assert results[0].cost_usd == pytest.approx(1.50)
+        assert len(batches.create.call_args.kwargs["requests"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_batched_task_emits_prompt_and_output_events(self) -> None:
+        backend = ClaudeAgentBackend(api_key="test-key")
+        self._batches(backend, [_batch_entry("task-0", _make_api_response("answer"))])
+        events: list[tuple[str, dict]] = []
+
+        async def capture_event(event_type: str, data: dict) -> None:
+            events.append((event_type, data))
+
+        task = AgentTask(
+            role="intake", system_prompt="s", user_prompt="question", allowed_tools=[],
+            callbacks=AgentCallbacks(on_event=capture_event),
+        )
+        with patch("hadron.agent.claude.asyncio.sleep", new_callable=AsyncMock):
+            await backend.execute_many([task])
+
+        assert events == [
+            ("prompt", {"text": "question"}),
+            ("output", {"text": "answer", "round": 0}),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_tool_tasks_and_failed_entries_run_live(self) -> None:
+        backend = ClaudeAgentBackend(api_key="test-key")
+        self._batches(backend, [_batch_entry("task-0", result_type="expired")])
+        tasks = [
+            AgentTask(role="intake", system_prompt="s", user_prompt="a", allowed_tools=[]),
+            AgentTask(role="writer", system_prompt="s", user_prompt="b"),
+        ]
+
+        with (
+            patch("hadron.agent.claude.asyncio.sleep", new_callable=AsyncMock),
+            patch.object(backend._client.messages, "create", new_callable=AsyncMock) as mock_create,
+        ):
+            mock_create.return_value = _make_api_response("live")
+            results = await backend.execute_many(tasks)
+
+        assert [r.output for r in results] == ["live", "live"]
+        assert mock_create.call_count == 2
@@ -8,7 +8,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from hadron.agent.factory import create_agent_backend
+from hadron.agent.factory import backend_for_model, create_agent_backend
 
 
 class TestFactoryDefault:
@@ -77,3 +77,30 @@ class TestFactoryUnknown:
     def test_unknown_name_raises(self) -> None:
         with pytest.raises(ValueError, match="Unknown agent backend"):
             create_agent_backend("nonexistent")
+
+
+class TestBackendForModel:
+    def test_claude_models(self) -> None:
+        assert backend_for_model("claude-sonnet-4-6") == "claude"
+
+    def test_gemini_models(self) -> None:
+        assert backend_for_model("gemini-2.5-pro") == "gemini"
+
+    def test_openai_models(self) -> None:
+        assert backend_for_model("gpt-4.1-mini") == "openai"
+        assert backend_for_model("o3") == "openai"
+        assert backend_for_model("o4-mini") == "openai"
+
+    def test_vendor_qualified_model(self) -> None:
+        assert backend_for_model("openai/gpt-4o") == "openai"
+
+    def test_unknown_model(self) -> None:
+        assert backend_for_model("qwen3:7b") is None
+
+    def test_lookup_is_memoized(self) -> None:
+        backend_for_model.cache_clear()
+        backend_for_model("claude-opus-4-6")
+        backend_for_model("claude-opus-4-6")
+        info = backend_for_model.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock
 
 import pytest
 
-from hadron.agent.base import AgentCallbacks, AgentTask, PhaseConfig
+from hadron.agent.base import AgentCallbacks, AgentEvent, AgentTask, PhaseConfig
 from hadron.agent.base_backend import BaseAgentBackend, _ResultAccumulator
+from hadron.agent.cache import LLMCache
 from hadron.agent.tool_loop import ToolLoopConfig, _PhaseResult
 
 
@@ -166,6 +168,38 @@ class TestThreePhases:
         assert "Exploration context" in act_user
 
 
+class TestPlanCache:
+    def _task(self, tmp_workdir: Path) -> AgentTask:
+        return AgentTask(
+            role="test", system_prompt="sys", user_prompt="task",
+            working_directory=str(tmp_workdir),
+            phases=PhaseConfig(explore_model="", plan_model="opus"),
+        )
+
+    async def test_identical_plan_request_served_from_cache(self, tmp_workdir: Path) -> None:
+        backend = FakeBackend()
+        backend.plan_cache = LLMCache()
+        backend.set_tool_loop_results(_phase_result("Done"), _phase_result("Done"))
+        backend.set_plan_result(_phase_result("Step 1: do X"))
+
+        await backend.execute(self._task(tmp_workdir))
+        second = await backend.execute(self._task(tmp_workdir))
+
+        assert len(backend.plan_calls) == 1
+        assert "Step 1: do X" in backend.tool_loop_calls[1].user_prompt
+        assert second.input_tokens == 100  # act phase only; the cached plan is free
+
+    async def test_no_cache_by_default(self, tmp_workdir: Path) -> None:
+        backend = FakeBackend()
+        backend.set_tool_loop_results(_phase_result("Done"), _phase_result("Done"))
+        backend.set_plan_result(_phase_result("Plan"))
+
+        await backend.execute(self._task(tmp_workdir))
+        await backend.execute(self._task(tmp_workdir))
+
+        assert len(backend.plan_calls) == 2
+
+
 class TestCostAggregation:
     @pytest.mark.asyncio
     async def test_costs_aggregated_across_phases(self, tmp_workdir: Path) -> None:
@@ -253,3 +287,41 @@ class TestStreamNotSupported:
         with pytest.raises(NotImplementedError, match="FakeBackend"):
             async for _ in backend.stream(task):
                 pass
+
+
+class StreamingFakeBackend(FakeBackend):
+    """FakeBackend whose stream yields a fixed event sequence."""
+
+    def __init__(self, events: list[AgentEvent], delay_after: int | None = None) -> None:
+        super().__init__()
+        self._events = events
+        self._delay_after = delay_after
+
+    async def stream(self, task: AgentTask):
+        for i, event in enumerate(self._events):
+            if i == self._delay_after:
+                await asyncio.sleep(0.05)
+            yield event
+
+
+class TestStreamBatched:
+    @pytest.mark.asyncio
+    async def test_batches_by_size(self, tmp_workdir: Path) -> None:
+        events = [AgentEvent("text_delta", {"text": str(i)}) for i in range(5)]
+        backend = StreamingFakeBackend(events + [AgentEvent("done")])
+        task = AgentTask(role="test", system_prompt="sys", user_prompt="task")
+
+        batches = [b async for b in backend.stream_batched(task, max_batch=4, max_delay_ms=1000)]
+
+        assert [len(b.events) for b in batches] == [4, 2]
+        assert [e for b in batches for e in b.events][-1].event_type == "done"
+
+    @pytest.mark.asyncio
+    async def test_flushes_after_delay(self, tmp_workdir: Path) -> None:
+        events = [AgentEvent("text_delta", {"text": str(i)}) for i in range(3)]
+        backend = StreamingFakeBackend(events, delay_after=2)
+        task = AgentTask(role="test", system_prompt="sys", user_prompt="task")
+
+        batches = [b async for b in backend.stream_batched(task, max_batch=32, max_delay_ms=5)]
+
+        assert [len(b.events) for b in batches] == [2, 1]
@@ -15,6 +15,26 @@ from hadron.events.bus import EventBus, RedisEventBus
 # Fake Redis implementation for unit tests (no real Redis required)
 # ---------------------------------------------------------------------------
 
+class _FakePipeline:
+    """Queues commands and runs them in order on execute(), like redis-py's Pipeline."""
+
+    def __init__(self, redis: _FakeRedis) -> None:
+        self._redis = redis
+        self._calls: list[tuple[Any, tuple, dict]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        method = getattr(self._redis, name)
+
+        def queue(*args: Any, **kwargs: Any) -> _FakePipeline:
+            self._calls.append((method, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self) -> list[Any]:
+        return [await method(*args, **kwargs) for method, args, kwargs in self._calls]
+
+
 class _FakeRedis:
     """Minimal Redis Streams + Pub/Sub fake for testing EventBus logic."""
 
@@ -22,6 +42,8 @@ class _FakeRedis:
         self._streams: dict[str, list[tuple[str, dict[str, str]]]] = {}
         self._counter = 0
         self._subscribers: dict[str, list[asyncio.Queue]] = {}
+        self.published: list[str] = []
+        self.pipelines = 0
 
     async def xadd(self, key: str, fields: dict[str, str]) -> str:
         self._counter += 1
@@ -33,7 +55,12 @@ class _FakeRedis:
         return msg_id
 
     async def publish(self, channel: str, message: str) -> int:
-        return 0  # pub/sub not needed for these tests
+        self.published.append(channel)
+        return 0
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        self.pipelines += 1
+        return _FakePipeline(self)
 
     async def xrange(
         self, key: str, min: str = "-", max: str = "+"
@@ -102,6 +129,25 @@ def bus() -> RedisEventBus:
     return RedisEventBus(redis=_FakeRedis())  # type: ignore[arg-type]
 
 
+# ---------------------------------------------------------------------------
+# emit() tests
+# ---------------------------------------------------------------------------
+
+
+class TestEmit:
+    @pytest.mark.asyncio
+    async def test_emit_uses_one_pipeline_for_xadd_and_notify(self) -> None:
+        redis = _FakeRedis()
+        bus = RedisEventBus(redis=redis)  # type: ignore[arg-type]
+
+        await bus.emit(_make_event(stage="intake"))
+
+        assert redis.pipelines == 1
+        assert redis.published == ["hadron:cr:cr-1:events:notify"]
+        pairs, _ = await bus.replay("cr-1")
+        assert len(pairs) == 1
+
+
 # ---------------------------------------------------------------------------
 # replay() tests
 # ---------------------------------------------------------------------------
@@ -139,7 +185,6 @@ class TestReplay:
 # subscribe() from replayed cursor — no gaps
 # ---------------------------------------------------------------------------
 
-
 class TestSubscribeFromCursor:
     @pytest.mark.asyncio
     async def test_subscribe_from_last_replayed_picks_up_new_events(
@@ -0,0 +1,38 @@
+"""Tests for event loop selection."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+from hadron.utils.eventloop import loop_factory, run
+
+
+class TestLoopFactory:
+    def test_uses_uvloop_when_installed(self) -> None:
+        fake_uvloop = MagicMock()
+        with patch.dict(sys.modules, {"uvloop": fake_uvloop}), patch.dict(os.environ):
+            os.environ.pop("HADRON_EVENT_LOOP", None)
+            assert loop_factory() is fake_uvloop.new_event_loop
+
+    def test_env_forces_stdlib_loop(self) -> None:
+        env = {"HADRON_EVENT_LOOP": "asyncio"}
+        with patch.dict(sys.modules, {"uvloop": MagicMock()}), patch.dict(os.environ, env):
+            assert loop_factory() is None
+
+    def test_falls_back_without_uvloop(self) -> None:
+        with patch.dict(sys.modules, {"uvloop": None}), patch.dict(os.environ):
+            os.environ.pop("HADRON_EVENT_LOOP", None)
+            assert loop_factory() is None
+
+
+class TestRun:
+    def test_runs_coroutine_to_completion(self) -> None:
+        async def work() -> int:
+            await asyncio.sleep(0)
+            return 42
+
+        with patch.dict(os.environ, {"HADRON_EVENT_LOOP": "asyncio"}):
+            assert run(work()) == 42
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -10,7 +11,11 @@ import pytest
 
 from hadron.agent.base import AgentCallbacks, AgentTask, PhaseConfig
 from hadron.agent.cost import _compute_model_cost
-from hadron.agent.gemini import GeminiAgentBackend
+from hadron.agent.gemini import (
+    _CACHED_CONTENT_MAX_ENTRIES,
+    GeminiAgentBackend,
+    _elide_old_tool_results,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -35,6 +40,7 @@ def _make_text_response(
     usage = MagicMock()
     usage.prompt_token_count = prompt_tokens
     usage.candidates_token_count = candidates_tokens
+    usage.cached_content_token_count = 0
 
     response = MagicMock()
     response.candidates = [candidate]
@@ -63,6 +69,7 @@ def _make_fn_call_response(
     usage = MagicMock()
     usage.prompt_token_count = prompt_tokens
     usage.candidates_token_count = candidates_tokens
+    usage.cached_content_token_count = 0
 
     response = MagicMock()
     response.candidates = [candidate]
@@ -112,7 +119,7 @@ class TestGeminiBackendExecute:
 
         backend._client.aio.models.generate_content = AsyncMock(side_effect=[fn_resp, text_resp])
 
-        with patch("hadron.agent.gemini.execute_tool", new_callable=AsyncMock, return_value="f main.py"):
+        with patch("hadron.agent.tool_loop.execute_tool", new_callable=AsyncMock, return_value="f main.py"):
             task = AgentTask(
                 role="test", system_prompt="sys", user_prompt="list files",
                 working_directory=str(tmp_workdir),
@@ -123,7 +130,177 @@ class TestGeminiBackendExecute:
 
         assert result.output == "Found files."
         assert len(result.tool_calls) == 1
-        assert result.tool_calls[0]["name"] == "list_directory"
+        assert result.tool_calls[0].name == "list_directory"
+
+
+    @pytest.mark.asyncio
+    async def test_cached_content_tokens_tracked(self, tmp_workdir: Path) -> None:
+        backend = _make_backend()
+        text_resp = _make_text_response("Done!", prompt_tokens=1000, candidates_tokens=100)
+        text_resp.usage_metadata.cached_content_token_count = 600
+        backend._client.aio.models.generate_content = AsyncMock(return_value=text_resp)
+
+        task = AgentTask(
+            role="test", system_prompt="sys", user_prompt="do it",
+            working_directory=str(tmp_workdir),
+            model="gemini-2.5-pro",
+            phases=PhaseConfig(explore_model="", plan_model=""),
+        )
+        result = await backend.execute(task)
+
+        assert result.input_tokens == 400
+        assert result.cache_read_tokens == 600
+        assert result.cache_hit_ratio == pytest.approx(0.6)
+
+    @pytest.mark.asyncio
+    async def test_long_system_prompt_uses_cached_content(self, tmp_workdir: Path) -> None:
+        backend = _make_backend()
+        cache = MagicMock()
+        cache.name = "cachedContents/abc"
+        backend._client.aio.caches.create = AsyncMock(return_value=cache)
+        backend._client.aio.models.generate_content = AsyncMock(
+            return_value=_make_text_response("Done!"),
+        )
+
+        task = AgentTask(
+            role="test", system_prompt="x" * 5000, user_prompt="do it",
+            working_directory=str(tmp_workdir),
+            phases=PhaseConfig(explore_model="", plan_model=""),
+        )
+        await backend.execute(task)
+        await backend.execute(task)
+
+        assert backend._client.aio.caches.create.await_count == 1
+        config = backend._client.aio.models.generate_content.call_args.kwargs["config"]
+        assert config.cached_content == "cachedContents/abc"
+        assert config.system_instruction is None
+
+    @pytest.mark.asyncio
+    async def test_cache_create_failure_falls_back_to_inline(self, tmp_workdir: Path) -> None:
+        backend = _make_backend()
+        backend._client.aio.caches.create = AsyncMock(side_effect=RuntimeError("too small"))
+        backend._client.aio.models.generate_content = AsyncMock(
+            return_value=_make_text_response("Done!"),
+        )
+
+        task = AgentTask(
+            role="test", system_prompt="x" * 5000, user_prompt="do it",
+            working_directory=str(tmp_workdir),
+            phases=PhaseConfig(explore_model="", plan_model=""),
+        )
+        result = await backend.execute(task)
+
+        assert result.output == "Done!"
+        config = backend._client.aio.models.generate_content.call_args.kwargs["config"]
+        assert config.system_instruction == "x" * 5000
+
+    @pytest.mark.asyncio
+    async def test_concurrent_phases_share_one_cache_create(self) -> None:
+        backend = _make_backend()
+        release = asyncio.Event()
+        cache = MagicMock()
+        cache.name = "cachedContents/abc"
+
+        async def slow_create(**kwargs: Any) -> MagicMock:
+            await release.wait()
+            return cache
+
+        backend._client.aio.caches.create = AsyncMock(side_effect=slow_create)
+        calls = [
+            asyncio.create_task(backend._cached_content("gemini-2.5-pro", "x" * 5000, []))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*calls) == ["cachedContents/abc"] * 3
+        assert backend._client.aio.caches.create.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_content_index_is_bounded(self) -> None:
+        backend = _make_backend()
+        caches = [MagicMock() for _ in range(_CACHED_CONTENT_MAX_ENTRIES + 4)]
+        for i, cache in enumerate(caches):
+            cache.name = f"cachedContents/{i}"
+        backend._client.aio.caches.create = AsyncMock(side_effect=caches)
+        backend._client.aio.caches.delete = AsyncMock()
+        for i in range(len(caches)):
+            await backend._cached_content("gemini-2.5-pro", f"{i}" + "x" * 5000, [])
+
+        assert len(backend._cached_contents) == _CACHED_CONTENT_MAX_ENTRIES
+        deleted = [c.kwargs["name"] for c in backend._client.aio.caches.delete.await_args_list]
+        assert deleted == [f"cachedContents/{i}" for i in range(4)]
+
+    @pytest.mark.asyncio
+    async def test_cache_rechecked_each_round(self, tmp_workdir: Path) -> None:
+        backend = _make_backend()
+        first, second = MagicMock(), MagicMock()
+        first.name, second.name = "cachedContents/old", "cachedContents/new"
+        backend._client.aio.caches.create = AsyncMock(side_effect=[first, second])
+
+        async def generate(**kwargs: Any) -> MagicMock:
+            if generate.calls == 0:
+                # The first cache lapses while the tool runs
+                for key, (name, _) in list(backend._cached_contents.items()):
+                    backend._cached_contents[key] = (name, 0.0)
+                generate.calls += 1
+                return _make_fn_call_response("list_directory", {"path": "."})
+            return _make_text_response("Done!")
+
+        generate.calls = 0
+        backend._client.aio.models.generate_content = AsyncMock(side_effect=generate)
+
+        with patch("hadron.agent.tool_loop.execute_tool", new_callable=AsyncMock, return_value="f main.py"):
+            task = AgentTask(
+                role="test", system_prompt="x" * 5000, user_prompt="list files",
+                working_directory=str(tmp_workdir),
+                phases=PhaseConfig(explore_model="", plan_model=""),
+            )
+            await backend.execute(task)
+
+        configs = [c.kwargs["config"] for c in backend._client.aio.models.generate_content.call_args_list]
+        assert [c.cached_content for c in configs] == ["cachedContents/old", "cachedContents/new"]
+
+    @pytest.mark.asyncio
+    async def test_rejected_cache_falls_back_to_inline(self, tmp_workdir: Path) -> None:
+        class NotFound(Exception):
+            code = 404
+
+        backend = _make_backend()
+        cache = MagicMock()
+        cache.name = "cachedContents/gone"
+        backend._client.aio.caches.create = AsyncMock(return_value=cache)
+        backend._client.aio.models.generate_content = AsyncMock(
+            side_effect=[NotFound("cached content not found"), _make_text_response("Done!")],
+        )
+
+        task = AgentTask(
+            role="test", system_prompt="x" * 5000, user_prompt="do it",
+            working_directory=str(tmp_workdir),
+            phases=PhaseConfig(explore_model="", plan_model=""),
+        )
+        result = await backend.execute(task)
+
+        assert result.output == "Done!"
+        config = backend._client.aio.models.generate_content.call_args.kwargs["config"]
+        assert config.system_instruction == "x" * 5000
+        assert config.cached_content is None
+        # Later rounds skip the rejected cache until it would have expired
+        assert [name for name, _ in backend._cached_contents.values()] == [None]
+
+    @pytest.mark.asyncio
+    async def test_aclose_deletes_created_caches(self) -> None:
+        backend = _make_backend()
+        cache = MagicMock()
+        cache.name = "cachedContents/abc"
+        backend._client.aio.caches.create = AsyncMock(return_value=cache)
+        backend._client.aio.caches.delete = AsyncMock()
+        await backend._cached_content("gemini-2.5-pro", "x" * 5000, [])
+
+        await backend.aclose()
+
+        backend._client.aio.caches.delete.assert_awaited_once_with(name="cachedContents/abc")
+        assert backend._cached_contents == {}
 
 
 class TestGeminiBackendPlan:
@@ -144,6 +321,23 @@ class TestGeminiBackendPlan:
         assert result.input_tokens == 300
         assert result.output_tokens == 200
 
+    @pytest.mark.asyncio
+    async def test_plan_does_not_create_context_cache(self) -> None:
+        backend = _make_backend()
+        backend._client.aio.caches.create = AsyncMock()
+        backend._client.aio.models.generate_content = AsyncMock(
+            return_value=_make_text_response("The plan"),
+        )
+
+        await backend._call_plan(
+            model="gemini-2.5-pro", system_prompt="x" * 5000,
+            user_prompt="task", max_tokens=8192,
+        )
+
+        backend._client.aio.caches.create.assert_not_awaited()
+        config = backend._client.aio.models.generate_content.call_args.kwargs["config"]
+        assert config.system_instruction == "x" * 5000
+
 
 class TestGeminiBackendEvents:
     @pytest.mark.asyncio
@@ -176,3 +370,27 @@ class TestGeminiBackendEvents:
         assert phase_started[0]["phase"] == "explore"
         assert phase_started[1]["phase"] == "plan"
         assert phase_started[2]["phase"] == "act"
+
+
+class TestElideOldToolResults:
+    def test_keeps_latest_rounds_verbatim(self) -> None:
+        from google.genai import types
+
+        def tool_turn(text: str) -> types.Content:
+            return types.Content(role="user", parts=[
+                types.Part.from_function_response(name="read_file", response={"result": text}),
+            ])
+
+        contents = [
+            types.Content(role="user", parts=[types.Part.from_text(text="task")]),
+            tool_turn("old" * 100),
+            tool_turn("mid"),
+            tool_turn("new"),
+        ]
+
+        assert _elide_old_tool_results(contents, keep_rounds=2) == 1
+        assert "elided" in contents[1].parts[0].function_response.response
+        assert contents[2].parts[0].function_response.response == {"result": "mid"}
+        assert contents[0].parts[0].text == "task"
+        # Already-elided responses are left alone on the next pass
+        assert _elide_old_tool_results(contents, keep_rounds=2) == 0
@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, MagicMock
 import httpx
 import pytest
 from fastapi import FastAPI
+from sqlalchemy.exc import IntegrityError
 
 from hadron.controller.routes.intake import router
 
@@ -31,8 +32,8 @@ def _make_app(
 def _mock_session_factory(*, existing_external_id: str | None = None):
     """Return an async context-manager session factory backed by mocks.
 
-    The mock session records ``add`` calls and simulates a duplicate-check
-    query when *existing_external_id* matches.
+    The mock session records ``add`` calls and simulates the unique-constraint
+    violation on commit when *existing_external_id* is set.
     """
     session = AsyncMock()
     session.added: list = []  # type: ignore[attr-defined]
@@ -45,14 +46,14 @@ def _mock_session_factory(*, existing_external_id: str | None = None):
 
     session.add = MagicMock(side_effect=_track_add)
 
-    # Simulate the SELECT for duplicate external_id.
     result_mock = MagicMock()
-    if existing_external_id:
-        # Return a truthy sentinel so the route raises 409.
-        result_mock.scalar_one_or_none.return_value = object()
-    else:
-        result_mock.scalar_one_or_none.return_value = None
+    result_mock.scalar_one_or_none.return_value = None
     session.execute = AsyncMock(return_value=result_mock)
+    if existing_external_id:
+        session.commit = AsyncMock(side_effect=IntegrityError(
+            "INSERT INTO cr_runs ...", {},
+            Exception('duplicate key value violates unique constraint "cr_runs_external_id_key"'),
+        ))
 
     @asynccontextmanager
     async def factory():
@@ -364,7 +365,7 @@ class TestTemplateSlug:
         call_idx = {"i": 0}
 
         # Execute calls in order:
-        # 0. duplicate external_id check (returns None — CR has no external_id)
+        # 0. prompt templates load (returns None)
         # 1. backend_templates load (returns the opencode template list)
         # 2. pipeline_defaults load (returns None)
         async def fake_execute(stmt):
@@ -11,11 +11,14 @@ class _FakeRedis:
     """Minimal fake Redis for testing interventions."""
 
     def __init__(self) -> None:
-        self._data: dict[str, str] = {}
+        self._data: dict[str, str | list[str]] = {}
 
     async def set(self, key: str, value: str) -> None:
         self._data[key] = value
 
+    async def rpush(self, key: str, value: str) -> None:
+        self._data.setdefault(key, []).append(value)
+
     def pipeline(self) -> "_FakePipeline":
         return _FakePipeline(self)
 
@@ -28,6 +31,9 @@ class _FakePipeline:
     def get(self, key: str) -> None:
         self._ops.append(("get", key))
 
+    def lrange(self, key: str, start: int, end: int) -> None:
+        self._ops.append(("lrange", key))
+
     def delete(self, key: str) -> None:
         self._ops.append(("delete", key))
 
@@ -37,6 +43,8 @@ class _FakePipeline:
             if op == "get":
                 val = self._redis._data.get(key)
                 results.append(val.encode() if val is not None else None)
+            elif op == "lrange":
+                results.append([v.encode() for v in self._redis._data.get(key, [])])
             elif op == "delete":
                 deleted = 1 if key in self._redis._data else 0
                 self._redis._data.pop(key, None)
@@ -96,3 +104,19 @@ class TestInterventionManager:
         await mgr.set_nudge("cr-1", "reviewer", "msg for reviewer")
         assert await mgr.poll_nudge("cr-1", "tdd") == "msg for tdd"
         assert await mgr.poll_nudge("cr-1", "reviewer") == "msg for reviewer"
+
+    @pytest.mark.asyncio
+    async def test_pending_nudges_drained_together(self) -> None:
+        mgr = InterventionManager(_FakeRedis())
+        await mgr.set_nudge("cr-1", "tdd", "first")
+        await mgr.set_nudge("cr-1", "tdd", "second")
+        assert await mgr.poll_nudge("cr-1", "tdd") == "first\n\nsecond"
+        assert await mgr.poll_nudge("cr-1", "tdd") is None
+
+    @pytest.mark.asyncio
+    async def test_legacy_string_nudge_key_ignored(self) -> None:
+        redis = _FakeRedis()
+        await redis.set("hadron:cr:cr-1:nudge:tdd", "left over from before the upgrade")
+        mgr = InterventionManager(redis)
+        await mgr.set_nudge("cr-1", "tdd", "new nudge")
+        assert await mgr.poll_nudge("cr-1", "tdd") == "new nudge"
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import sys
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -66,6 +68,20 @@ class TestSubprocessJobSpawner:
             env = mock_exec.call_args[1]["env"]
             assert env["HADRON_ANTHROPIC_API_KEY"] == "sk-test-key"
 
+    @pytest.mark.asyncio
+    async def test_spawn_inherits_env_without_overrides(self) -> None:
+        with patch(
+            "hadron.controller.job_spawner.asyncio.create_subprocess_exec",
+            new_callable=AsyncMock,
+            return_value=AsyncMock(),
+        ) as mock_exec, patch(
+            "hadron.controller.job_spawner.inject_trace_context", return_value={},
+        ):
+            spawner = SubprocessJobSpawner()
+            await spawner.spawn("cr-1", "https://github.com/org/repo", "repo")
+
+            assert mock_exec.call_args[1]["env"] is None
+
     @pytest.mark.asyncio
     async def test_spawn_extracts_repo_name(self) -> None:
         mock_proc = AsyncMock()
@@ -119,6 +135,80 @@ class TestSubprocessJobSpawner:
         await spawner._log_output("cr-1:repo", mock_proc)
         assert "cr-1:repo" not in spawner._processes
 
+    @pytest.mark.asyncio
+    async def test_spawn_queues_beyond_max_workers(self) -> None:
+        finish = asyncio.Event()
+
+        async def _wait() -> int:
+            await finish.wait()
+            return 0
+
+        def _make_proc(*args, **kwargs):
+            proc = AsyncMock()
+            proc.stdout = _AsyncLineIter([])
+            proc.wait = AsyncMock(side_effect=_wait)
+            proc.returncode = 0
+            return proc
+
+        with patch(
+            "hadron.controller.job_spawner.asyncio.create_subprocess_exec",
+            new_callable=AsyncMock,
+            side_effect=_make_proc,
+        ) as mock_exec:
+            spawner = SubprocessJobSpawner(max_workers=1)
+            await spawner.spawn("cr-1", "https://github.com/org/a", "a")
+            await spawner.spawn("cr-2", "https://github.com/org/b", "b")
+            await asyncio.sleep(0)
+
+            assert mock_exec.await_count == 1
+            assert list(spawner._processes) == ["cr-1:a"]
+
+            finish.set()
+            for _ in range(10):
+                await asyncio.sleep(0)
+
+            assert mock_exec.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_duplicate_key_does_not_leak_slots(self) -> None:
+        finishes: list[asyncio.Event] = []
+
+        def _make_proc(*args, **kwargs):
+            finish = asyncio.Event()
+            finishes.append(finish)
+
+            async def _wait() -> int:
+                await finish.wait()
+                return 0
+
+            proc = AsyncMock()
+            proc.stdout = _AsyncLineIter([])
+            proc.wait = AsyncMock(side_effect=_wait)
+            proc.returncode = 0
+            return proc
+
+        with patch(
+            "hadron.controller.job_spawner.asyncio.create_subprocess_exec",
+            new_callable=AsyncMock,
+            side_effect=_make_proc,
+        ):
+            spawner = SubprocessJobSpawner(max_workers=2)
+            await spawner.spawn("cr-1", "https://github.com/org/a", "a")
+            await spawner.spawn("cr-1", "https://github.com/org/a", "a")
+            second = spawner._processes["cr-1:a"]
+
+            finishes[0].set()
+            for _ in range(10):
+                await asyncio.sleep(0)
+            # The first worker's exit must not evict the live second one.
+            assert spawner._processes["cr-1:a"] is second
+
+            finishes[1].set()
+            for _ in range(10):
+                await asyncio.sleep(0)
+
+        assert spawner._processes == {}
+        assert spawner._slots._value == 2
 
 class TestK8sJobSpawner:
     def test_init_defaults(self) -> None:
@@ -130,3 +220,16 @@ class TestK8sJobSpawner:
         spawner = K8sJobSpawner(namespace="prod", worker_image="myimage:v2")
         assert spawner._namespace == "prod"
         assert spawner._worker_image == "myimage:v2"
+
+    def test_apis_load_config_once(self) -> None:
+        k8s = MagicMock()
+        with patch.dict(sys.modules, {
+            "kubernetes": k8s, "kubernetes.client": k8s.client, "kubernetes.config": k8s.config,
+        }):
+            spawner = K8sJobSpawner()
+            first = spawner._apis()
+            second = spawner._apis()
+
+        assert first == second
+        k8s.config.load_incluster_config.assert_called_once()
+        k8s.client.BatchV1Api.assert_called_once()
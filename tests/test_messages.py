@@ -0,0 +1,36 @@
+"""Tests for conversation message serialization."""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+
+from hadron.agent.messages import _serialize_messages
+
+
+class TestSerializeMessages:
+    def test_sdk_blocks_converted(self) -> None:
+        messages = [
+            {"role": "user", "content": "task"},
+            {"role": "assistant", "content": [
+                SimpleNamespace(type="text", text="Looking."),
+                SimpleNamespace(type="tool_use", id="t1", name="read_file", input={"path": "a"}),
+                SimpleNamespace(type="thinking", thinking="..."),
+            ]},
+            {"role": "user", "content": [{"type": "tool_result", "tool_use_id": "t1", "content": "x"}]},
+        ]
+        result = _serialize_messages(messages)
+        assert result == [
+            {"role": "user", "content": "task"},
+            {"role": "assistant", "content": [
+                {"type": "text", "text": "Looking."},
+                {"type": "tool_use", "id": "t1", "name": "read_file", "input": {"path": "a"}},
+            ]},
+            {"role": "user", "content": [{"type": "tool_result", "tool_use_id": "t1", "content": "x"}]},
+        ]
+        json.dumps(result)
+
+    def test_empty_content(self) -> None:
+        assert _serialize_messages([{"role": "user", "content": None}]) == [
+            {"role": "user", "content": ""},
+        ]
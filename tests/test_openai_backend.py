@@ -49,6 +49,7 @@ def _make_text_response(
     usage = MagicMock()
     usage.prompt_tokens = prompt_tokens
     usage.completion_tokens = completion_tokens
+    usage.prompt_tokens_details = None
 
     response = MagicMock()
     response.choices = [choice]
@@ -84,6 +85,7 @@ def _make_tool_response(
     usage = MagicMock()
     usage.prompt_tokens = prompt_tokens
     usage.completion_tokens = completion_tokens
+    usage.prompt_tokens_details = None
 
     response = MagicMock()
     response.choices = [choice]
@@ -140,7 +142,7 @@ class TestOpenAIBackendExecute:
 
             backend._client.chat.completions.create = AsyncMock(side_effect=[tool_resp, text_resp])
 
-            with patch("hadron.agent.openai_backend.execute_tool", new_callable=AsyncMock, return_value="f main.py"):
+            with patch("hadron.agent.tool_loop.execute_tool", new_callable=AsyncMock, return_value="f main.py"):
                 task = AgentTask(
                     role="test", system_prompt="sys", user_prompt="list files",
                     working_directory=str(tmp_workdir),
@@ -151,7 +153,40 @@ class TestOpenAIBackendExecute:
 
             assert result.output == "Found files."
             assert len(result.tool_calls) == 1
-            assert result.tool_calls[0]["name"] == "list_directory"
+            assert result.tool_calls[0].name == "list_directory"
+        finally:
+            sys.modules.pop("openai", None)
+            sys.modules.pop("hadron.agent.openai_backend", None)
+
+
+    @pytest.mark.asyncio
+    async def test_cached_prompt_tokens_tracked(self, tmp_workdir: Path) -> None:
+        mock_openai, mock_client = _install_openai_mock()
+        try:
+            sys.modules.pop("hadron.agent.openai_backend", None)
+            from hadron.agent.openai_backend import OpenAIAgentBackend
+            from hadron.agent.cost import OPENAI_CACHE_READ_RATE
+
+            backend = OpenAIAgentBackend(api_key="test-key")
+            text_resp = _make_text_response("Done!", prompt_tokens=1000, completion_tokens=100)
+            text_resp.usage.prompt_tokens_details = MagicMock(cached_tokens=800)
+            backend._client.chat.completions.create = AsyncMock(return_value=text_resp)
+
+            task = AgentTask(
+                role="test", system_prompt="sys", user_prompt="do it",
+                working_directory=str(tmp_workdir),
+                model="gpt-4.1",
+                phases=PhaseConfig(explore_model="", plan_model=""),
+            )
+            result = await backend.execute(task)
+
+            assert result.input_tokens == 200
+            assert result.cache_read_tokens == 800
+            assert result.cache_hit_ratio == pytest.approx(0.8)
+            expected_cost = _compute_model_cost(
+                "gpt-4.1", 200, 100, cache_read_tokens=800, cache_read_rate=OPENAI_CACHE_READ_RATE,
+            )
+            assert result.cost_usd == pytest.approx(expected_cost)
         finally:
             sys.modules.pop("openai", None)
             sys.modules.pop("hadron.agent.openai_backend", None)
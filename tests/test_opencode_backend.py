@@ -187,7 +187,7 @@ class TestCallToolLoop:
         assert result.cache_read_tokens == 10
         assert result.cache_creation_tokens == 5
         assert len(result.tool_calls) == 1
-        assert result.tool_calls[0]["name"] == "write"
+        assert result.tool_calls[0].name == "write"
         assert result.output == "Done! I wrote foo.py"
         assert result.round_count >= 1
 
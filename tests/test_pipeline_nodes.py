@@ -1661,6 +1661,14 @@ class TestIsTransientLlmError:
         from hadron.pipeline.nodes.agent_run import _is_transient_llm_error
         assert _is_transient_llm_error(Exception("resource exhausted"))
 
+    def test_http_status_code_attribute(self) -> None:
+        from hadron.pipeline.nodes.agent_run import _is_transient_llm_error
+        err = Exception("quota")
+        err.code = 429  # type: ignore[attr-defined]
+        assert _is_transient_llm_error(err)
+        err.code = 400  # type: ignore[attr-defined]
+        assert not _is_transient_llm_error(err)
+
 
 class TestRunAgentNodeLevelRetry:
     """Tests for node-level retry in run_agent."""
@@ -82,6 +82,24 @@ def _build_factory_single_query(result_value, *, scalar=True):
     return factory, session
 
 
+def _build_factory_one_session(*results):
+    """Factory for routes that run several statements on one session.
+
+    ``factory.opened`` counts how many sessions the route checked out.
+    """
+    session = AsyncMock()
+    session.execute = AsyncMock(side_effect=list(results))
+    session.commit = AsyncMock()
+
+    @asynccontextmanager
+    async def factory():
+        factory.opened += 1
+        yield session
+
+    factory.opened = 0
+    return factory, session
+
+
 def _build_factory_two_queries(cr_run, repo_runs):
     """Factory for routes that do two queries: CR lookup + repo listing."""
     cr_result = MagicMock()
@@ -105,11 +123,33 @@ def _build_factory_two_queries(cr_run, repo_runs):
 # ---------------------------------------------------------------------------
 
 
+def _make_list_row(cr_id="cr-1", title="Test CR", **kwargs):
+    """A /pipeline/list result row: the listed columns plus the SQL-extracted title."""
+    cr = _make_cr(cr_id, **kwargs)
+    del cr.raw_cr_json, cr.pause_reason
+    cr.title = title
+    return cr
+
+
+def _build_factory_rows(rows):
+    """Factory for routes that select columns and read ``result.all()``."""
+    result_mock = MagicMock()
+    result_mock.all.return_value = rows
+
+    session = AsyncMock()
+    session.execute = AsyncMock(return_value=result_mock)
+
+    @asynccontextmanager
+    async def factory():
+        yield session
+
+    return factory, session
+
+
 class TestListPipelines:
     @pytest.mark.asyncio
     async def test_list_returns_runs(self) -> None:
-        cr = _make_cr("cr-1")
-        factory, _ = _build_factory_single_query([cr], scalar=False)
+        factory, _ = _build_factory_rows([_make_list_row("cr-1")])
         app = _make_app(session_factory=factory)
         async with AsyncClient(
             transport=ASGITransport(app=app), base_url="http://test"
@@ -124,7 +164,7 @@ class TestListPipelines:
 
     @pytest.mark.asyncio
     async def test_list_empty(self) -> None:
-        factory, _ = _build_factory_single_query([], scalar=False)
+        factory, _ = _build_factory_rows([])
         app = _make_app(session_factory=factory)
         async with AsyncClient(
             transport=ASGITransport(app=app), base_url="http://test"
@@ -135,9 +175,9 @@ class TestListPipelines:
         assert resp.json() == []
 
     @pytest.mark.asyncio
-    async def test_extract_title_no_title_in_json(self) -> None:
-        cr = _make_cr("cr-2", raw_cr_json={"description": "no title key"})
-        factory, _ = _build_factory_single_query([cr], scalar=False)
+    async def test_missing_title_is_empty_string(self) -> None:
+        """No title key (or no raw_cr_json) comes back from SQL as NULL."""
+        factory, _ = _build_factory_rows([_make_list_row("cr-2", title=None)])
         app = _make_app(session_factory=factory)
         async with AsyncClient(
             transport=ASGITransport(app=app), base_url="http://test"
@@ -148,19 +188,20 @@ class TestListPipelines:
         assert resp.json()[0]["title"] == ""
 
     @pytest.mark.asyncio
-    async def test_extract_title_null_raw_cr_json(self) -> None:
-        """raw_cr_json is None (not a dict)."""
-        cr = _make_cr("cr-3")
-        cr.raw_cr_json = None
-        factory, _ = _build_factory_single_query([cr], scalar=False)
+    async def test_selects_columns_not_json_blobs(self) -> None:
+        from sqlalchemy.dialects import postgresql
+
+        factory, session = _build_factory_rows([])
         app = _make_app(session_factory=factory)
         async with AsyncClient(
             transport=ASGITransport(app=app), base_url="http://test"
         ) as client:
-            resp = await client.get("/api/pipeline/list")
+            resp = await client.get("/api/pipeline/list", params={"search": "login"})
 
         assert resp.status_code == 200
-        assert resp.json()[0]["title"] == ""
+        sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "config_snapshot_json" not in sql
+        assert "raw_cr_json ->>" in sql
 
 
 # ---------------------------------------------------------------------------
@@ -432,31 +473,15 @@ class TestResumePipeline:
         cr = _make_cr("cr-1", status="paused")
         repos = [_make_repo("cr-1", "backend", status="paused")]
 
-        # Context 1: check CR exists + status
         cr_result = MagicMock()
         cr_result.scalar_one_or_none.return_value = cr
-
-        # Context 2: select paused repos
         repo_result = MagicMock()
         repo_result.scalars.return_value.all.return_value = repos
 
-        # Context 3: update CRRun + update RepoRun + commit
-        update_result = MagicMock()
-
-        sessions = []
-        for side_effects in [[cr_result], [repo_result], [update_result, update_result]]:
-            s = AsyncMock()
-            s.execute = AsyncMock(side_effect=side_effects)
-            s.commit = AsyncMock()
-            sessions.append(s)
-
-        call_idx = {"i": 0}
-
-        @asynccontextmanager
-        async def factory():
-            idx = call_idx["i"]
-            call_idx["i"] += 1
-            yield sessions[idx]
+        # CR check, paused-repo select, then both status updates
+        factory, session = _build_factory_one_session(
+            cr_result, repo_result, MagicMock(), MagicMock(),
+        )
 
         spawner = AsyncMock()
         event_bus = AsyncMock()
@@ -482,6 +507,38 @@ class TestResumePipeline:
         assert body["status"] == "resumed"
         spawner.spawn.assert_awaited_once()
         event_bus.emit.assert_awaited_once()
+        assert factory.opened == 1
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_resume_overrides_written_before_commit(self) -> None:
+        cr_result = MagicMock()
+        cr_result.scalar_one_or_none.return_value = _make_cr("cr-1", status="failed")
+        repo_result = MagicMock()
+        repo_result.scalars.return_value.all.return_value = [_make_repo("cr-1", "backend", status="failed")]
+        factory, session = _build_factory_one_session(cr_result, repo_result, MagicMock(), MagicMock())
+
+        commits_seen: list[int] = []
+        redis = AsyncMock()
+        redis.set = AsyncMock(side_effect=lambda *a, **k: commits_seen.append(session.commit.await_count))
+        event_bus = AsyncMock()
+        event_bus.emit = AsyncMock(side_effect=lambda *a: commits_seen.append(session.commit.await_count))
+
+        app = _make_app(
+            session_factory=factory, redis=redis,
+            job_spawner=AsyncMock(), event_bus=event_bus,
+        )
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            resp = await client.post(
+                "/api/pipeline/cr-1/resume",
+                json={"state_overrides": {"skip_review": True}},
+            )
+
+        assert resp.status_code == 200
+        # Overrides land before the status flip commits; the resumed event after it
+        assert commits_seen == [0, 1]
 
     @pytest.mark.asyncio
     async def test_resume_not_found(self) -> None:
@@ -537,36 +594,15 @@ class TestCIResult:
         cr = _make_cr("cr-1", status="paused")
         repo = _make_repo("cr-1", "backend", status="paused")
 
-        # 4 context managers: CR lookup, repo lookup, status updates, spawn
-        sessions = []
-
-        # Session 1: CR lookup
         cr_result = MagicMock()
         cr_result.scalar_one_or_none.return_value = cr
-        s1 = AsyncMock()
-        s1.execute = AsyncMock(return_value=cr_result)
-        sessions.append(s1)
-
-        # Session 2: Repo lookup
         repo_result = MagicMock()
         repo_result.scalar_one_or_none.return_value = repo
-        s2 = AsyncMock()
-        s2.execute = AsyncMock(return_value=repo_result)
-        sessions.append(s2)
-
-        # Session 3: Updates
-        s3 = AsyncMock()
-        s3.execute = AsyncMock(return_value=MagicMock())
-        s3.commit = AsyncMock()
-        sessions.append(s3)
 
-        call_idx = {"i": 0}
-
-        @asynccontextmanager
-        async def factory():
-            idx = call_idx["i"]
-            call_idx["i"] += 1
-            yield sessions[idx]
+        # CR lookup, repo lookup, then both status updates
+        factory, _ = _build_factory_one_session(
+            cr_result, repo_result, MagicMock(), MagicMock(),
+        )
 
         spawner = AsyncMock()
         event_bus = AsyncMock()
@@ -590,42 +626,29 @@ class TestCIResult:
         assert body["status"] == "resumed"
         assert body["ci_passed"] is True
         spawner.spawn.assert_awaited_once()
+        assert factory.opened == 1
 
     @pytest.mark.asyncio
     async def test_ci_failed_resumes_for_fix(self) -> None:
         cr = _make_cr("cr-1", status="paused")
         repo = _make_repo("cr-1", "backend", status="paused")
 
-        sessions = []
-
         cr_result = MagicMock()
         cr_result.scalar_one_or_none.return_value = cr
-        s1 = AsyncMock()
-        s1.execute = AsyncMock(return_value=cr_result)
-        sessions.append(s1)
-
         repo_result = MagicMock()
         repo_result.scalar_one_or_none.return_value = repo
-        s2 = AsyncMock()
-        s2.execute = AsyncMock(return_value=repo_result)
-        sessions.append(s2)
-
-        s3 = AsyncMock()
-        s3.execute = AsyncMock(return_value=MagicMock())
-        s3.commit = AsyncMock()
-        sessions.append(s3)
-
-        call_idx = {"i": 0}
 
-        @asynccontextmanager
-        async def factory():
-            idx = call_idx["i"]
-            call_idx["i"] += 1
-            yield sessions[idx]
+        # CR lookup, repo lookup, then both status updates
+        factory, session = _build_factory_one_session(
+            cr_result, repo_result, MagicMock(), MagicMock(),
+        )
 
+        commits_seen: list[int] = []
         spawner = AsyncMock()
         event_bus = AsyncMock()
+        event_bus.emit = AsyncMock(side_effect=lambda *a: commits_seen.append(session.commit.await_count))
         redis = AsyncMock()
+        redis.set = AsyncMock(side_effect=lambda *a, **k: commits_seen.append(session.commit.await_count))
 
         app = _make_app(
             session_factory=factory, redis=redis,
@@ -640,6 +663,9 @@ class TestCIResult:
                 json={"repo_name": "backend", "passed": False, "log_tail": "FAILED: 2 tests"},
             )
 
+        # CI event and override write before the status flip commits; resumed event after
+        assert commits_seen == [0, 0, 1]
+
         assert resp.status_code == 200
         body = resp.json()
         assert body["status"] == "resumed_for_fix"
@@ -5,11 +5,13 @@ from __future__ import annotations
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import anthropic
+import httpx
 import pytest
 
 from hadron.agent.rate_limiter import (
     MAX_WAIT_SECONDS,
     MIN_WAIT_SECONDS,
+    RateGate,
     RetryResult,
     _extract_retry_after,
     call_with_retry,
@@ -26,6 +28,19 @@ def _make_rate_limit_error(retry_after: str | None = None) -> anthropic.RateLimi
     )
 
 
+class _CodedError(Exception):
+    """Stand-in for SDK errors (e.g. google-genai) that carry the HTTP status as .code."""
+
+    def __init__(self, code: int) -> None:
+        super().__init__(f"HTTP {code}")
+        self.code = code
+
+
+def _upper_bound(low: float, high: float) -> float:
+    """Stand-in for random.uniform that always picks the top of the jitter window."""
+    return high
+
+
 class TestExtractRetryAfter:
     def test_extracts_numeric_header(self) -> None:
         err = _make_rate_limit_error("5")
@@ -66,13 +81,14 @@ class TestCallWithRetry:
         api_call = AsyncMock(
             side_effect=[_make_rate_limit_error(), "ok"]
         )
-        with patch("hadron.agent.rate_limiter.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        with patch("hadron.agent.rate_limiter.asyncio.sleep", new_callable=AsyncMock) as mock_sleep, \
+                patch("hadron.agent.rate_limiter.random.uniform", side_effect=_upper_bound):
             result = await call_with_retry(
                 api_call, label="test", max_retries=3, base_wait=5
             )
         assert result.value == "ok"
         assert result.throttle_count == 1
-        assert result.throttle_seconds == 5.0  # base_wait * (attempt + 1) = 5 * 1
+        assert result.throttle_seconds == 5.0  # base_wait * 2**attempt = 5 * 1
         mock_sleep.assert_awaited_once_with(5.0)
         assert api_call.await_count == 2
 
@@ -119,13 +135,32 @@ class TestCallWithRetry:
         api_call = AsyncMock(
             side_effect=[_make_rate_limit_error(), _make_rate_limit_error(), "ok"]
         )
-        with patch("hadron.agent.rate_limiter.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        with patch("hadron.agent.rate_limiter.asyncio.sleep", new_callable=AsyncMock) as mock_sleep, \
+                patch("hadron.agent.rate_limiter.random.uniform", side_effect=_upper_bound):
             result = await call_with_retry(
                 api_call, label="test", max_retries=5, base_wait=100
             )
         # attempt 0: min(100*1, 120) = 100, attempt 1: min(100*2, 120) = 120
         assert result.throttle_seconds == 100 + MAX_WAIT_SECONDS
 
+    @pytest.mark.asyncio
+    async def test_fallback_backoff_is_exponential_with_jitter(self) -> None:
+        api_call = AsyncMock(side_effect=[_make_rate_limit_error()] * 3 + ["ok"])
+        with patch("hadron.agent.rate_limiter.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            await call_with_retry(api_call, label="test", max_retries=5, base_wait=8)
+        waits = [c.args[0] for c in mock_sleep.await_args_list]
+        for wait, backoff in zip(waits, (8, 16, 32)):
+            assert backoff / 2 <= wait <= backoff
+
+    @pytest.mark.asyncio
+    async def test_retries_on_connection_error(self) -> None:
+        error = anthropic.APIConnectionError(request=httpx.Request("POST", "https://api.test"))
+        api_call = AsyncMock(side_effect=[error, "ok"])
+        with patch("hadron.agent.rate_limiter.asyncio.sleep", new_callable=AsyncMock):
+            result = await call_with_retry(api_call, label="test", max_retries=3, base_wait=2)
+        assert result.value == "ok"
+        assert result.throttle_count == 1
+
     @pytest.mark.asyncio
     async def test_exhausts_retries(self) -> None:
         api_call = AsyncMock(side_effect=_make_rate_limit_error())
@@ -157,6 +192,21 @@ class TestCallWithRetry:
             await call_with_retry(api_call, label="test")
         api_call.assert_awaited_once()
 
+    @pytest.mark.asyncio
+    async def test_coded_bad_request_not_retried(self) -> None:
+        api_call = AsyncMock(side_effect=_CodedError(400))
+        with pytest.raises(_CodedError):
+            await call_with_retry(api_call, label="test", transient_errors=(_CodedError,))
+        api_call.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_coded_rate_limit_retried(self) -> None:
+        api_call = AsyncMock(side_effect=[_CodedError(429), "ok"])
+        with patch("hadron.agent.rate_limiter.asyncio.sleep", new_callable=AsyncMock):
+            result = await call_with_retry(api_call, label="test", transient_errors=(_CodedError,))
+        assert result.value == "ok"
+        assert result.throttle_count == 1
+
     @pytest.mark.asyncio
     async def test_multiple_retries_accumulate_throttle_stats(self) -> None:
         api_call = AsyncMock(
@@ -173,3 +223,39 @@ class TestCallWithRetry:
         assert result.value == "ok"
         assert result.throttle_count == 2
         assert result.throttle_seconds == 8.0  # 3 + 5
+
+
+class TestRateGate:
+    @pytest.mark.asyncio
+    async def test_open_gate_does_not_wait(self) -> None:
+        assert await RateGate().wait() == 0.0
+
+    @pytest.mark.asyncio
+    async def test_closed_gate_delays_until_reopen(self) -> None:
+        gate = RateGate()
+        gate.close_for(0.05)
+        assert await gate.wait() > 0.04
+        assert await gate.wait() == 0.0
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_closes_shared_gate(self) -> None:
+        gate = RateGate()
+        api_call = AsyncMock(side_effect=[_make_rate_limit_error("3"), "ok"])
+        other_call = AsyncMock(return_value="ok")
+        with patch("hadron.agent.rate_limiter.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            await call_with_retry(api_call, label="first", gate=gate)
+            mock_sleep.reset_mock()
+            result = await call_with_retry(other_call, label="second", gate=gate)
+        assert result.throttle_seconds > 2.5  # held back by the first caller's 429
+        mock_sleep.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_server_error_does_not_close_gate(self) -> None:
+        gate = RateGate()
+        error = anthropic.InternalServerError(
+            message="boom", response=MagicMock(status_code=500, headers={}), body=None,
+        )
+        api_call = AsyncMock(side_effect=[error, "ok"])
+        with patch("hadron.agent.rate_limiter.asyncio.sleep", new_callable=AsyncMock):
+            await call_with_retry(api_call, label="t", gate=gate)
+        assert await gate.wait() == 0.0
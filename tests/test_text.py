@@ -0,0 +1,40 @@
+"""Tests for the text truncation helpers."""
+
+from __future__ import annotations
+
+import json
+
+from hadron.utils.text import json_preview, squeeze_output, truncate
+
+
+class TestTruncate:
+    def test_short_text_unchanged(self) -> None:
+        assert truncate("abc", 5) == "abc"
+
+    def test_long_text_gets_suffix(self) -> None:
+        assert truncate("abcdef", 3) == "abc\n... (truncated)"
+
+
+class TestJsonPreview:
+    def test_matches_full_dump_prefix(self) -> None:
+        data = {"path": "a.py", "content": 'x"y\n' * 1000, "n": 3}
+        assert json_preview(data) == json.dumps(data)[:200]
+
+    def test_small_input_not_cut(self) -> None:
+        assert json_preview({"path": "a.py"}) == '{"path": "a.py"}'
+
+
+class TestSqueezeOutput:
+    def test_strips_ansi_colors(self) -> None:
+        assert squeeze_output("\x1b[32mPASSED\x1b[0m") == "PASSED"
+
+    def test_collapses_blank_line_runs(self) -> None:
+        assert squeeze_output("a\n\n\n\n\nb") == "a\n\nb"
+
+    def test_collapses_repeated_lines(self) -> None:
+        assert squeeze_output("x\nwarn\nwarn\nwarn\nwarn\ny") == (
+            "x\nwarn\n... (previous line repeated 3 more times)\ny"
+        )
+
+    def test_keeps_pairs_and_plain_text(self) -> None:
+        assert squeeze_output("a\na\nb\n") == "a\na\nb\n"
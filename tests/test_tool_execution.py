@@ -5,9 +5,12 @@ from __future__ import annotations
 import asyncio
 import sys
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
+from hadron.agent.tool_loop import ToolResultCache, _EventEmitter, execute_tool_uses
 from hadron.agent.tools import execute_tool as _execute_tool, safe_resolve as _safe_resolve, scrubbed_env as _scrubbed_env
 
 
@@ -52,6 +55,15 @@ class TestSafeResolve:
         resolved = _safe_resolve(str(tmp_workdir), "subdir/../hello.txt")
         assert resolved == tmp_workdir / "hello.txt"
 
+    def test_relative_workdir_follows_cwd(self, tmp_workdir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A relative working_dir is not memoized across directory changes."""
+        (tmp_workdir / "a" / "ws").mkdir(parents=True)
+        (tmp_workdir / "b" / "ws").mkdir(parents=True)
+        monkeypatch.chdir(tmp_workdir / "a")
+        assert _safe_resolve("ws", "f.txt") == tmp_workdir / "a" / "ws" / "f.txt"
+        monkeypatch.chdir(tmp_workdir / "b")
+        assert _safe_resolve("ws", "f.txt") == tmp_workdir / "b" / "ws" / "f.txt"
+
 
 # ---------------------------------------------------------------------------
 # _execute_tool — read_file
@@ -118,6 +130,13 @@ class TestWriteFile:
         )
         assert "Path escapes working directory" in result
 
+    @pytest.mark.asyncio
+    async def test_write_runs_off_event_loop(self, tmp_workdir: Path) -> None:
+        with patch("hadron.agent.tools.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            await _execute_tool("write_file", {"path": "t.txt", "content": "x"}, str(tmp_workdir))
+        to_thread.assert_called_once()
+        assert (tmp_workdir / "t.txt").read_text() == "x"
+
 
 # ---------------------------------------------------------------------------
 # _execute_tool — delete_file
@@ -168,6 +187,18 @@ class TestListDirectory:
         )
         assert "nested.txt" in result
 
+    @pytest.mark.asyncio
+    async def test_large_directory_lists_first_200_sorted(self, tmp_workdir: Path) -> None:
+        big = tmp_workdir / "big"
+        big.mkdir()
+        for i in range(250, 0, -1):
+            (big / f"f{i:03d}.txt").touch()
+        result = await _execute_tool("list_directory", {"path": "big"}, str(tmp_workdir))
+        lines = result.splitlines()
+        assert len(lines) == 200
+        assert lines[0] == "f f001.txt"
+        assert lines[-1] == "f f200.txt"
+
     @pytest.mark.asyncio
     async def test_list_traversal_blocked(self, tmp_workdir: Path) -> None:
         result = await _execute_tool(
@@ -197,21 +228,35 @@ class TestRunCommand:
         assert "Exit code: 0" in result
         assert "hello" in result
 
+    @pytest.mark.asyncio
+    async def test_large_output_truncated_with_real_exit_code(self, tmp_workdir: Path) -> None:
+        (tmp_workdir / "big.txt").write_text("y" * 500_000)
+        result = await _execute_tool(
+            "run_command", {"command": "cat big.txt missing.txt"}, str(tmp_workdir)
+        )
+        assert result.startswith("Exit code: 1")
+        assert len(result) < 60_000
+        assert result.endswith("(truncated)")
+
     @pytest.mark.asyncio
     async def test_run_command_timeout_kills_process(self, tmp_workdir: Path) -> None:
         """A long-running command should be killed on timeout, not leak a zombie."""
         from unittest.mock import patch
 
+        def _time_out(aw, timeout):
+            aw.close()
+            raise asyncio.TimeoutError
+
         # Use a very short timeout to trigger it in tests
-        with patch("hadron.agent.tools.asyncio.wait_for", side_effect=asyncio.TimeoutError):
-            # We need to also mock create_subprocess_shell to give us a controllable process
+        with patch("hadron.agent.tools.asyncio.wait_for", side_effect=_time_out):
+            # We need to also mock create_subprocess_exec to give us a controllable process
             from unittest.mock import AsyncMock, MagicMock
 
             mock_proc = MagicMock()
             mock_proc.kill = MagicMock()
             mock_proc.wait = AsyncMock()
 
-            with patch("hadron.agent.tools.asyncio.create_subprocess_shell", return_value=mock_proc):
+            with patch("hadron.agent.tools.asyncio.create_subprocess_exec", return_value=mock_proc):
                 result = await _execute_tool(
                     "run_command", {"command": "sleep 999"}, str(tmp_workdir)
                 )
@@ -220,6 +265,20 @@ class TestRunCommand:
             mock_proc.kill.assert_called_once()
             mock_proc.wait.assert_awaited_once()
 
+    @pytest.mark.asyncio
+    async def test_plain_command_skips_shell(self, tmp_workdir: Path) -> None:
+        with patch("hadron.agent.tools.asyncio.create_subprocess_shell") as mock_shell:
+            result = await _execute_tool("run_command", {"command": "ls -a"}, str(tmp_workdir))
+        mock_shell.assert_not_called()
+        assert "hello.txt" in result
+
+    @pytest.mark.asyncio
+    async def test_shell_syntax_uses_shell(self, tmp_workdir: Path) -> None:
+        result = await _execute_tool(
+            "run_command", {"command": "ls *.txt"}, str(tmp_workdir)
+        )
+        assert "hello.txt" in result
+
 
 # ---------------------------------------------------------------------------
 # _execute_tool — run_command env scrubbing
@@ -289,12 +348,13 @@ class TestRunCommandEnvScrubbing:
         venv_bin.mkdir(parents=True)
 
         mock_proc = MagicMock()
-        mock_proc.communicate = AsyncMock(return_value=(b"ok\n", None))
+        mock_proc.stdout.read = AsyncMock(side_effect=[b"ok\n", b""])
+        mock_proc.wait = AsyncMock()
         mock_proc.returncode = 0
 
-        with patch("hadron.agent.tools.asyncio.create_subprocess_shell", return_value=mock_proc) as mock_shell:
+        with patch("hadron.agent.tools.asyncio.create_subprocess_exec", return_value=mock_proc) as mock_exec:
             await _execute_tool("run_command", {"command": "echo hello"}, str(tmp_workdir))
-            env_passed = mock_shell.call_args.kwargs["env"]
+            env_passed = mock_exec.call_args.kwargs["env"]
             assert str(venv_bin) in env_passed["PATH"]
             assert env_passed["VIRTUAL_ENV"] == str(tmp_workdir / ".venv")
 
@@ -304,15 +364,16 @@ class TestRunCommandEnvScrubbing:
         from unittest.mock import AsyncMock, MagicMock, patch
 
         mock_proc = MagicMock()
-        mock_proc.communicate = AsyncMock(return_value=(b"ok\n", None))
+        mock_proc.stdout.read = AsyncMock(side_effect=[b"ok\n", b""])
+        mock_proc.wait = AsyncMock()
         mock_proc.returncode = 0
 
         with (
             patch("hadron.agent.tools.find_worktree_venv", return_value=None),
-            patch("hadron.agent.tools.asyncio.create_subprocess_shell", return_value=mock_proc) as mock_shell,
+            patch("hadron.agent.tools.asyncio.create_subprocess_exec", return_value=mock_proc) as mock_exec,
         ):
             await _execute_tool("run_command", {"command": "echo hello"}, str(tmp_workdir))
-            env_passed = mock_shell.call_args.kwargs["env"]
+            env_passed = mock_exec.call_args.kwargs["env"]
             # VIRTUAL_ENV may exist from the outer env, but should not point to tmp_workdir
             if "VIRTUAL_ENV" in env_passed:
                 assert str(tmp_workdir) not in env_passed["VIRTUAL_ENV"]
@@ -330,6 +391,114 @@ class TestUnknownTool:
         assert "Unknown tool" in result
 
 
+class TestExecuteToolUses:
+    @staticmethod
+    def _tu(name: str, **tool_input: str) -> SimpleNamespace:
+        return SimpleNamespace(name=name, input=tool_input)
+
+    async def test_results_in_call_order(self, tmp_workdir: Path) -> None:
+        (tmp_workdir / "a.txt").write_text("A")
+        (tmp_workdir / "b.txt").write_text("B")
+        results = await execute_tool_uses([
+            self._tu("read_file", path="a.txt"),
+            self._tu("list_directory", path="."),
+            self._tu("read_file", path="b.txt"),
+        ], str(tmp_workdir))
+        assert results[0] == "A"
+        assert "f a.txt" in results[1]
+        assert results[2] == "B"
+
+    async def test_write_is_a_barrier_for_later_reads(self, tmp_workdir: Path) -> None:
+        results = await execute_tool_uses([
+            self._tu("read_file", path="new.txt"),
+            self._tu("write_file", path="new.txt", content="fresh"),
+            self._tu("read_file", path="new.txt"),
+        ], str(tmp_workdir))
+        assert "File not found" in results[0]
+        assert results[2] == "fresh"
+
+    async def test_read_only_calls_run_in_threads(self, tmp_workdir: Path) -> None:
+        (tmp_workdir / "a.txt").write_text("A")
+        with patch("hadron.agent.tools.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            await execute_tool_uses([
+                self._tu("read_file", path="a.txt"), self._tu("read_file", path="a.txt"),
+            ], str(tmp_workdir))
+        assert to_thread.call_count == 2
+
+    async def test_cache_serves_repeated_reads(self, tmp_workdir: Path) -> None:
+        (tmp_workdir / "a.txt").write_text("A")
+        cache = ToolResultCache()
+        await execute_tool_uses([self._tu("read_file", path="a.txt")], str(tmp_workdir), cache=cache)
+        (tmp_workdir / "a.txt").write_text("changed behind the cache")
+        results = await execute_tool_uses([self._tu("read_file", path="a.txt")], str(tmp_workdir), cache=cache)
+        assert results == ["A"]
+        assert cache.stats == {"hits": 1, "misses": 1}
+
+    async def test_cache_cleared_by_mutating_tool(self, tmp_workdir: Path) -> None:
+        (tmp_workdir / "a.txt").write_text("A")
+        cache = ToolResultCache()
+        results = await execute_tool_uses([
+            self._tu("read_file", path="a.txt"),
+            self._tu("write_file", path="a.txt", content="B"),
+            self._tu("read_file", path="a.txt"),
+        ], str(tmp_workdir), cache=cache)
+        assert results[0] == "A"
+        assert results[2] == "B"
+
+
+class TestEventEmitter:
+    async def test_emit_does_not_wait_for_handler(self) -> None:
+        release = asyncio.Event()
+        seen: list[str] = []
+
+        async def handler(event_type: str, data: dict) -> None:
+            await release.wait()
+            seen.append(event_type)
+
+        events = _EventEmitter(handler)
+        await events.emit("tool_call", {})
+        await events.emit("tool_result", {})
+        assert seen == []
+
+        release.set()
+        await events.aclose()
+        assert seen == ["tool_call", "tool_result"]
+
+    async def test_full_queue_applies_backpressure(self) -> None:
+        release = asyncio.Event()
+        seen: list[int] = []
+
+        async def handler(event_type: str, data: dict) -> None:
+            await release.wait()
+            seen.append(data["n"])
+
+        events = _EventEmitter(handler, max_pending=2)
+        for n in range(3):
+            await events.emit("output", {"n": n})
+        blocked = asyncio.create_task(events.emit("output", {"n": 3}))
+        await asyncio.sleep(0)
+        assert not blocked.done()
+
+        release.set()
+        await blocked
+        await events.aclose()
+        assert seen == [0, 1, 2, 3]
+
+    async def test_handler_failure_does_not_propagate(self) -> None:
+        seen: list[str] = []
+
+        async def handler(event_type: str, data: dict) -> None:
+            if event_type == "bad":
+                raise RuntimeError("boom")
+            seen.append(event_type)
+
+        events = _EventEmitter(handler)
+        await events.emit("bad", {})
+        await events.emit("good", {})
+        await events.aclose()
+        assert seen == ["good"]
+
+
 # ---------------------------------------------------------------------------
 # Agent command allowlist (_validate_agent_command)
 # ---------------------------------------------------------------------------
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from hadron.agent.tool_loop import cacheable_messages, cacheable_tools
 from hadron.agent.tools import make_tools, make_tools_openai, make_tools_gemini
 
 
@@ -10,7 +11,7 @@ ALLOWED = ["read_file", "write_file", "list_directory", "run_command", "delete_f
 
 class TestMakeToolsOpenAI:
     def test_returns_function_type_wrapper(self) -> None:
-        tools = make_tools_openai(ALLOWED, "/tmp")
+        tools = make_tools_openai(ALLOWED)
         assert len(tools) == 5
         for t in tools:
             assert t["type"] == "function"
@@ -21,30 +22,30 @@ class TestMakeToolsOpenAI:
             assert "parameters" in fn
 
     def test_names_match_anthropic(self) -> None:
-        anthropic_tools = make_tools(ALLOWED, "/tmp")
-        openai_tools = make_tools_openai(ALLOWED, "/tmp")
+        anthropic_tools = make_tools(ALLOWED)
+        openai_tools = make_tools_openai(ALLOWED)
         anthropic_names = {t["name"] for t in anthropic_tools}
         openai_names = {t["function"]["name"] for t in openai_tools}
         assert anthropic_names == openai_names
 
     def test_parameters_match_input_schema(self) -> None:
-        anthropic_tools = make_tools(ALLOWED, "/tmp")
-        openai_tools = make_tools_openai(ALLOWED, "/tmp")
+        anthropic_tools = make_tools(ALLOWED)
+        openai_tools = make_tools_openai(ALLOWED)
         for at, ot in zip(anthropic_tools, openai_tools):
             assert ot["function"]["parameters"] == at["input_schema"]
 
     def test_unknown_tool_skipped(self) -> None:
-        tools = make_tools_openai(["read_file", "nonexistent"], "/tmp")
+        tools = make_tools_openai(["read_file", "nonexistent"])
         assert len(tools) == 1
         assert tools[0]["function"]["name"] == "read_file"
 
     def test_empty_allowed(self) -> None:
-        assert make_tools_openai([], "/tmp") == []
+        assert make_tools_openai([]) == []
 
 
 class TestMakeToolsGemini:
     def test_returns_flat_declarations(self) -> None:
-        tools = make_tools_gemini(ALLOWED, "/tmp")
+        tools = make_tools_gemini(ALLOWED)
         assert len(tools) == 5
         for t in tools:
             assert "name" in t
@@ -54,21 +55,78 @@ class TestMakeToolsGemini:
             assert "type" not in t
 
     def test_names_match_anthropic(self) -> None:
-        anthropic_tools = make_tools(ALLOWED, "/tmp")
-        gemini_tools = make_tools_gemini(ALLOWED, "/tmp")
+        anthropic_tools = make_tools(ALLOWED)
+        gemini_tools = make_tools_gemini(ALLOWED)
         anthropic_names = {t["name"] for t in anthropic_tools}
         gemini_names = {t["name"] for t in gemini_tools}
         assert anthropic_names == gemini_names
 
     def test_parameters_match_input_schema(self) -> None:
-        anthropic_tools = make_tools(ALLOWED, "/tmp")
-        gemini_tools = make_tools_gemini(ALLOWED, "/tmp")
+        anthropic_tools = make_tools(ALLOWED)
+        gemini_tools = make_tools_gemini(ALLOWED)
         for at, gt in zip(anthropic_tools, gemini_tools):
             assert gt["parameters"] == at["input_schema"]
 
     def test_unknown_tool_skipped(self) -> None:
-        tools = make_tools_gemini(["read_file", "nonexistent"], "/tmp")
+        tools = make_tools_gemini(["read_file", "nonexistent"])
         assert len(tools) == 1
 
     def test_empty_allowed(self) -> None:
-        assert make_tools_gemini([], "/tmp") == []
+        assert make_tools_gemini([]) == []
+
+
+class TestMakeTools:
+    def test_memoized_per_tool_set(self) -> None:
+        assert make_tools(ALLOWED) is make_tools(list(ALLOWED))
+
+    def test_unknown_tools_skipped(self) -> None:
+        assert [t["name"] for t in make_tools(["read_file", "nonexistent"])] == ["read_file"]
+
+    def test_provider_formats_share_definitions(self) -> None:
+        first, second = make_tools_openai(ALLOWED), make_tools_openai(ALLOWED)
+        assert first is not second
+        assert first[0] is second[0]
+        assert make_tools_gemini(ALLOWED)[0] is make_tools_gemini(ALLOWED)[0]
+
+
+class TestCacheableTools:
+    def test_builtin_tool_set_prepared_once(self) -> None:
+        first = cacheable_tools(make_tools(ALLOWED))
+        second = cacheable_tools(make_tools(ALLOWED))
+        assert first is second
+        assert first[-1]["cache_control"] == {"type": "ephemeral"}
+
+    def test_builtin_defs_not_mutated(self) -> None:
+        cacheable_tools(make_tools(ALLOWED))
+        assert all("cache_control" not in t for t in make_tools(ALLOWED))
+
+    def test_custom_tools_marked(self) -> None:
+        custom = [{"name": "custom", "description": "x", "input_schema": {}}]
+        result = cacheable_tools(custom)
+        assert result[-1]["cache_control"] == {"type": "ephemeral"}
+        assert "cache_control" not in custom[0]
+
+
+class TestCacheableMessages:
+    def test_string_prompt_wrapped_and_marked(self) -> None:
+        messages = [{"role": "user", "content": "Do the thing."}]
+        result = cacheable_messages(messages)
+        assert result[0]["content"] == [
+            {"type": "text", "text": "Do the thing.", "cache_control": {"type": "ephemeral"}},
+        ]
+        assert messages[0]["content"] == "Do the thing."
+
+    def test_only_last_block_of_last_turn_marked(self) -> None:
+        messages = [
+            {"role": "user", "content": "task"},
+            {"role": "assistant", "content": [{"type": "text", "text": "ok"}]},
+            {"role": "user", "content": [
+                {"type": "tool_result", "tool_use_id": "a", "content": "1"},
+                {"type": "tool_result", "tool_use_id": "b", "content": "2"},
+            ]},
+        ]
+        result = cacheable_messages(messages)
+        assert result[0] is messages[0]
+        assert "cache_control" not in result[2]["content"][0]
+        assert result[2]["content"][1]["cache_control"] == {"type": "ephemeral"}
+        assert "cache_control" not in messages[2]["content"][1]